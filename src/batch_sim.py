@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""批量模拟模块。
+
+本模块在一个进程中同时模拟 N 局互相独立的游戏。所有对局的状态保存在
+共享的 NumPy 数组中（第一维是对局编号），每个逻辑帧对全部对局只执行一组
+数组运算，避免逐局调用 Game.update_game 的 Python 开销。
+
+游戏规则与 Game.update_game 一致，按相同的顺序执行：
+    1. 模拟时钟前进一帧，玩家按动作移动，检查道具效果是否过期（Player.update）
+    2. 自动射击（Player.shoot，含双发子弹）
+    3. 按概率生成敌机（Game.spawn_enemies）
+    4. 推进子弹并移除飞出屏幕的子弹（BulletPool.update）
+    5. 推进敌机；飞出屏幕的敌机扣血，其余敌机按概率射击（Enemy.update、Enemy.can_shoot）
+    6. 推进道具（ItemManager.update）
+    7. 碰撞：玩家子弹-敌机（每颗子弹命中第一个存活敌机，见 collision.first_hits）、
+       敌机子弹-玩家、敌机-玩家（各只处理第一个），护盾优先抵挡伤害
+    8. 拾取道具，生命值归零时游戏结束
+
+实体池（子弹、敌机、道具）在每局内按生成顺序紧凑存放，与 BulletPool 和
+EntityList 的顺序一致，因此“第一个命中”的判定与单局游戏相同。
+
+随机数来自一个 numpy.random.Generator，所有对局共用，因此结果不与
+Game 逐位一致，只保证规则和概率分布一致；相同种子和相同动作序列总能
+复现同样的批量结果。游戏结束的对局在同一步内自动重置。
+
+模拟参数来自运行时配置（见 game_config.py），所有对局共用一个配置；
+按敌机类型索引的属性表在切换配置时生成一次。
+
+典型用法示例:
+    sim = BatchSimulator(256, seed=1)
+    actions = np.zeros(256, dtype=np.int64)
+    for _ in range(10000):
+        rewards, dones, info = sim.step(actions)
+        finished = info["episode_score"][dones]
+"""
+
+import numpy as np
+import pygame
+from typing import Any, Dict, Optional, Tuple
+from config import FPS
+from collision import first_hits
+from game_config import GameConfig, DEFAULT_CONFIG
+from game_env import ACTION_KEYS
+
+# 敌机类型编号
+ENEMY_SMALL: int = 0
+ENEMY_MEDIUM: int = 1
+
+# 道具种类编号
+ITEM_NONE: int = 0
+ITEM_HEALTH: int = 1
+ITEM_POWER_UP: int = 2
+ITEM_SHIELD: int = 3
+
+# 与 player.Player 和 item.Item 中的数值一致
+PLAYER_START_HEALTH: int = 3
+PLAYER_MAX_HEALTH: int = 5
+ITEM_SIZE: int = 20
+ITEM_SPEED: int = 2
+ITEM_DROP_OFFSET: int = 20
+DOUBLE_SHOT_DURATION: float = 10.0
+SHIELD_DURATION: float = 30.0
+
+_ENEMY_NAMES: Tuple[str, ...] = ("small", "medium")  # 敌机类型编号 -> 配置中的类型名
+_DROP_CODES = {"health": ITEM_HEALTH, "power_up": ITEM_POWER_UP, "shield": ITEM_SHIELD}
+
+# 动作编号 -> 方向键（与 game_env.ACTION_KEYS 一致）
+_ACTION_LEFT = np.array([pygame.K_LEFT in keys for keys in ACTION_KEYS])
+_ACTION_RIGHT = np.array([pygame.K_RIGHT in keys for keys in ACTION_KEYS])
+_ACTION_UP = np.array([pygame.K_UP in keys for keys in ACTION_KEYS])
+_ACTION_DOWN = np.array([pygame.K_DOWN in keys for keys in ACTION_KEYS])
+
+_FAR: int = 1 << 30  # 计算包围盒时代替不存在实体的坐标
+
+
+class BatchPool:
+    """批量实体池类。
+
+    每个字段是形状为 (对局数, 容量) 的数组；每局的存活实体紧凑地存放在
+    前 count[i] 个位置，顺序与生成顺序一致。被标记为死亡的实体在 compact()
+    时一次性移除（所有对局一起压缩）。
+
+    Attributes:
+        fields (Tuple[str, ...]): 字段名称
+        capacity (int): 每局当前的容量（不足时按2倍扩容）
+        alive (numpy.ndarray): 存活标志，形状为 (对局数, 容量)
+        count (numpy.ndarray): 每局的实体数量（含已标记死亡但尚未压缩的实体）
+    """
+
+    def __init__(self, n_envs: int, capacity: int, fields: Tuple[str, ...]) -> None:
+        """初始化实体池。
+
+        Args:
+            n_envs (int): 对局数
+            capacity (int): 每局的初始容量
+            fields (Tuple[str, ...]): 字段名称，每个字段都是 int64 数组属性
+        """
+        self.fields: Tuple[str, ...] = fields
+        self.capacity: int = capacity
+        for name in fields:
+            setattr(self, name, np.zeros((n_envs, capacity), dtype=np.int64))
+        self.alive: np.ndarray = np.zeros((n_envs, capacity), dtype=bool)
+        self.count: np.ndarray = np.zeros(n_envs, dtype=np.int64)
+
+    def _reserve(self, needed: int) -> None:
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, self.capacity * 2)
+        for name in self.fields + ("alive",):
+            old = getattr(self, name)
+            new = np.zeros((old.shape[0], capacity), dtype=old.dtype)
+            new[:, :self.capacity] = old
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def width(self) -> int:
+        """获取所有对局中最大的实体数量（批量运算只需处理这么多列）。"""
+        return int(self.count.max()) if len(self.count) else 0
+
+    def append(self, envs: np.ndarray, **values: Any) -> None:
+        """在指定对局的池尾各追加一个实体。
+
+        Args:
+            envs (numpy.ndarray): 对局编号数组（不能重复）
+            **values: 各字段的值（标量或与 envs 等长的数组）
+        """
+        if len(envs) == 0:
+            return
+        index = self.count[envs]
+        self._reserve(int(index.max()) + 1)
+        for name, value in values.items():
+            getattr(self, name)[envs, index] = value
+        self.alive[envs, index] = True
+        self.count[envs] += 1
+
+    def append_mask(self, mask: np.ndarray, **values: np.ndarray) -> None:
+        """按掩码追加实体：mask[i, j] 为True时在第 i 局追加 values 的第 (i, j) 个值。
+
+        同一局内按 j 从小到大的顺序追加。
+
+        Args:
+            mask (numpy.ndarray): 形状为 (对局数, K) 的布尔数组
+            **values: 各字段的值，形状与 mask 相同
+        """
+        rows, cols = np.nonzero(mask)
+        if len(rows) == 0:
+            return
+        rank = np.cumsum(mask, axis=1)[rows, cols] - 1
+        index = self.count[rows] + rank
+        self._reserve(int(index.max()) + 1)
+        for name, value in values.items():
+            getattr(self, name)[rows, index] = value[rows, cols]
+        self.alive[rows, index] = True
+        self.count += np.count_nonzero(mask, axis=1)
+
+    def compact(self) -> None:
+        """移除所有已标记为死亡的实体，保持每局存活实体的相对顺序。"""
+        width = self.width()
+        alive = self.alive[:, :width]
+        counts = np.count_nonzero(alive, axis=1)
+        if (counts == self.count).all():
+            return
+
+        rows, cols = np.nonzero(alive)
+        starts = np.cumsum(counts) - counts
+        index = np.arange(len(rows)) - np.repeat(starts, counts)
+        for name in self.fields:
+            array = getattr(self, name)
+            array[rows, index] = array[rows, cols]
+        alive[:] = False
+        alive[rows, index] = True
+        self.count = counts
+
+    def clear(self, envs: np.ndarray) -> None:
+        """清空指定对局的实体池。
+
+        Args:
+            envs (numpy.ndarray): 对局编号数组
+        """
+        self.alive[envs] = False
+        self.count[envs] = 0
+
+
+class BatchSimulator:
+    """批量模拟器类，同时推进 N 局独立的游戏（无窗口、无音频）。
+
+    Attributes:
+        n_envs (int): 对局数
+        hit_penalty (float): 每损失1点生命值扣除的奖励（与 PlaneWarsEnv 一致）
+        player_x, player_y (numpy.ndarray): 玩家位置
+        health, lives (numpy.ndarray): 玩家生命值
+        double_shot, shield (numpy.ndarray): 道具效果是否激活
+        ticks (numpy.ndarray): 每局已模拟的逻辑帧数
+        score (numpy.ndarray): 每局当前分数
+        kills_small, kills_medium, items_collected (numpy.ndarray): 每局的击杀和拾取统计
+        player_bullets, enemy_bullets (BatchPool): 子弹池（字段 x、y）
+        enemies (BatchPool): 敌机池（字段 x、y、type、hp）
+        items (BatchPool): 道具池（字段 x、y、kind）
+        episodes (int): 已结束的对局总数
+        config (GameConfig): 所有对局共用的运行时配置
+    """
+
+    def __init__(self, n_envs: int, seed: Optional[int] = None, hit_penalty: float = 10.0,
+                 config: Optional[GameConfig] = None) -> None:
+        """初始化批量模拟器，所有对局从初始状态开始。
+
+        Args:
+            n_envs (int): 对局数
+            seed (Optional[int]): 随机种子
+            hit_penalty (float): 每损失1点生命值扣除的奖励
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
+        """
+        self._configure(config if config is not None else DEFAULT_CONFIG)
+        self.n_envs: int = n_envs
+        self.hit_penalty: float = hit_penalty
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.step_time: float = 1.0 / FPS
+
+        def zeros(dtype=np.int64) -> np.ndarray:
+            return np.zeros(n_envs, dtype=dtype)
+
+        self.player_x, self.player_y = zeros(), zeros()
+        self.health, self.lives = zeros(), zeros()
+        self.double_shot, self.shield = zeros(bool), zeros(bool)
+        self.double_shot_end, self.shield_end = zeros(np.float64), zeros(np.float64)
+        self.last_bullet_time = zeros(np.float64)
+        self.ticks, self.score = zeros(), zeros()
+        self.kills_small, self.kills_medium, self.items_collected = zeros(), zeros(), zeros()
+
+        self.player_bullets = BatchPool(n_envs, 128, ("x", "y"))
+        self.enemy_bullets = BatchPool(n_envs, 32, ("x", "y"))
+        self.enemies = BatchPool(n_envs, 16, ("x", "y", "type", "hp"))
+        self.items = BatchPool(n_envs, 8, ("x", "y", "kind"))
+
+        # 每步返回的数组（原地复用）
+        self.rewards: np.ndarray = np.zeros(n_envs, dtype=np.float32)
+        self.dones: np.ndarray = zeros(bool)
+        self.info: Dict[str, np.ndarray] = {
+            "episode_score": zeros(),
+            "episode_ticks": zeros(),
+            "kills_small": zeros(),
+            "kills_medium": zeros(),
+            "items_collected": zeros(),
+        }
+        self.episodes: int = 0
+
+        self.reset()
+
+    def _configure(self, config: GameConfig) -> None:
+        """按运行时配置生成按敌机类型编号索引的属性表和道具掉落表。"""
+        self.config: GameConfig = config
+        stats = [config.enemy_types[name] for name in _ENEMY_NAMES]
+
+        def table(key: str, dtype=np.int64) -> np.ndarray:
+            return np.array([entry[key] for entry in stats], dtype=dtype)
+
+        self._enemy_width = table("width")
+        self._enemy_height = table("height")
+        self._enemy_speed = table("speed")
+        self._enemy_hp = table("hp")
+        self._enemy_score = table("score")
+        self._enemy_bullet_rate = table("bullet_rate", np.float64)
+        self._enemy_max_x = table("max_x")
+        self._enemy_bullet_dx = np.array([entry["bullet_offset"][0] for entry in stats], dtype=np.int64)
+        self._enemy_bullet_dy = np.array([entry["bullet_offset"][1] for entry in stats], dtype=np.int64)
+
+        # 道具掉落表：每行为一种敌机类型，依次是各项的累计概率阈值和道具种类编号，
+        # 不足的列用阈值0补齐（永远不会满足）
+        tables = config.ITEM_DROP_TABLES
+        width = max([1] + [len(entries) for entries in tables.values()])
+        self._drop_thresholds = np.zeros((len(_ENEMY_NAMES), width))
+        self._drop_kinds = np.zeros((len(_ENEMY_NAMES), width), dtype=np.int64)
+        for row, name in enumerate(_ENEMY_NAMES):
+            for col, (threshold, kind) in enumerate(tables.get(name, ())):
+                self._drop_thresholds[row, col] = threshold
+                self._drop_kinds[row, col] = _DROP_CODES[kind]
+
+    def set_config(self, config: GameConfig) -> None:
+        """切换运行时配置，所有对局从初始状态重新开始（已结束的对局数不变）。
+
+        Args:
+            config (GameConfig): 新配置
+        """
+        self._configure(config)
+        self.reset()
+
+    def reset(self, envs: Optional[np.ndarray] = None) -> None:
+        """把指定对局（默认全部）重置到初始状态。
+
+        Args:
+            envs (Optional[numpy.ndarray]): 对局编号数组
+        """
+        if envs is None:
+            envs = np.arange(self.n_envs)
+        self.player_x[envs], self.player_y[envs] = self.config.player_start
+        self.health[envs] = PLAYER_START_HEALTH
+        self.lives[envs] = self.config.PLAYER_INITIAL_LIVES
+        self.double_shot[envs] = False
+        self.shield[envs] = False
+        self.double_shot_end[envs] = 0.0
+        self.shield_end[envs] = 0.0
+        self.last_bullet_time[envs] = 0.0
+        self.ticks[envs] = 0
+        self.score[envs] = 0
+        self.kills_small[envs] = 0
+        self.kills_medium[envs] = 0
+        self.items_collected[envs] = 0
+        for pool in (self.player_bullets, self.enemy_bullets, self.enemies, self.items):
+            pool.clear(envs)
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """所有对局各推进一个逻辑帧。
+
+        Args:
+            actions (numpy.ndarray): 每局的动作编号（见 game_env.ACTION_KEYS）
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, Dict[str, numpy.ndarray]]:
+                (奖励, 是否结束, 信息)。信息中的数组只在对应对局本步结束时有效，
+                记录该局的最终分数、帧数、击杀和拾取统计；结束的对局已自动重置。
+                返回的数组每步复用。
+        """
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+        health_before = self.health.copy()
+
+        now = self._update_player(actions)
+        if self.config.AUTO_FIRE:
+            self._player_shoot(now)
+        self._spawn_enemies()
+        self._update_bullets()
+        self._update_enemies()
+        self._update_items()
+        self._check_player_bullet_enemy_collision()
+        self._check_enemy_bullet_player_collision()
+        self._check_enemy_player_collision()
+        self._check_item_collisions(now)
+
+        rewards = self.rewards
+        np.subtract(self.score, score_before, out=rewards, casting="unsafe")
+        lost = np.maximum(health_before - self.health, 0)
+        rewards -= self.hit_penalty * lost
+
+        dones = self.dones
+        np.logical_or(self.health <= 0, self.lives <= 0, out=dones)
+        finished = np.flatnonzero(dones)
+        if len(finished):
+            info = self.info
+            info["episode_score"][finished] = self.score[finished]
+            info["episode_ticks"][finished] = self.ticks[finished]
+            info["kills_small"][finished] = self.kills_small[finished]
+            info["kills_medium"][finished] = self.kills_medium[finished]
+            info["items_collected"][finished] = self.items_collected[finished]
+            self.episodes += len(finished)
+            self.reset(finished)
+        return rewards, dones, self.info
+
+    # -------------------------------------------------------------------------
+    # 各阶段（与 Game.update_game 的顺序一致）
+    # -------------------------------------------------------------------------
+
+    def _take_damage(self, hits: np.ndarray) -> None:
+        """每局受到 hits 次伤害：护盾先抵挡一次，其余每次扣1点生命值（Player.take_damage）。"""
+        absorbed = self.shield & (hits > 0)
+        self.shield &= ~absorbed
+        damage = hits - absorbed
+        self.health -= damage
+        self.lives -= damage
+
+    def _update_player(self, actions: np.ndarray) -> np.ndarray:
+        """模拟时钟前进一帧，移动玩家并检查道具效果是否过期。返回当前模拟时间。"""
+        self.ticks += 1
+        now = self.ticks * self.step_time
+
+        config = self.config
+        speed = config.PLAYER_SPEED
+        x, y = self.player_x, self.player_y
+        x -= np.where(_ACTION_LEFT[actions] & (x > 0), speed, 0)
+        x += np.where(_ACTION_RIGHT[actions] & (x < config.player_max_x), speed, 0)
+        y -= np.where(_ACTION_UP[actions] & (y > 0), speed, 0)
+        y += np.where(_ACTION_DOWN[actions] & (y < config.player_max_y), speed, 0)
+
+        self.double_shot &= now < self.double_shot_end
+        self.shield &= now < self.shield_end
+        return now
+
+    def _player_shoot(self, now: np.ndarray) -> None:
+        """自动射击：冷却结束的对局发射一发（双发效果时两发）子弹。"""
+        can_shoot = now - self.last_bullet_time >= self.config.BULLET_COOLDOWN
+        self.last_bullet_time[can_shoot] = now[can_shoot]
+
+        single = np.flatnonzero(can_shoot & ~self.double_shot)
+        double = np.flatnonzero(can_shoot & self.double_shot)
+        left, right = self.config.double_bullet_offsets
+        x = self.player_x
+        pool = self.player_bullets
+        # 与 Player.shoot 相同的顺序：单发，或先左后右的双发
+        pool.append(single, x=x[single] + self.config.bullet_offset, y=self.player_y[single])
+        pool.append(double, x=x[double] + left, y=self.player_y[double])
+        pool.append(double, x=x[double] + right, y=self.player_y[double])
+
+    def _spawn_enemies(self) -> None:
+        """按概率生成敌机（70% 小型），从屏幕上方进入。"""
+        rng = self.rng
+        n = self.n_envs
+        spawn = np.flatnonzero(rng.random(n) < self.config.ENEMY_SPAWN_RATE)
+        if len(spawn) == 0:
+            return
+        kind = np.where(rng.random(len(spawn)) < 0.7, ENEMY_SMALL, ENEMY_MEDIUM)
+        x = rng.integers(0, self._enemy_max_x[kind] + 1)
+        self.enemies.append(spawn, x=x, y=-50, type=kind, hp=self._enemy_hp[kind])
+
+    def _update_bullets(self) -> None:
+        """推进两个子弹池并移除飞出屏幕的子弹。"""
+        config = self.config
+        for pool, speed in ((self.player_bullets, -config.PLAYER_BULLET_SPEED),
+                            (self.enemy_bullets, config.ENEMY_BULLET_SPEED)):
+            width = pool.width()
+            if width == 0:
+                continue
+            y = pool.y[:, :width]
+            y += speed
+            pool.alive[:, :width] &= (y >= -config.BULLET_HEIGHT) & (y <= config.SCREEN_HEIGHT)
+            pool.compact()
+
+    def _update_enemies(self) -> None:
+        """推进敌机：飞出屏幕的敌机使玩家受伤，其余敌机按概率射击。"""
+        pool = self.enemies
+        width = pool.width()
+        if width == 0:
+            return
+        alive = pool.alive[:, :width]
+        kind = pool.type[:, :width]
+        x = pool.x[:, :width]
+        y = pool.y[:, :width]
+        y += np.where(alive, self._enemy_speed[kind], 0)
+
+        escaped = alive & (y > self.config.SCREEN_HEIGHT)
+        alive &= ~escaped
+        self._take_damage(np.count_nonzero(escaped, axis=1))
+
+        shoots = alive & (self.rng.random(alive.shape) < self._enemy_bullet_rate[kind])
+        self.enemy_bullets.append_mask(
+            shoots,
+            x=x + self._enemy_bullet_dx[kind],
+            y=y + self._enemy_bullet_dy[kind],
+        )
+        pool.compact()
+
+    def _update_items(self) -> None:
+        """推进道具并移除落出屏幕的道具。"""
+        pool = self.items
+        width = pool.width()
+        if width == 0:
+            return
+        y = pool.y[:, :width]
+        y += ITEM_SPEED
+        pool.alive[:, :width] &= y <= self.config.SCREEN_HEIGHT
+        pool.compact()
+
+    def _check_player_bullet_enemy_collision(self) -> None:
+        """玩家子弹与敌机的碰撞：每颗子弹命中第一个存活敌机，击毁时得分并掉落道具。"""
+        bullets, enemies = self.player_bullets, self.enemies
+        nb, ne = bullets.width(), enemies.width()
+        if nb == 0 or ne == 0:
+            return
+
+        alive = enemies.alive[:, :ne]
+        kind = enemies.type[:, :ne]
+        ex = enemies.x[:, :ne]
+        ey = enemies.y[:, :ne]
+        ew = self._enemy_width[kind]
+        eh = self._enemy_height[kind]
+        bw, bh = self.config.BULLET_WIDTH, self.config.BULLET_HEIGHT
+
+        # 先用每局敌机的包围盒筛掉不可能命中的子弹，只对剩下的子弹计算相交矩阵
+        left = np.where(alive, ex, _FAR).min(axis=1)[:, None]
+        right = np.where(alive, ex + ew, -_FAR).max(axis=1)[:, None]
+        top = np.where(alive, ey, _FAR).min(axis=1)[:, None]
+        bottom = np.where(alive, ey + eh, -_FAR).max(axis=1)[:, None]
+        bx = bullets.x[:, :nb]
+        by = bullets.y[:, :nb]
+        candidates = (bullets.alive[:, :nb] & (bx < right) & (left < bx + bw) &
+                      (by < bottom) & (top < by + bh))
+        rows, cols = np.nonzero(candidates)
+        if len(rows) == 0:
+            return
+
+        # 每个候选子弹一行：(候选数, 敌机数)，行按对局、再按子弹顺序排列
+        cx = bx[rows, cols][:, None]
+        cy = by[rows, cols][:, None]
+        overlap = ((cx < ex[rows] + ew[rows]) & (ex[rows] < cx + bw) &
+                   (cy < ey[rows] + eh[rows]) & (ey[rows] < cy + bh) & alive[rows])
+        hit = overlap.any(axis=1)
+        if not hit.any():
+            return
+        rows, cols, overlap = rows[hit], cols[hit], overlap[hit]
+        first = overlap.argmax(axis=1)
+
+        # 绝大多数情况下没有敌机被超量命中，每颗子弹的第一个相交敌机就是结果；
+        # 出现超量命中的对局按子弹顺序逐个解析（与单局游戏相同）
+        hp = enemies.hp[:, :ne]
+        counts = np.zeros((self.n_envs, ne), dtype=np.int64)
+        np.add.at(counts, (rows, first), 1)
+        over = np.flatnonzero((counts > hp).any(axis=1))
+        if len(over):
+            for env in over.tolist():
+                selected = rows == env
+                first[selected] = first_hits(overlap[selected], hp[env])
+            hit = first >= 0
+            rows, cols, first = rows[hit], cols[hit], first[hit]
+
+        bullets.alive[rows, cols] = False
+        np.subtract.at(hp, (rows, first), 1)
+
+        destroyed = enemies.alive[:, :ne] & (hp <= 0)
+        if destroyed.any():
+            enemies.alive[:, :ne] &= ~destroyed
+            self.score += np.where(destroyed, self._enemy_score[kind], 0).sum(axis=1)
+            self.kills_small += np.count_nonzero(destroyed & (kind == ENEMY_SMALL), axis=1)
+            self.kills_medium += np.count_nonzero(destroyed & (kind == ENEMY_MEDIUM), axis=1)
+            self._spawn_items(destroyed, enemies.x[:, :ne], enemies.y[:, :ne], kind)
+            enemies.compact()
+        bullets.compact()
+
+    def _spawn_items(self, destroyed: np.ndarray, x: np.ndarray, y: np.ndarray,
+                     kind: np.ndarray) -> None:
+        """按掉落表在被击毁的敌机位置生成道具（ItemManager.spawn_item）。"""
+        rng = self.rng
+        offset = rng.integers(-ITEM_DROP_OFFSET, ITEM_DROP_OFFSET + 1, size=destroyed.shape)
+        spawn_x = np.clip(x + offset, 0, self.config.SCREEN_WIDTH - ITEM_SIZE)
+        roll = rng.random(destroyed.shape)
+        thresholds = self._drop_thresholds[kind]
+        kinds = self._drop_kinds[kind]
+        # 从后往前覆盖，最终得到第一个满足的阈值对应的道具
+        item_kind = np.full(destroyed.shape, ITEM_NONE, dtype=np.int64)
+        for col in reversed(range(self._drop_kinds.shape[1])):
+            item_kind = np.where(roll < thresholds[..., col], kinds[..., col], item_kind)
+        self.items.append_mask(destroyed & (item_kind != ITEM_NONE),
+                               x=spawn_x, y=y, kind=item_kind)
+
+    def _player_overlap(self, pool: BatchPool, width: int, w: Any, h: Any) -> np.ndarray:
+        """计算池中每个实体是否与玩家相交，形状为 (对局数, width)。"""
+        px = self.player_x[:, None]
+        py = self.player_y[:, None]
+        x = pool.x[:, :width]
+        y = pool.y[:, :width]
+        return (pool.alive[:, :width] &
+                (x < px + self.config.PLAYER_WIDTH) & (px < x + w) &
+                (y < py + self.config.PLAYER_HEIGHT) & (py < y + h))
+
+    def _hit_first(self, pool: BatchPool, overlap: np.ndarray) -> None:
+        """移除每局第一个与玩家相交的实体，并使玩家受伤。"""
+        hit = overlap.any(axis=1)
+        if not hit.any():
+            return
+        envs = np.flatnonzero(hit)
+        pool.alive[envs, overlap[envs].argmax(axis=1)] = False
+        pool.compact()
+        self._take_damage(hit.astype(np.int64))
+
+    def _check_enemy_bullet_player_collision(self) -> None:
+        """敌机子弹与玩家的碰撞（每局只处理第一颗相交的子弹）。"""
+        width = self.enemy_bullets.width()
+        if width:
+            config = self.config
+            overlap = self._player_overlap(self.enemy_bullets, width, config.BULLET_WIDTH, config.BULLET_HEIGHT)
+            self._hit_first(self.enemy_bullets, overlap)
+
+    def _check_enemy_player_collision(self) -> None:
+        """敌机与玩家的碰撞（每局只处理第一个相交的敌机）。"""
+        width = self.enemies.width()
+        if width:
+            kind = self.enemies.type[:, :width]
+            overlap = self._player_overlap(self.enemies, width, self._enemy_width[kind], self._enemy_height[kind])
+            self._hit_first(self.enemies, overlap)
+
+    def _check_item_collisions(self, now: np.ndarray) -> None:
+        """拾取所有与玩家相交的道具并应用效果。"""
+        pool = self.items
+        width = pool.width()
+        if width == 0:
+            return
+        picked = self._player_overlap(pool, width, ITEM_SIZE, ITEM_SIZE)
+        if not picked.any():
+            return
+        kind = pool.kind[:, :width]
+
+        # 加血道具逐个生效，生命值不超过上限
+        health_items = np.count_nonzero(picked & (kind == ITEM_HEALTH), axis=1)
+        healable = self.health < PLAYER_MAX_HEALTH
+        self.health[:] = np.where(healable, np.minimum(self.health + health_items, PLAYER_MAX_HEALTH),
+                                  self.health)
+
+        power = (picked & (kind == ITEM_POWER_UP)).any(axis=1)
+        self.double_shot |= power
+        self.double_shot_end[power] = now[power] + DOUBLE_SHOT_DURATION
+
+        shield = (picked & (kind == ITEM_SHIELD)).any(axis=1)
+        self.shield |= shield
+        self.shield_end[shield] = now[shield] + SHIELD_DURATION
+
+        self.items_collected += np.count_nonzero(picked, axis=1)
+        pool.alive[:, :width] &= ~picked
+        pool.compact()
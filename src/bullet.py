@@ -19,14 +19,23 @@
     # 绘制子弹
     player_bullet.draw(screen)
     enemy_bullet.draw(screen)
+
+    # 大量子弹使用子弹池统一管理
+    pool = BulletPool("player")
+    pool.spawn(400, 300)
+    pool.update()
+    pool.draw(screen)
 """
 
+import numpy as np
 import pygame
-from typing import Literal, Tuple
+from itertools import repeat
+from typing import Iterator, Literal, Optional, Tuple
 from config import (
-    BULLET_WIDTH, BULLET_HEIGHT, PLAYER_BULLET_SPEED, ENEMY_BULLET_SPEED,
-    SCREEN_HEIGHT, YELLOW, RED
+    YELLOW, RED, BULLET_LOD_THRESHOLD, BULLET_LOD_GAP, BULLET_LOD_MAX_STREAMS
 )
+from game_config import DEFAULT_CONFIG
+from sprite_atlas import get_atlas
 
 # 定义子弹类型的字面量类型
 BulletType = Literal["player", "enemy"]
@@ -46,10 +55,11 @@ class Bullet:
         bullet_type (str): 子弹类型（"player" 或 "enemy"）
         speed (int): 子弹的移动速度（带方向）
         color (tuple): 子弹的颜色
+        max_y (int): y坐标超过此值（屏幕底部）时子弹飞出屏幕
         rect (pygame.Rect): 用于碰撞检测的矩形区域
     """
 
-    def __init__(self, x: int, y: int, bullet_type: BulletType = "player") -> None:
+    def __init__(self, x: int, y: int, bullet_type: BulletType = "player", config=None) -> None:
         """初始化子弹。
 
         根据子弹类型设置相应的移动速度和颜色。
@@ -59,19 +69,22 @@ class Bullet:
             x (int): 子弹初始x坐标位置
             y (int): 子弹初始y坐标位置
             bullet_type (BulletType): 子弹类型，可选"player"或"enemy"
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
         """
+        config = config if config is not None else DEFAULT_CONFIG
         self.x: int = x
         self.y: int = y
-        self.width: int = BULLET_WIDTH
-        self.height: int = BULLET_HEIGHT
+        self.width: int = config.BULLET_WIDTH
+        self.height: int = config.BULLET_HEIGHT
         self.bullet_type: BulletType = bullet_type
+        self.max_y: int = config.SCREEN_HEIGHT
 
         # 根据子弹类型设置速度和颜色
         if bullet_type == "player":
-            self.speed: int = -PLAYER_BULLET_SPEED  # 向上移动（负数）
+            self.speed: int = -config.PLAYER_BULLET_SPEED  # 向上移动（负数）
             self.color: Tuple[int, int, int] = YELLOW
         else:  # enemy bullet
-            self.speed = ENEMY_BULLET_SPEED   # 向下移动（正数）
+            self.speed = config.ENEMY_BULLET_SPEED   # 向下移动（正数）
             self.color = RED
 
         # 创建子弹矩形用于碰撞检测
@@ -97,7 +110,7 @@ class Bullet:
         Returns:
             bool: 如果子弹已飞出屏幕返回True，否则返回False
         """
-        return self.y < -self.height or self.y > SCREEN_HEIGHT
+        return self.y < -self.height or self.y > self.max_y
 
     def draw(self, screen: pygame.Surface) -> None:
         """绘制子弹。
@@ -108,7 +121,261 @@ class Bullet:
         Args:
             screen (pygame.Surface): 要绘制到的屏幕表面
         """
-        pygame.draw.rect(
-            screen, self.color,
-            (self.x, self.y, self.width, self.height)
-        )
+        surface = get_atlas().bullet(self.width, self.height, self.color)
+        screen.blit(surface, (self.x, self.y))
+
+
+# 子弹类型编码（BulletPool 中的 type 数组使用）
+BULLET_TYPE_PLAYER: int = 0
+BULLET_TYPE_ENEMY: int = 1
+
+
+class BulletPool:
+    """子弹池类（结构体数组存储）。
+
+    使用预分配的 NumPy 数组保存所有子弹的 x、y、速度、类型和存活标志，
+    替代逐个 Bullet 对象的列表。每帧只需一次向量化运算即可推进全部子弹，
+    并用一次掩码运算剔除飞出屏幕的子弹。
+
+    存活的子弹始终紧凑地存放在数组的前 count 个位置中，顺序与发射顺序一致。
+    被标记为死亡（alive 为 False）的子弹会在下一次 compact() 时被移除。
+
+    Attributes:
+        bullet_type (BulletType): 新生成子弹的默认类型
+        config (GameConfig): 运行时配置（子弹尺寸、速度和屏幕高度）
+        width (int): 子弹宽度
+        height (int): 子弹高度
+        count (int): 当前池中的子弹数量（含已标记死亡但尚未压缩的子弹）
+        x (numpy.ndarray): 子弹x坐标数组（int32）
+        y (numpy.ndarray): 子弹y坐标数组（int32）
+        speed (numpy.ndarray): 子弹速度数组（带方向，int32）
+        type (numpy.ndarray): 子弹类型编码数组（int8）
+        alive (numpy.ndarray): 子弹存活标志数组（bool）
+        lod_threshold (int): 子弹数量超过此值时按子弹流合并绘制（0为关闭）
+        lod_gap (int): 合并子弹流时允许跨越的额外间隙（像素）
+        lod_max_streams (int): 子弹流数量上限，超过时改为逐颗绘制
+    """
+
+    def __init__(self, bullet_type: BulletType = "player", capacity: int = 256,
+                 config=None) -> None:
+        """初始化子弹池。
+
+        Args:
+            bullet_type (BulletType): 默认子弹类型，决定速度方向和颜色
+            capacity (int): 初始预分配容量，不足时自动按两倍扩容
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
+        """
+        config = config if config is not None else DEFAULT_CONFIG
+        self.bullet_type: BulletType = bullet_type
+        self.config = config
+        self.width: int = config.BULLET_WIDTH
+        self.height: int = config.BULLET_HEIGHT
+        self._max_y: int = config.SCREEN_HEIGHT
+        self.count: int = 0
+        self.lod_threshold: int = BULLET_LOD_THRESHOLD
+        self.lod_gap: int = BULLET_LOD_GAP
+        self.lod_max_streams: int = BULLET_LOD_MAX_STREAMS
+
+        if bullet_type == "player":
+            self._speed: int = -config.PLAYER_BULLET_SPEED
+            self._type_code: int = BULLET_TYPE_PLAYER
+            self.color: Tuple[int, int, int] = YELLOW
+        else:
+            self._speed = config.ENEMY_BULLET_SPEED
+            self._type_code = BULLET_TYPE_ENEMY
+            self.color = RED
+
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """按给定容量分配（或重新分配）数组并保留已有数据。"""
+        old = getattr(self, "x", None)
+        n = self.count
+
+        new_x = np.empty(capacity, dtype=np.int32)
+        new_y = np.empty(capacity, dtype=np.int32)
+        new_speed = np.empty(capacity, dtype=np.int32)
+        new_type = np.empty(capacity, dtype=np.int8)
+        new_alive = np.zeros(capacity, dtype=bool)
+
+        if old is not None and n:
+            new_x[:n] = self.x[:n]
+            new_y[:n] = self.y[:n]
+            new_speed[:n] = self.speed[:n]
+            new_type[:n] = self.type[:n]
+            new_alive[:n] = self.alive[:n]
+
+        self.x: np.ndarray = new_x
+        self.y: np.ndarray = new_y
+        self.speed: np.ndarray = new_speed
+        self.type: np.ndarray = new_type
+        self.alive: np.ndarray = new_alive
+
+    @property
+    def capacity(self) -> int:
+        """当前预分配的容量。"""
+        return len(self.x)
+
+    def spawn(self, x: int, y: int) -> int:
+        """在池中生成一颗新子弹。
+
+        Args:
+            x (int): 子弹初始x坐标位置
+            y (int): 子弹初始y坐标位置
+
+        Returns:
+            int: 新子弹在池中的索引
+        """
+        i = self.count
+        if i >= len(self.x):
+            self._allocate(len(self.x) * 2)
+
+        self.x[i] = x
+        self.y[i] = y
+        self.speed[i] = self._speed
+        self.type[i] = self._type_code
+        self.alive[i] = True
+        self.count = i + 1
+        return i
+
+    def append(self, bullet: Bullet) -> None:
+        """兼容旧接口：把一个 Bullet 对象的位置加入池中。
+
+        Args:
+            bullet (Bullet): 要加入的子弹对象
+        """
+        self.spawn(bullet.x, bullet.y)
+
+    def kill(self, index: int) -> None:
+        """把指定子弹标记为死亡，在下一次 compact() 时移除。
+
+        Args:
+            index (int): 子弹在池中的索引
+        """
+        self.alive[index] = False
+
+    def update(self) -> None:
+        """推进所有子弹并移除飞出屏幕的子弹。
+
+        一次向量化加法完成全部子弹的移动，再用一个掩码同时剔除
+        飞出屏幕和已被标记为死亡的子弹。
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        y = self.y[:n]
+        y += self.speed[:n]
+        self.alive[:n] &= (y >= -self.height) & (y <= self._max_y)
+        self.compact()
+
+    def compact(self) -> None:
+        """移除所有已标记为死亡的子弹，保持存活子弹的相对顺序。"""
+        n = self.count
+        keep = self.alive[:n]
+        if keep.all():
+            return
+
+        m = int(np.count_nonzero(keep))
+        self.x[:m] = self.x[:n][keep]
+        self.y[:m] = self.y[:n][keep]
+        self.speed[:m] = self.speed[:n][keep]
+        self.type[:m] = self.type[:n][keep]
+        self.alive[:m] = True
+        self.alive[m:n] = False
+        self.count = m
+
+    def clear(self) -> None:
+        """清空子弹池（保留已分配的容量）。"""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """绘制池中所有存活的子弹。
+
+        Args:
+            screen (pygame.Surface): 要绘制到的屏幕表面
+        """
+        if self.count:
+            screen.blits(self.sprites(), doreturn=False)
+
+    def sprites(self, alpha: float = 1.0) -> Iterator[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """获取池中所有存活子弹的 (表面, 位置)，用于批量绘制。
+
+        Args:
+            alpha (float): 插值系数，1.0 表示当前位置；池中子弹速度相同，
+                插值只是把所有子弹的y坐标平移同一个量
+
+        Returns:
+            Iterator[Tuple[pygame.Surface, Tuple[int, int]]]: 按发射顺序排列的 (表面, 位置)
+        """
+        n = self.count
+        dy = int(self._speed * (1.0 - alpha)) if alpha < 1.0 else 0
+        if 0 < self.lod_threshold < n:
+            streams = self._stream_sprites(dy)
+            if streams is not None:
+                return streams
+        surface = get_atlas().bullet(self.width, self.height, self.color)
+        ys = self.y[:n] - dy if dy else self.y[:n]
+        return zip(repeat(surface, n), zip(self.x[:n].tolist(), ys.tolist()))
+
+    def _stream_sprites(self, dy: int = 0) -> Optional[Iterator[Tuple[pygame.Surface, Tuple[int, int]]]]:
+        """把同一列中相接（或间隙不超过 lod_gap）的子弹合并为子弹流。
+
+        自动射击时同一列的子弹首尾相叠，逐颗绘制会反复覆盖相同的像素。
+        合并后绘制次数只取决于子弹流的数量，而不是子弹数量；lod_gap 为0时
+        合并后的长条恰好是原来各个矩形的并集，画面完全不变。
+        玩家左右移动时子弹分散在许多列中，几乎无法合并：子弹流超过
+        lod_max_streams 条，或并不明显少于子弹数量时，合并得不偿失，
+        返回 None 由调用方逐颗绘制。
+
+        只影响绘制，模拟和碰撞检测仍然逐颗进行。dy 是渲染插值带来的y方向平移量。
+        """
+        n = self.count
+        xs = self.x[:n]
+        ys = self.y[:n]
+
+        # 每列至少一条子弹流：列数已超过上限时不必排序（x范围只有屏幕宽度，计数很便宜）
+        x_min = int(xs.min())
+        if np.count_nonzero(np.bincount(xs - x_min)) > self.lod_max_streams:
+            return None
+
+        order = np.lexsort((ys, xs))  # 先按x分列，列内按y排序
+        xs = xs[order]
+        ys = ys[order]
+
+        # 新子弹流的起点：换列，或与上一颗子弹之间有（超过 lod_gap 的）间隙
+        starts = np.empty(n, dtype=bool)
+        starts[0] = True
+        np.not_equal(xs[1:], xs[:-1], out=starts[1:])
+        starts[1:] |= (ys[1:] - ys[:-1]) > self.height + self.lod_gap
+        first = np.flatnonzero(starts)
+        if len(first) > self.lod_max_streams or len(first) * 2 > n:
+            return None
+
+        last = np.append(first[1:] - 1, n - 1)
+        lengths = (ys[last] - ys[first] + self.height).tolist()
+        stream_xs = xs[first].tolist()
+        stream_ys = (ys[first] - dy).tolist()
+
+        # 每种长度的子弹流只取一次表面（种类远少于子弹流数量）
+        atlas = get_atlas()
+        color = self.color
+        surfaces = {length: atlas.bullet(self.width, length, color) for length in set(lengths)}
+        return zip(map(surfaces.__getitem__, lengths), zip(stream_xs, stream_ys))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Bullet:
+        """兼容旧接口：返回指定子弹的 Bullet 视图（只读快照）。"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("bullet index out of range")
+        return Bullet(int(self.x[index]), int(self.y[index]), self.bullet_type, self.config)
+
+    def __iter__(self) -> Iterator[Bullet]:
+        """兼容旧接口：按发射顺序迭代所有子弹的 Bullet 视图（只读快照）。"""
+        for i in range(self.count):
+            yield self[i]
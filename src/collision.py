@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""批量碰撞检测模块。
+
+本模块提供基于 NumPy 广播的碰撞检测内核（narrow-phase），一次运算即可
+完成一组矩形（AABB）与另一组矩形之间的全部相交测试，替代逐对调用
+pygame.Rect.colliderect 的 Python 循环。相交规则与 colliderect 完全一致：
+边缘相接不算碰撞，宽或高为0的矩形不与任何矩形碰撞。
+
+典型用法示例:
+    boxes = entity_boxes(enemies)
+    overlap = overlap_matrix(bullet_xs, bullet_ys, BULLET_WIDTH, BULLET_HEIGHT,
+                             boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3])
+    hits = first_hits(overlap, enemy_hp)  # 每颗子弹击中的敌机索引，-1表示未命中
+"""
+
+import numpy as np
+import pygame
+from typing import Iterable, Union
+
+ArrayLike = Union[np.ndarray, int]
+
+
+def entity_boxes(entities: Iterable) -> np.ndarray:
+    """把带有 x、y、width、height 属性的对象转换为 AABB 数组。
+
+    Args:
+        entities (Iterable): 游戏对象序列（敌机、道具等）
+
+    Returns:
+        numpy.ndarray: 形状为(N, 4)的int32数组，每行为(x, y, w, h)
+    """
+    boxes = np.array(
+        [(int(e.x), int(e.y), e.width, e.height) for e in entities],
+        dtype=np.int32
+    )
+    return boxes.reshape(-1, 4)
+
+
+def overlap_matrix(ax: np.ndarray, ay: np.ndarray, aw: ArrayLike, ah: ArrayLike,
+                   bx: np.ndarray, by: np.ndarray, bw: ArrayLike, bh: ArrayLike) -> np.ndarray:
+    """一次广播计算两组矩形之间的相交矩阵。
+
+    Args:
+        ax (numpy.ndarray): A组矩形的x坐标数组，长度为N
+        ay (numpy.ndarray): A组矩形的y坐标数组，长度为N
+        aw (ArrayLike): A组矩形宽度（数组或统一的标量）
+        ah (ArrayLike): A组矩形高度（数组或统一的标量）
+        bx (numpy.ndarray): B组矩形的x坐标数组，长度为M
+        by (numpy.ndarray): B组矩形的y坐标数组，长度为M
+        bw (ArrayLike): B组矩形宽度（数组或统一的标量）
+        bh (ArrayLike): B组矩形高度（数组或统一的标量）
+
+    Returns:
+        numpy.ndarray: 形状为(N, M)的布尔矩阵，[i, j]为True表示A[i]与B[j]相交
+    """
+    ax = np.asarray(ax)[:, None]
+    ay = np.asarray(ay)[:, None]
+    aw = np.asarray(aw)
+    ah = np.asarray(ah)
+    if aw.ndim:
+        aw = aw[:, None]
+    if ah.ndim:
+        ah = ah[:, None]
+
+    overlap = (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+    # 与 colliderect 一致：空矩形不参与碰撞
+    overlap &= (aw > 0) & (ah > 0) & (np.asarray(bw) > 0) & (np.asarray(bh) > 0)
+    return overlap
+
+
+def overlap_rect(xs: np.ndarray, ys: np.ndarray, w: ArrayLike, h: ArrayLike,
+                 rect: pygame.Rect) -> np.ndarray:
+    """一次计算一组矩形与单个矩形（通常是玩家）的相交情况。
+
+    Args:
+        xs (numpy.ndarray): 矩形x坐标数组
+        ys (numpy.ndarray): 矩形y坐标数组
+        w (ArrayLike): 矩形宽度（数组或统一的标量）
+        h (ArrayLike): 矩形高度（数组或统一的标量）
+        rect (pygame.Rect): 目标矩形
+
+    Returns:
+        numpy.ndarray: 布尔数组，True表示该矩形与目标矩形相交
+    """
+    if rect.width <= 0 or rect.height <= 0:
+        return np.zeros(len(xs), dtype=bool)
+    return ((xs < rect.right) & (rect.x < xs + w) &
+            (ys < rect.bottom) & (rect.y < ys + h) &
+            (np.asarray(w) > 0) & (np.asarray(h) > 0))
+
+
+def first_index(mask: np.ndarray) -> int:
+    """返回布尔数组中第一个True的位置。
+
+    Args:
+        mask (numpy.ndarray): 布尔数组
+
+    Returns:
+        int: 第一个True的索引，如果没有则返回-1
+    """
+    if len(mask) == 0:
+        return -1
+    index = int(mask.argmax())
+    return index if mask[index] else -1
+
+
+def first_hits(overlap: np.ndarray, hp: np.ndarray) -> np.ndarray:
+    """按“每颗子弹只击中第一个敌机”的规则解析命中对。
+
+    结果与按子弹顺序逐个遍历敌机列表的循环完全一致：每颗子弹命中
+    第一个与之相交且仍然存活的敌机，敌机在被击中hp次后被摧毁，
+    之后的子弹不会再命中它。
+
+    绝大多数帧中没有敌机在同一帧被超量命中，此时每颗子弹的第一个
+    相交敌机就是最终结果，整个过程完全向量化；只有出现超量命中时，
+    才对有相交的子弹行按顺序逐个解析。
+
+    Args:
+        overlap (numpy.ndarray): 形状为(N, M)的子弹-敌机相交矩阵
+        hp (numpy.ndarray): 长度为M的敌机当前生命值数组
+
+    Returns:
+        numpy.ndarray: 长度为N的数组，每颗子弹命中的敌机索引，-1表示未命中
+    """
+    hits = np.full(overlap.shape[0], -1, dtype=np.intp)
+    rows = np.flatnonzero(overlap.any(axis=1))
+    if len(rows) == 0:
+        return hits
+
+    first = overlap[rows].argmax(axis=1)
+    counts = np.bincount(first, minlength=overlap.shape[1])
+    if (counts <= hp).all():
+        hits[rows] = first
+        return hits
+
+    # 存在超量命中：被摧毁的敌机之后的子弹需要顺延到下一个相交的敌机
+    remaining = np.array(hp, dtype=np.int64)
+    alive = remaining > 0
+    for row in rows.tolist():
+        cols = np.flatnonzero(overlap[row] & alive)
+        if len(cols):
+            col = cols[0]
+            hits[row] = col
+            remaining[col] -= 1
+            if remaining[col] <= 0:
+                alive[col] = False
+    return hits
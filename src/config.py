@@ -19,7 +19,9 @@
 
 SCREEN_WIDTH: int = 800  # 游戏窗口宽度（像素）
 SCREEN_HEIGHT: int = 600  # 游戏窗口高度（像素）
-FPS: int = 60  # 游戏帧率（帧/秒）
+FPS: int = 60  # 游戏逻辑帧率（每秒固定模拟的步数，所有速度都以像素/逻辑帧为单位）
+MAX_TICKS_PER_FRAME: int = 5  # 每个渲染帧最多补跑的逻辑帧数，渲染过慢时丢弃多余的时间
+MAX_RENDER_FPS: int = 120  # 渲染帧率上限（0表示不限制）
 
 # =============================================================================
 # 颜色定义 (RGB格式)
@@ -79,6 +81,14 @@ ENEMY_BULLET_SPEED: int = 4  # 敌机子弹移动速度（像素/帧）
 ENEMY_SPAWN_RATE: float = 0.02  # 敌机生成概率（每帧检查一次）
 ENEMY_BULLET_RATE: float = 0.005  # 敌机发射子弹的基础概率（每帧检查一次）
 ENEMY_MEDIUM_BULLET_MULTIPLIER: float = 2.0  # 中型敌机子弹发射概率倍数
+# 道具掉落表：敌机类型 -> ((累计概率阈值, 道具种类), ...)，按顺序取第一个
+# 大于随机数的阈值，都不满足时不掉落
+ITEM_DROP_TABLES: dict[str, tuple[tuple[float, str], ...]] = {
+    # 中型敌机掉落概率更高：15% 加血、20% 子弹强化、10% 护盾
+    "medium": ((0.15, "health"), (0.35, "power_up"), (0.45, "shield")),
+    # 小型敌机：5% 加血、20% 子弹强化，不掉落护盾
+    "small": ((0.05, "health"), (0.25, "power_up")),
+}
 
 # =============================================================================
 # 音效配置
@@ -87,3 +97,50 @@ ENEMY_MEDIUM_BULLET_MULTIPLIER: float = 2.0  # 中型敌机子弹发射概率倍
 SOUND_ENABLED: bool = True  # 是否启用音效
 SOUND_VOLUME: float = 0.5  # 音效音量 (0.0 - 1.0)
 SHOOT_SOUND_INTERVAL: int = 5  # 射击音效播放间隔（每N发子弹播放一次音效）
+SOUND_CACHE_ENABLED: bool = True  # 是否把合成好的音效保存到用户缓存目录，下次启动直接加载
+SOUND_PRELOAD_IN_BACKGROUND: bool = True  # 缓存缺少音效时是否在后台线程合成（否则首次播放时合成）
+SOUND_MAX_VOICES: int = 16  # 同时播放的最大声部数（混音器通道总数）
+# 每类音效保留的通道数，其余通道（SOUND_MAX_VOICES 减去保留总数）由所有类别共享
+SOUND_RESERVED_CHANNELS: dict[str, int] = {
+    "jingle": 1,  # 开始/结束音乐
+    "alert": 2,  # 玩家受击、道具拾取
+    "explosion": 3,  # 敌机爆炸
+    "hit": 3,  # 敌机被击中
+    "player": 2,  # 玩家射击
+    "ambient": 1,  # 敌机出现
+}
+# 同一音效两次播放之间的最小间隔（秒），间隔内的重复播放请求会被丢弃
+SOUND_MIN_INTERVALS: dict[str, float] = {
+    "hit_small": 0.05,
+    "hit_medium": 0.05,
+    "explosion": 0.03,
+    "player_hit": 0.1,
+    "item_pick": 0.05,
+    "enemy_spawn": 0.1,
+}
+
+# =============================================================================
+# 启动配置
+# =============================================================================
+
+STARTUP_LOADING_TIMEOUT: float = 5.0  # 加载画面等待后台音效合成的最长时间（秒）
+FONT_CACHE_ENABLED: bool = True  # 是否把字体查找结果保存到用户缓存目录，下次启动直接打开
+
+# =============================================================================
+# 渲染配置
+# =============================================================================
+
+DIRTY_RECT_RENDERING: bool = False  # 是否只擦除和更新变化的区域（适合软件渲染的低端机器）
+DIRTY_RECT_FULL_FLIP_RATIO: float = 0.5  # 变化面积超过屏幕面积的这一比例时改为整屏刷新
+DIRTY_RECT_RETRY_FRAMES: int = 30  # 改为整屏刷新后，隔多少帧再尝试局部更新
+BULLET_LOD_THRESHOLD: int = 200  # 子弹池中的子弹超过此数量时，同一列相接的子弹合并为一条子弹流绘制（0为关闭）
+BULLET_LOD_GAP: int = 0  # 合并时允许跨越的额外间隙（像素）；0表示只合并相接或重叠的子弹，画面完全不变
+BULLET_LOD_MAX_STREAMS: int = 64  # 子弹流超过此数量（子弹分散、难以合并）时不合并，改为逐颗绘制
+
+# =============================================================================
+# 性能分析配置
+# =============================================================================
+
+PROFILER_ENABLED: bool = False  # 是否在启动时启用帧时间分析（F3键可随时打开）
+PROFILER_WINDOW: int = 300  # 计算分位数使用的最近帧数
+PROFILER_OVERLAY_REFRESH: int = 30  # 分析叠加层每隔多少帧刷新一次
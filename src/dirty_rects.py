@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""脏矩形渲染模块。
+
+本模块记录每帧绘制影响的矩形（实体精灵、HUD文字等）。下一帧只擦除
+上一帧记录的区域，再用 pygame.display.update(rects) 只推送本帧和上一帧
+变化的区域，而不是每帧清空整个屏幕并 flip()。在软件渲染的低端机器上，
+全屏填充和翻转是每帧开销最大的操作之一。
+
+变化区域的总面积超过阈值时（例如子弹铺满屏幕），逐个矩形更新反而更慢，
+此时自动退回整屏 flip()，并在之后的若干帧内停止记录矩形（记录本身也有
+开销），冷却结束后再尝试局部更新。绘制了无法逐个记录的内容（如全屏半透明
+遮罩）后调用 invalidate()，下一帧会整屏重绘。
+
+典型用法示例:
+    tracker = DirtyRectTracker(screen.get_rect(), background)
+
+    if tracker.full_redraw:
+        screen.blit(background, (0, 0))
+    else:
+        tracker.erase(screen)
+    if tracker.tracking:
+        tracker.add_many(batch.submit(screen, return_rects=True))
+    else:
+        batch.submit(screen)
+    tracker.add(screen.blit(score_text, (10, 10)))
+
+    rects = tracker.end_frame()
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+"""
+
+import pygame
+from typing import Iterable, List, Optional
+
+
+class DirtyRectTracker:
+    """脏矩形跟踪类。
+
+    Attributes:
+        screen_rect (pygame.Rect): 屏幕矩形
+        background (pygame.Surface): 与屏幕同尺寸的背景，擦除时从中拷贝对应区域
+        full_flip_ratio (float): 变化面积超过屏幕面积的这一比例时退回整屏 flip()
+        retry_frames (int): 因面积过大退回整屏 flip() 后，停止记录矩形的帧数
+        full_redraw (bool): 本帧是否需要整屏重绘（首帧或上一帧调用过 invalidate()）
+        full_frames (int): 以整屏 flip() 结束的帧数（统计用）
+        partial_frames (int): 以局部更新结束的帧数（统计用）
+    """
+
+    def __init__(self, screen_rect: pygame.Rect, background: pygame.Surface,
+                 full_flip_ratio: float = 0.5, retry_frames: int = 30) -> None:
+        """初始化脏矩形跟踪器。
+
+        Args:
+            screen_rect (pygame.Rect): 屏幕矩形
+            background (pygame.Surface): 与屏幕同尺寸的背景表面
+            full_flip_ratio (float): 退回整屏 flip() 的面积比例阈值，默认为0.5
+            retry_frames (int): 因面积过大退回整屏 flip() 后停止记录矩形的帧数，默认为30
+        """
+        self.screen_rect: pygame.Rect = pygame.Rect(screen_rect)
+        self.background: pygame.Surface = background
+        self.full_flip_ratio: float = full_flip_ratio
+        self.retry_frames: int = retry_frames
+        self.full_redraw: bool = True
+        self.full_frames: int = 0
+        self.partial_frames: int = 0
+        self._invalid: bool = False
+        self._skip: int = 0  # 剩余的冷却帧数
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+
+    @property
+    def tracking(self) -> bool:
+        """本帧是否需要记录绘制影响的矩形（冷却期内为False）。"""
+        return self._skip == 0
+
+    def invalidate(self) -> None:
+        """标记屏幕上有未被记录的内容（如全屏遮罩）。
+
+        本帧结束时整屏 flip()，下一帧整屏重绘。
+        """
+        self._invalid = True
+
+    def erase(self, screen: pygame.Surface) -> None:
+        """用背景覆盖上一帧记录的所有区域。
+
+        Args:
+            screen (pygame.Surface): 要擦除的屏幕表面
+        """
+        previous = self._previous
+        if previous:
+            background = self.background
+            screen.blits([(background, rect, rect) for rect in previous], doreturn=False)
+
+    def add(self, rect: pygame.Rect) -> None:
+        """记录本帧绘制影响的一个矩形。
+
+        Args:
+            rect (pygame.Rect): 绘制影响的矩形（blit()/draw.*() 的返回值）
+        """
+        if rect.w and rect.h:
+            self._current.append(rect)
+
+    def add_many(self, rects: Iterable[pygame.Rect]) -> None:
+        """记录本帧绘制影响的多个矩形。
+
+        Args:
+            rects (Iterable[pygame.Rect]): 绘制影响的矩形
+        """
+        self._current.extend(rect for rect in rects if rect.w and rect.h)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        """结束本帧，计算需要推送到显示器的区域。
+
+        Returns:
+            Optional[List[pygame.Rect]]: 需要更新的矩形列表（上一帧和本帧的区域）；
+                需要整屏 flip() 时返回None
+        """
+        previous, current = self._previous, self._current
+        self._previous, self._current = current, []
+
+        if self._skip:
+            # 冷却期：没有记录矩形，继续整屏重绘
+            self._skip -= 1
+            self._previous = []
+            self.full_redraw, self._invalid = True, False
+            self.full_frames += 1
+            return None
+
+        full = self.full_redraw or self._invalid
+        self.full_redraw, self._invalid = self._invalid, False
+        if not full:
+            screen_area = self.screen_rect.w * self.screen_rect.h
+            dirty_area = sum(rect.w * rect.h for rect in previous)
+            dirty_area += sum(rect.w * rect.h for rect in current)
+            if dirty_area > screen_area * self.full_flip_ratio:
+                full = True
+                if self.retry_frames > 0:
+                    self._skip = self.retry_frames
+                    self.full_redraw = True
+
+        if full:
+            self.full_frames += 1
+            return None
+        self.partial_frames += 1
+        return previous + current
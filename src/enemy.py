@@ -18,15 +18,9 @@
 import pygame
 import random
 from typing import Optional, Tuple, Literal
-from config import (
-    ENEMY_SMALL_WIDTH, ENEMY_SMALL_HEIGHT, ENEMY_SMALL_SPEED,
-    ENEMY_SMALL_HP, ENEMY_SMALL_SCORE,
-    ENEMY_MEDIUM_WIDTH, ENEMY_MEDIUM_HEIGHT, ENEMY_MEDIUM_SPEED,
-    ENEMY_MEDIUM_HP, ENEMY_MEDIUM_SCORE,
-    BULLET_WIDTH, SCREEN_HEIGHT, ENEMY_BULLET_RATE,
-    ENEMY_MEDIUM_BULLET_MULTIPLIER,
-    RED, DARK_RED, GREEN, YELLOW
-)
+from config import RED, DARK_RED
+from game_config import DEFAULT_CONFIG
+from sprite_atlas import get_atlas
 
 # 定义敌机类型的字面量类型
 EnemyType = Literal["small", "medium"]
@@ -49,10 +43,14 @@ class Enemy:
         max_hp (int): 敌机最大生命值
         score (int): 击毁该敌机获得的分数
         color (tuple): 敌机的颜色
+        rng: 射击判定使用的随机数源
+        bullet_rate (float): 每帧发射子弹的概率
+        max_y (int): y坐标超过此值（屏幕底部）时敌机飞出屏幕
         rect (pygame.Rect): 用于碰撞检测的矩形区域
     """
 
-    def __init__(self, x: int, y: int, enemy_type: EnemyType = "small") -> None:
+    def __init__(self, x: int, y: int, enemy_type: EnemyType = "small",
+                 rng=None, config=None) -> None:
         """初始化敌机。
 
         根据敌机类型设置相应的属性值，包括大小、速度、生命值等。
@@ -61,28 +59,27 @@ class Enemy:
             x (int): 敌机初始x坐标位置
             y (int): 敌机初始y坐标位置
             enemy_type (EnemyType): 敌机类型，可选"small"或"medium"
+            rng: 随机数源，需提供 random() 方法；默认使用 random 模块
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
         """
         self.enemy_type: EnemyType = enemy_type
+        self.rng = rng if rng is not None else random
         self.x: int = x
         self.y: int = y
 
-        # 根据敌机类型设置属性
-        if enemy_type == "small":
-            self.width: int = ENEMY_SMALL_WIDTH
-            self.height: int = ENEMY_SMALL_HEIGHT
-            self.speed: int = ENEMY_SMALL_SPEED
-            self.hp: int = ENEMY_SMALL_HP
-            self.max_hp: int = ENEMY_SMALL_HP
-            self.score: int = ENEMY_SMALL_SCORE
-            self.color: Tuple[int, int, int] = RED
-        else:  # medium
-            self.width = ENEMY_MEDIUM_WIDTH
-            self.height = ENEMY_MEDIUM_HEIGHT
-            self.speed = ENEMY_MEDIUM_SPEED
-            self.hp = ENEMY_MEDIUM_HP
-            self.max_hp = ENEMY_MEDIUM_HP
-            self.score = ENEMY_MEDIUM_SCORE
-            self.color = DARK_RED
+        # 根据敌机类型设置属性（中型敌机的发射概率已在配置中乘以倍数）
+        config = config if config is not None else DEFAULT_CONFIG
+        stats = config.enemy_types[enemy_type]
+        self.width: int = stats["width"]
+        self.height: int = stats["height"]
+        self.speed: int = stats["speed"]
+        self.hp: int = stats["hp"]
+        self.max_hp: int = stats["hp"]
+        self.score: int = stats["score"]
+        self.bullet_rate: float = stats["bullet_rate"]
+        self.color: Tuple[int, int, int] = RED if enemy_type == "small" else DARK_RED
+        self.max_y: int = config.SCREEN_HEIGHT
+        self._bullet_offset: Tuple[int, int] = stats["bullet_offset"]
 
         # 创建敌机矩形用于碰撞检测
         self.rect: pygame.Rect = pygame.Rect(x, y, self.width, self.height)
@@ -108,7 +105,7 @@ class Enemy:
         Returns:
             bool: 如果敌机已飞出屏幕返回True，否则返回False
         """
-        return self.y > SCREEN_HEIGHT
+        return self.y > self.max_y
 
     def can_shoot(self) -> bool:
         """检查敌机是否可以发射子弹。
@@ -119,12 +116,7 @@ class Enemy:
         Returns:
             bool: 如果可以发射子弹返回True，否则返回False
         """
-        base_rate: float = ENEMY_BULLET_RATE
-        if self.enemy_type == "medium":
-            # 中型敌机发射概率更高
-            return random.random() < base_rate * ENEMY_MEDIUM_BULLET_MULTIPLIER
-        else:
-            return random.random() < base_rate
+        return self.rng.random() < self.bullet_rate
 
     def shoot(self) -> Optional[Tuple[int, int]]:
         """发射子弹。
@@ -137,10 +129,9 @@ class Enemy:
                                      否则返回None
         """
         if self.can_shoot():
-            # 计算子弹的初始位置（敌机中心下方）
-            bullet_x: int = self.x + self.width // 2 - BULLET_WIDTH // 2
-            bullet_y: int = self.y + self.height
-            return (bullet_x, bullet_y)
+            # 子弹的初始位置（敌机中心下方），偏移是配置的派生值
+            dx, dy = self._bullet_offset
+            return (self.x + dx, self.y + dy)
         return None
 
     def take_damage(self) -> None:
@@ -162,63 +153,26 @@ class Enemy:
         """绘制敌机。
 
         在屏幕上绘制敌机的图形表示，包括主体、血量条（如果受伤）和武器。
-        不同类型的敌机使用不同的颜色来区分。
+        不同类型的敌机使用不同的颜色来区分。图形从精灵图集中按当前
+        血量取出预先光栅化的表面，只需一次 blit。
 
         Args:
             screen (pygame.Surface): 要绘制到的屏幕表面
         """
-        # 绘制敌机主体
-        pygame.draw.rect(
-            screen, self.color,
-            (self.x, self.y, self.width, self.height)
-        )
+        screen.blit(*self.sprite())
 
-        # 绘制血量条（仅在受伤时显示）
-        if self.hp < self.max_hp:
-            self._draw_health_bar(screen)
-
-        # 绘制敌机的武器系统
-        self._draw_weapon(screen)
-
-    def _draw_health_bar(self, screen: pygame.Surface) -> None:
-        """绘制敌机的血量条。
-
-        在敌机上方显示血量条，红色背景表示最大血量，
-        绿色前景表示当前血量。
+    def sprite(self, alpha: float = 1.0) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """获取敌机当前的精灵表面及其绘制位置，用于批量绘制。
 
         Args:
-            screen (pygame.Surface): 要绘制到的屏幕表面
-        """
-        bar_width: int = self.width
-        bar_height: int = 4
-        bar_x: int = self.x
-        bar_y: int = self.y - 8
-
-        # 绘制血量条背景（红色）
-        pygame.draw.rect(
-            screen, RED,
-            (bar_x, bar_y, bar_width, bar_height)
-        )
+            alpha (float): 插值系数，1.0 表示当前位置；敌机匀速移动，
+                上一逻辑帧的位置由速度推算
 
-        # 绘制当前血量（绿色）
-        current_width: int = int(bar_width * (self.hp / self.max_hp))
-        pygame.draw.rect(
-            screen, GREEN,
-            (bar_x, bar_y, current_width, bar_height)
-        )
-
-    def _draw_weapon(self, screen: pygame.Surface) -> None:
-        """绘制敌机的武器系统。
-
-        在敌机底部中央绘制一个小的黄色矩形，代表武器。
-
-        Args:
-            screen (pygame.Surface): 要绘制到的屏幕表面
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: (表面, 左上角位置)
         """
-        weapon_rect: pygame.Rect = pygame.Rect(
-            self.x + self.width // 2 - 2,  # 武器x坐标（居中）
-            self.y + self.height - 5,      # 武器y坐标（底部）
-            4,                             # 武器宽度
-            8                              # 武器高度
-        )
-        pygame.draw.rect(screen, YELLOW, weapon_rect)
+        surface, (dx, dy) = get_atlas().enemy(self)
+        y = self.y
+        if alpha < 1.0:
+            y = int(y - self.speed * (1.0 - alpha))
+        return surface, (self.x + dx, y + dy)
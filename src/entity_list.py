@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""实体容器模块。
+
+本模块定义了支持延迟删除的实体列表。遍历过程中删除对象只需把对应
+槽位标记为死亡（O(1)），遍历结束后再用一次线性压缩统一移除，
+替代“遍历切片副本 + list.remove”的写法（每次 remove 都是一次线性扫描）。
+
+压缩时保持存活对象的相对顺序，因此依赖列表顺序的逻辑（例如碰撞检测中
+“第一个被击中的敌机”）不受影响。
+
+典型用法示例:
+    enemies = EntityList()
+    enemies.append(Enemy(100, 0, "small"))
+
+    for index, enemy in enemies.indexed():
+        enemy.update()
+        if enemy.is_off_screen():
+            enemies.kill(index)  # 延迟删除，不影响本次遍历
+
+    enemies.compact()  # 一次性移除所有被标记的对象
+"""
+
+from typing import Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class EntityList(Generic[T]):
+    """支持延迟删除的实体列表类。
+
+    对象按加入顺序存放在内部槽位中。kill() 只标记槽位，不移动任何对象，
+    所以在遍历中删除是安全的；compact() 一次性移除所有被标记的对象。
+    在两次 compact() 之间，槽位索引保持稳定。
+
+    Attributes:
+        pending (int): 已标记删除但尚未压缩的对象数量
+    """
+
+    def __init__(self, items: Optional[Iterable[T]] = None) -> None:
+        """初始化实体列表。
+
+        Args:
+            items (Optional[Iterable[T]]): 初始对象序列，默认为空
+        """
+        self._items: List[T] = list(items) if items is not None else []
+        self._dead: List[bool] = [False] * len(self._items)
+        self.pending: int = 0
+
+    def append(self, item: T) -> None:
+        """在列表末尾加入一个对象。
+
+        Args:
+            item (T): 要加入的对象
+        """
+        self._items.append(item)
+        self._dead.append(False)
+
+    def kill(self, index: int) -> None:
+        """把指定槽位的对象标记为删除（O(1)）。
+
+        Args:
+            index (int): 对象所在的槽位索引
+        """
+        if not self._dead[index]:
+            self._dead[index] = True
+            self.pending += 1
+
+    def is_killed(self, index: int) -> bool:
+        """检查指定槽位的对象是否已被标记删除。
+
+        Args:
+            index (int): 对象所在的槽位索引
+
+        Returns:
+            bool: 如果已被标记删除返回True，否则返回False
+        """
+        return self._dead[index]
+
+    def compact(self) -> None:
+        """移除所有被标记删除的对象，保持存活对象的相对顺序。"""
+        if not self.pending:
+            return
+
+        dead = self._dead
+        self._items = [item for item, is_dead in zip(self._items, dead) if not is_dead]
+        self._dead = [False] * len(self._items)
+        self.pending = 0
+
+    def clear(self) -> None:
+        """清空所有对象。"""
+        self._items.clear()
+        self._dead.clear()
+        self.pending = 0
+
+    def indexed(self) -> Iterator[Tuple[int, T]]:
+        """按顺序迭代所有未被标记删除的对象及其槽位索引。
+
+        遍历期间可以调用 kill() 和 append()，新加入的对象也会被遍历到。
+
+        Yields:
+            Tuple[int, T]: (槽位索引, 对象)
+        """
+        items = self._items
+        dead = self._dead
+        index = 0
+        while index < len(items):
+            if not dead[index]:
+                yield index, items[index]
+            index += 1
+
+    def __iter__(self) -> Iterator[T]:
+        """按顺序迭代所有未被标记删除的对象。"""
+        if not self.pending:
+            return iter(self._items)
+        return (item for item, is_dead in zip(self._items, self._dead) if not is_dead)
+
+    def __getitem__(self, index: int) -> T:
+        """按槽位索引访问对象（压缩后槽位索引即为列表位置）。"""
+        return self._items[index]
+
+    def __len__(self) -> int:
+        """返回未被标记删除的对象数量。"""
+        return len(self._items) - self.pending
+
+    def __bool__(self) -> bool:
+        return len(self._items) > self.pending
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""字体查找模块。
+
+本模块按候选列表查找可用的 HUD 字体：依次尝试几种常见的系统字体，
+最后退回 pygame 自带的默认字体，并用一次测试渲染确认字体可用。
+
+查找 pygame.font.match_font 时会扫描系统字体，字体很多的机器上比较慢。
+因此查找结果（字体文件路径、字号和文件修改时间）保存在用户缓存目录的
+fonts.json 中，之后启动直接用 pygame.font.Font(path, size) 打开；只有缓存的
+字体文件不存在、修改时间变化或无法打开时才重新查找。
+
+load_fonts() 不访问任何游戏状态，可以放在工作线程中执行
+（需要先在主线程调用 pygame.font.init()）。
+
+典型用法示例:
+    pygame.font.init()
+    font, big_font = load_fonts()
+    if font is None:
+        ...  # 没有可用字体，使用图形替代
+"""
+
+import json
+import os
+import pygame
+from typing import Any, Dict, Optional, Tuple
+from config import WHITE, FONT_CACHE_ENABLED
+from user_cache import cache_file
+
+FONT_NAMES: Tuple[str, ...] = ('arial', 'helvetica', 'calibri', 'verdana')  # 系统字体候选
+HUD_FONT_SIZE: int = 36  # HUD文字字号
+BIG_FONT_SIZE: int = 72  # 游戏结束标题字号
+
+FONT_CACHE_FILE: str = "fonts.json"  # 字体缓存文件名（位于用户缓存目录）
+FONT_CACHE_VERSION: int = 1
+
+# 查找结果：(字体, 字体文件路径)，路径为None表示 pygame 默认字体
+FontMatch = Tuple[pygame.font.Font, Optional[str]]
+
+
+def _open_font(path: Optional[str], size: int) -> pygame.font.Font:
+    """打开字体并测试渲染，失败时抛出异常。"""
+    font = pygame.font.Font(path, size)
+    font.render("Test", True, WHITE)
+    return font
+
+
+def _probe_font(size: int) -> Optional[FontMatch]:
+    """按候选列表查找第一个可用的字体。"""
+    for name in FONT_NAMES:
+        path = pygame.font.match_font(name)
+        if path is None:
+            continue
+        try:
+            return _open_font(path, size), path
+        except Exception:
+            continue
+    try:
+        return _open_font(None, size), None
+    except Exception:
+        return None
+
+
+def _file_mtime(path: Optional[str]) -> Optional[float]:
+    """获取字体文件修改时间（默认字体返回None）。"""
+    return None if path is None else os.path.getmtime(path)
+
+
+def _open_cached_font(entry: Dict[str, Any], size: int) -> Optional[pygame.font.Font]:
+    """打开缓存中记录的字体；文件不存在、已修改或无法打开时返回None。"""
+    path = entry.get("path")
+    try:
+        if entry.get("size") != size or _file_mtime(path) != entry.get("mtime"):
+            return None
+        return _open_font(path, size)
+    except Exception:
+        return None
+
+
+def _read_font_cache(path: Optional[str]) -> Dict[str, Any]:
+    """读取字体缓存，不存在、损坏或版本不匹配时返回空字典。"""
+    if not path:
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != FONT_CACHE_VERSION:
+        return {}
+    fonts = data.get("fonts")
+    return fonts if isinstance(fonts, dict) else {}
+
+
+def _write_font_cache(path: Optional[str], fonts: Dict[str, Any]) -> None:
+    """写入字体缓存（先写临时文件再替换）。"""
+    if not path:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": FONT_CACHE_VERSION, "fonts": fonts}, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_font(size: int) -> Optional[pygame.font.Font]:
+    """查找指定字号的可用字体（不使用缓存）。
+
+    Args:
+        size (int): 字号
+
+    Returns:
+        Optional[pygame.font.Font]: 第一个能正常渲染的字体；全部失败时返回None
+    """
+    match = _probe_font(size)
+    return match[0] if match is not None else None
+
+
+def load_fonts(use_cache: bool = FONT_CACHE_ENABLED) -> Tuple[Optional[pygame.font.Font],
+                                                              Optional[pygame.font.Font]]:
+    """查找 HUD 字体和大字体，优先使用缓存的查找结果。
+
+    Args:
+        use_cache (bool): 是否读写字体缓存文件
+
+    Returns:
+        Tuple[Optional[pygame.font.Font], Optional[pygame.font.Font]]: (普通字体, 大字体)
+    """
+    path = cache_file(FONT_CACHE_FILE) if use_cache else None
+    cached = _read_font_cache(path)
+    changed = False
+
+    fonts = []
+    for size in (HUD_FONT_SIZE, BIG_FONT_SIZE):
+        key = str(size)
+        entry = cached.get(key)
+        font = _open_cached_font(entry, size) if isinstance(entry, dict) else None
+        if font is None:
+            # 缓存缺失或失效，重新查找
+            match = _probe_font(size)
+            if match is not None:
+                font, font_path = match
+                cached[key] = {"path": font_path, "size": size, "mtime": _file_mtime(font_path)}
+            else:
+                cached.pop(key, None)
+            changed = True
+        fonts.append(font)
+
+    if changed:
+        _write_font_cache(path, cached)
+    return fonts[0], fonts[1]
@@ -8,22 +8,92 @@
 典型用法示例:
     game = Game()
     game.run()  # 开始游戏主循环
+
+    # 无窗口、不限帧率地模拟（用于平衡性调整和性能测量）
+    game = Game(headless=True)
+    stats = game.run_headless(max_frames=10000)
+    print(stats["fps"])
 """
 
+import numpy as np
 import pygame
-import random
 import sys
-from typing import List, Optional
+import time
+from typing import Dict, Optional
 from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, RED, GREEN, YELLOW,
-    PLAYER_WIDTH, PLAYER_HEIGHT, ENEMY_SPAWN_RATE,
-    ENEMY_SMALL_WIDTH, ENEMY_MEDIUM_WIDTH, AUTO_FIRE,
-    SOUND_ENABLED, SOUND_VOLUME, SHOOT_SOUND_INTERVAL
+    FPS, MAX_TICKS_PER_FRAME, MAX_RENDER_FPS, BLACK, WHITE, RED, GREEN, YELLOW,
+    SOUND_ENABLED, SOUND_VOLUME,
+    PROFILER_ENABLED, PROFILER_WINDOW, PROFILER_OVERLAY_REFRESH,
+    DIRTY_RECT_RENDERING, DIRTY_RECT_FULL_FLIP_RATIO, DIRTY_RECT_RETRY_FRAMES,
+    STARTUP_LOADING_TIMEOUT
 )
+from game_config import GameConfig, DEFAULT_CONFIG
 from player import Player
 from enemy import Enemy, EnemyType
-from bullet import Bullet
+from bullet import BulletPool
 from sound_manager import SoundManager
+from input_source import InputSource, KeyboardInput, ScriptedInput
+from game_clock import SimClock
+from rng_streams import RngStreams
+from replay import ReplayRecorder, EVENT_RESTART, EVENT_SHOOT
+from profiler import FrameProfiler, NullProfiler
+from text_cache import TextCache
+from sprite_atlas import SpriteAtlas, get_atlas
+from render_batch import RenderBatch
+from dirty_rects import DirtyRectTracker
+from layer_cache import LayerCache
+from fonts import load_fonts
+from startup import StartupTimer, BackgroundTask, draw_loading_frame
+from spatial_grid import SpatialGrid
+from entity_list import EntityList
+from collision import entity_boxes, overlap_matrix, overlap_rect, first_index, first_hits
+
+
+# =============================================================================
+# 静态图层的绘制函数（由 LayerCache 在图层内容变化时调用）
+# =============================================================================
+
+def _draw_empty_box(surface: pygame.Surface) -> None:
+    """白色边框、黑色内部的方框（替代UI使用）。"""
+    width, height = surface.get_size()
+    pygame.draw.rect(surface, WHITE, (0, 0, width, height))
+    pygame.draw.rect(surface, BLACK, (2, 2, width - 4, height - 4))
+
+
+def _draw_count_box(surface: pygame.Surface, color, count: int) -> None:
+    """方框中用一排小矩形表示数量（替代UI的分数和生命值）。"""
+    _draw_empty_box(surface)
+    for i in range(count):
+        pygame.draw.rect(surface, color, (5 + i * 10, 5, 8, 15))
+
+
+def _draw_invincible_box(surface: pygame.Surface) -> None:
+    """方框中用金色矩形表示无敌模式。"""
+    _draw_empty_box(surface)
+    pygame.draw.rect(surface, YELLOW, (5, 5, 170, 15))
+
+
+def _draw_game_over_panel(surface: pygame.Surface, score_rects: int) -> None:
+    """替代的游戏结束面板（标题、分数和重新开始提示），其余部分透明。"""
+    # "GAME OVER"（用大矩形表示）
+    pygame.draw.rect(surface, WHITE, (0, 0, 300, 50))
+    pygame.draw.rect(surface, RED, (5, 5, 290, 40))
+
+    # 分数区域（用小矩形表示分数）
+    pygame.draw.rect(surface, WHITE, (50, 60, 200, 30))
+    pygame.draw.rect(surface, BLACK, (55, 65, 190, 20))
+    for i in range(score_rects):
+        pygame.draw.rect(surface, WHITE, (60 + i * 10, 68, 8, 14))
+
+    # 重新开始提示区域
+    pygame.draw.rect(surface, WHITE, (30, 110, 240, 30))
+    pygame.draw.rect(surface, GREEN, (35, 115, 230, 20))
+
+
+def _build_dim_overlay(surface: pygame.Surface) -> None:
+    """游戏结束时的半透明黑色遮罩。"""
+    surface.fill(BLACK)
+    surface.set_alpha(128)
 
 
 class Game:
@@ -33,143 +103,241 @@ class Game:
     渲染等核心功能。这是游戏的控制中心。
 
     Attributes:
-        screen (pygame.Surface): 游戏主窗口表面
+        headless (bool): 是否为无窗口模式（无显示、无音频、不限帧率）
+        input_source (InputSource): 每帧按键状态的来源
+        rng (RngStreams): 本局游戏的随机数流（由种子派生）
+        sim_clock (SimClock): 固定步长的模拟时钟，每个逻辑帧前进一步
+        config (GameConfig): 当前的运行时配置，在两局之间通过 restart_game(config=...) 切换
+        enemy_spawn_rate (float): 每帧生成敌机的概率（切换配置时取配置中的值）
+        recorder (Optional[ReplayRecorder]): 回放录制器，设置后 run() 会记录每帧输入
+        profiler (FrameProfiler | NullProfiler): 帧时间分析器，未启用时为空操作
+        profile_dump_path (Optional[str]): 退出时写出分析结果的路径（.json或.csv）
+        screen (pygame.Surface): 游戏主窗口表面（无窗口模式下为离屏表面）
         clock (pygame.time.Clock): 游戏时钟，用于控制帧率
         running (bool): 游戏是否正在运行
         game_over (bool): 游戏是否结束
         score (int): 玩家当前分数
+        kills (Dict[str, int]): 本局按敌机类型统计的击毁数
+        items_collected (int): 本局拾取的道具数
         player (Player): 玩家飞机对象
-        enemies (List[Enemy]): 敌机列表
-        player_bullets (List[Bullet]): 玩家子弹列表
-        enemy_bullets (List[Bullet]): 敌机子弹列表
+        enemies (EntityList[Enemy]): 敌机列表（支持延迟删除）
+        player_bullets (BulletPool): 玩家子弹池
+        enemy_bullets (BulletPool): 敌机子弹池
         font (pygame.font.Font): 普通字体
         big_font (pygame.font.Font): 大号字体
+        startup_timer (StartupTimer): 启动各阶段的耗时
     """
 
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False,
+                 input_source: Optional[InputSource] = None,
+                 seed: Optional[int] = None,
+                 startup_timer: Optional[StartupTimer] = None,
+                 config: Optional[GameConfig] = None) -> None:
         """初始化游戏。
 
         设置游戏窗口、初始化游戏状态、创建玩家对象和各种游戏对象列表。
+        无窗口模式下不创建窗口、不加载字体、不启动音频，画面绘制到离屏表面。
+
+        有窗口时先创建窗口并显示加载画面，字体查找在工作线程中进行（音效由
+        SoundManager 在后台合成），初始化完成后在加载画面中等待它们结束。
+
+        Args:
+            headless (bool): 是否使用无窗口模式，默认为False
+            input_source (Optional[InputSource]): 按键状态来源；默认实时模式读取
+                键盘，无窗口模式不按任何键
+            seed (Optional[int]): 随机种子；相同种子和相同输入总能复现同一局游戏，
+                为None时随机选择（可从 rng.seed 读取）
+            startup_timer (Optional[StartupTimer]): 启动计时器；传入程序入口处创建的
+                计时器可以把模块导入也计入启动时间明细
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
         """
-        # 创建游戏窗口
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-        pygame.display.set_caption("飞机大战")
+        self.headless: bool = headless
+        self.config: GameConfig = config if config is not None else DEFAULT_CONFIG
+        self.startup_timer: StartupTimer = startup_timer if startup_timer is not None else StartupTimer()
+        self.startup_timer.mark("imports")
+
+        if input_source is None:
+            input_source = ScriptedInput() if headless else KeyboardInput()
+        self.input_source: InputSource = input_source
+
+        if headless:
+            # 离屏表面，需要时仍可调用draw()进行渲染测量
+            self.screen: pygame.Surface = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        else:
+            # 创建游戏窗口并立即显示加载画面
+            self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+            pygame.display.set_caption("飞机大战")
+            draw_loading_frame(self.screen, 0.0)
+            pygame.display.flip()
+        self.startup_timer.mark("window")
+
+        # 字体查找在工作线程中进行（需要先在主线程初始化字体模块）
+        font_task: Optional[BackgroundTask] = None
+        if not headless:
+            pygame.font.init()
+            font_task = BackgroundTask(load_fonts, name="font-discovery")
+
+        # 预先光栅化所有精灵（有窗口时会转换为显示格式）
+        self.atlas: SpriteAtlas = get_atlas()
+        self.atlas.build(self.config)
+        self.render_batch: RenderBatch = RenderBatch()  # 每帧的实体批量绘制序列
+        self.layers: LayerCache = LayerCache()  # 背景、游戏结束画面等静态图层
+        self._game_over_drawn: bool = False  # 上一帧是否绘制的是游戏结束画面
+
+        # 脏矩形渲染（可选）：只擦除和推送变化的区域
+        self.dirty_rects: Optional[DirtyRectTracker] = None
+        self.set_dirty_rect_rendering(DIRTY_RECT_RENDERING)
+        self.startup_timer.mark("sprites")
 
         # 创建时钟对象用于控制帧率
         self.clock: pygame.time.Clock = pygame.time.Clock()
 
+        # 模拟时钟和随机数流：游戏逻辑只依赖逻辑帧数和种子，可逐位复现
+        self.sim_clock: SimClock = SimClock(1.0 / FPS)
+        self.rng: RngStreams = RngStreams(seed)
+        self.enemy_spawn_rate: float = self.config.ENEMY_SPAWN_RATE  # 每帧生成敌机的概率
+
+        # 回放录制：每帧记录按键和事件
+        self.recorder: Optional[ReplayRecorder] = None
+        self.last_keys_pressed = None  # 本帧 update_game 读取的按键状态
+        self.frame_events: int = 0  # 本逻辑帧应用的事件位
+        self.pending_events: int = 0  # 已收到、等待下一个逻辑帧应用的事件位
+
+        # 帧时间分析：未启用时使用空分析器，几乎没有开销
+        self.profiler = FrameProfiler(PROFILER_WINDOW) if PROFILER_ENABLED else NullProfiler()
+        self.profile_dump_path: Optional[str] = None
+        self.show_profiler_overlay: bool = False
+        self._profiler_overlay_lines: list = []
+        self._overlay_profiler: bool = False  # 分析器是否仅为叠加层而临时启用
+
         # 游戏状态变量
         self.running: bool = True
         self.game_over: bool = False
         self.score: int = 0
-        self.shoot_sound_counter: int = 0  # 射击音效计数器
+        self.kills: Dict[str, int] = {"small": 0, "medium": 0}
+        self.items_collected: int = 0
 
         # 创建玩家飞机（位于屏幕底部中央）
-        player_x: int = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
-        player_y: int = SCREEN_HEIGHT - PLAYER_HEIGHT - 20
-        self.player: Player = Player(player_x, player_y)
+        player_x, player_y = self.config.player_start
+        self.player: Player = Player(player_x, player_y, clock=self.sim_clock, config=self.config)
 
         # 初始化游戏对象列表
-        self.enemies: List[Enemy] = []
-        self.player_bullets: List[Bullet] = []
-        self.enemy_bullets: List[Bullet] = []
+        self.enemies: EntityList[Enemy] = EntityList()
+        self.player_bullets: BulletPool = BulletPool("player", config=self.config)
+        self.enemy_bullets: BulletPool = BulletPool("enemy", config=self.config)
 
-        # 初始化字体对象（使用最兼容的方法）
-        pygame.font.init()  # 确保字体模块已初始化
+        # 敌机空间网格，用于玩家子弹碰撞检测的粗筛
+        self.enemy_grid: SpatialGrid = SpatialGrid(self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
 
         # 尝试多种字体，找到可用的
         self.font = None
         self.big_font = None
 
-        # 字体候选列表
-        font_candidates = [
-            lambda: pygame.font.SysFont('arial', 36),
-            lambda: pygame.font.SysFont('helvetica', 36),
-            lambda: pygame.font.SysFont('calibri', 36),
-            lambda: pygame.font.SysFont('verdana', 36),
-            lambda: pygame.font.Font(None, 36),
-        ]
-
-        big_font_candidates = [
-            lambda: pygame.font.SysFont('arial', 72),
-            lambda: pygame.font.SysFont('helvetica', 72),
-            lambda: pygame.font.SysFont('calibri', 72),
-            lambda: pygame.font.SysFont('verdana', 72),
-            lambda: pygame.font.Font(None, 72),
-        ]
-
-        # 尝试找到可用的普通字体
-        for font_func in font_candidates:
-            try:
-                test_font = font_func()
-                # 测试渲染
-                test_surface = test_font.render("Test", True, WHITE)
-                self.font = test_font
-                break
-            except:
-                continue
-
-        # 尝试找到可用的大字体
-        for font_func in big_font_candidates:
-            try:
-                test_font = font_func()
-                # 测试渲染
-                test_surface = test_font.render("Test", True, WHITE)
-                self.big_font = test_font
-                break
-            except:
-                continue
-
-        # 如果所有字体都失败，设置为None（将使用图形替代）
-        if self.font is None:
-            print("Warning: No fonts available, using graphics fallback")
-        if self.big_font is None:
-            print("Warning: No big fonts available, using graphics fallback")
+        # HUD文字表面缓存（有可用字体时创建）
+        self.text_cache: Optional[TextCache] = None
+        self.big_text_cache: Optional[TextCache] = None
 
-        # 初始化音效管理器
+        # 初始化音效管理器（无窗口模式不启动音频）
         self.sound_manager: SoundManager = SoundManager(
-            enabled=SOUND_ENABLED,
-            volume=SOUND_VOLUME
+            enabled=SOUND_ENABLED and not headless,
+            volume=SOUND_VOLUME,
+            clock=self.sim_clock
         )
+        self.startup_timer.mark("audio")
 
         # 初始化道具管理器 - 1.1.0新增
         from item import ItemManager
-        self.item_manager: ItemManager = ItemManager()
+        self.item_manager: ItemManager = ItemManager(rng=self.rng.item, config=self.config)
+
+        # 在加载画面中等待字体和音效
+        if font_task is not None:
+            self._wait_for_assets(font_task)
+            self._init_fonts(font_task.result())
+            self.startup_timer.mark("loading")
 
         # 播放游戏开始音效 - 1.1.0新增
         self.sound_manager.play_start()
 
+    def _wait_for_assets(self, font_task: BackgroundTask) -> None:
+        """显示加载画面，直到字体查找和后台音效合成结束。
+
+        字体总是等到查找完成；音效最多等待 STARTUP_LOADING_TIMEOUT 秒，
+        超时后未合成的音效在合成完成之前不会播放。
+
+        Args:
+            font_task (BackgroundTask): 字体查找任务
+        """
+        deadline = time.perf_counter() + STARTUP_LOADING_TIMEOUT
+        while True:
+            fonts_done = font_task.done()
+            sounds_done = self.sound_manager.is_ready() or time.perf_counter() >= deadline
+            if fonts_done and sounds_done:
+                break
+            pygame.event.pump()  # 保持窗口响应，事件留给游戏循环处理
+            draw_loading_frame(self.screen, (fonts_done + sounds_done + 1) / 3)
+            pygame.display.flip()
+            pygame.time.wait(5)
+
+    def _init_fonts(self, fonts: Optional[tuple] = None) -> None:
+        """初始化字体对象（使用最兼容的方法）。
+
+        Args:
+            fonts (Optional[tuple]): 已查找到的 (普通字体, 大字体)；为None时在这里同步查找
+        """
+        if fonts is None:
+            pygame.font.init()  # 确保字体模块已初始化
+            fonts = load_fonts()
+        self.font, self.big_font = fonts
+
+        # 如果所有字体都失败，设置为None（将使用图形替代）
+        if self.font is None:
+            print("Warning: No fonts available, using graphics fallback")
+        if self.big_font is None:
+            print("Warning: No big fonts available, using graphics fallback")
+
+        # 文字只在内容变化时重新渲染
+        if self.font is not None:
+            self.text_cache = TextCache(self.font)
+        if self.big_font is not None:
+            self.big_text_cache = TextCache(self.big_font, maxsize=8)
+
     def handle_events(self) -> None:
         """处理游戏事件。
 
         处理用户输入和系统事件，包括退出游戏、发射子弹、重新开始等。
+        影响游戏逻辑的事件（射击、重新开始）不立即执行，而是记录到
+        pending_events 中，由下一个逻辑帧 tick() 应用并录制，因此渲染帧率
+        不影响模拟结果，回放也能逐帧复现。
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 # 用户点击关闭按钮
                 self.running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and not self.game_over and not AUTO_FIRE:
+                if event.key == pygame.K_SPACE and not self.game_over and not self.config.AUTO_FIRE:
                     # 空格键发射子弹（仅在非自动发射模式且游戏进行中）
-                    self._handle_player_shoot()
+                    self.pending_events |= EVENT_SHOOT
                 elif event.key == pygame.K_r and self.game_over:
                     # R键重新开始游戏（仅在游戏结束时）
-                    self.restart_game()
+                    self.pending_events |= EVENT_RESTART
+                elif event.key == pygame.K_F3:
+                    # F3键切换帧时间分析叠加层
+                    self.toggle_profiler_overlay()
+            elif event.type == pygame.VIDEOEXPOSE and self.dirty_rects is not None:
+                # 窗口被遮挡后重新显示，需要整屏刷新
+                self.dirty_rects.invalidate()
 
     def _handle_player_shoot(self) -> None:
         """处理玩家发射子弹。
 
-        检查玩家是否可以发射子弹，如果可以则创建新的子弹对象并播放音效。
+        检查玩家是否可以发射子弹，如果可以则在子弹池中生成子弹并播放音效。
         支持双发子弹模式（1.1.0新增）。
         """
         bullet_positions = self.player.shoot()  # 现在返回位置列表
         if bullet_positions:
-            # 为每个子弹位置创建子弹对象
+            # 为每个子弹位置在子弹池中生成子弹
             for bullet_pos in bullet_positions:
-                bullet: Bullet = Bullet(bullet_pos[0], bullet_pos[1], "player")
-                self.player_bullets.append(bullet)
+                self.player_bullets.spawn(bullet_pos[0], bullet_pos[1])
 
             # 播放射击音效 - 1.1.0更新
             self.sound_manager.play_shot()
@@ -180,20 +348,16 @@ class Game:
         根据设定的概率随机生成敌机。敌机类型和位置都是随机的，
         小型敌机的生成概率比中型敌机更高。
         """
-        if random.random() < ENEMY_SPAWN_RATE:
+        rng = self.rng.spawn
+        if rng.random() < self.enemy_spawn_rate:
             # 随机选择敌机类型（70%概率生成小型敌机）
-            enemy_type: EnemyType = "small" if random.random() < 0.7 else "medium"
+            enemy_type: EnemyType = "small" if rng.random() < 0.7 else "medium"
 
-            # 根据敌机类型随机生成x坐标
-            if enemy_type == "small":
-                max_x: int = SCREEN_WIDTH - ENEMY_SMALL_WIDTH
-            else:
-                max_x = SCREEN_WIDTH - ENEMY_MEDIUM_WIDTH
-
-            enemy_x: int = random.randint(0, max_x)
+            # 根据敌机类型随机生成x坐标（上限是配置的派生值）
+            enemy_x: int = rng.randint(0, self.config.enemy_types[enemy_type]["max_x"])
 
             # 创建敌机（从屏幕上方进入）
-            enemy: Enemy = Enemy(enemy_x, -50, enemy_type)
+            enemy: Enemy = Enemy(enemy_x, -50, enemy_type, rng=self.rng.enemy, config=self.config)
             self.enemies.append(enemy)
 
             # 播放敌机出现音效
@@ -202,33 +366,25 @@ class Game:
     def update_bullets(self) -> None:
         """更新所有子弹。
 
-        更新玩家子弹和敌机子弹的位置，移除飞出屏幕的子弹以节省内存。
-        使用切片副本遍历列表，避免在遍历过程中修改列表导致的问题。
+        子弹池以向量化方式推进所有子弹，并用一次掩码移除飞出屏幕的子弹。
         """
-        # 更新玩家子弹
-        for bullet in self.player_bullets[:]:  # 使用切片副本
-            bullet.update()
-            if bullet.is_off_screen():
-                self.player_bullets.remove(bullet)
-
-        # 更新敌机子弹
-        for bullet in self.enemy_bullets[:]:  # 使用切片副本
-            bullet.update()
-            if bullet.is_off_screen():
-                self.enemy_bullets.remove(bullet)
+        self.player_bullets.update()
+        self.enemy_bullets.update()
 
     def update_enemies(self) -> None:
         """更新所有敌机。
 
         更新敌机位置，处理敌机发射子弹，移除飞出屏幕的敌机。
         当敌机飞出屏幕时，玩家会失去一条生命。
+        飞出屏幕的敌机先被标记删除，遍历结束后统一压缩。
         """
-        for enemy in self.enemies[:]:  # 使用切片副本
+        enemies = self.enemies
+        for index, enemy in enemies.indexed():
             enemy.update()
 
             # 检查敌机是否飞出屏幕
             if enemy.is_off_screen():
-                self.enemies.remove(enemy)
+                enemies.kill(index)
                 # 敌机逃脱，玩家失去一条生命
                 self.player.take_damage()
                 continue
@@ -236,6 +392,8 @@ class Game:
             # 处理敌机发射子弹
             self._handle_enemy_shoot(enemy)
 
+        enemies.compact()
+
     def _handle_enemy_shoot(self, enemy: Enemy) -> None:
         """处理敌机发射子弹。
 
@@ -246,8 +404,7 @@ class Game:
         """
         bullet_pos: Optional[tuple[int, int]] = enemy.shoot()
         if bullet_pos:
-            bullet: Bullet = Bullet(bullet_pos[0], bullet_pos[1], "enemy")
-            self.enemy_bullets.append(bullet)
+            self.enemy_bullets.spawn(bullet_pos[0], bullet_pos[1])
 
     def check_collisions(self) -> None:
         """检查所有碰撞。
@@ -266,36 +423,65 @@ class Game:
         如果敌机生命值归零，则敌机被摧毁，玩家获得分数。
         1.1.0新增：音效和道具生成。
         """
-        for bullet in self.player_bullets[:]:
-            for enemy in self.enemies[:]:
-                if bullet.rect.colliderect(enemy.rect):
-                    # 移除子弹
-                    self.player_bullets.remove(bullet)
-
-                    # 播放敌机被击中音效 - 1.1.0新增
-                    if enemy.enemy_type == "small":
-                        self.sound_manager.play_hit_small()
-                    else:
-                        self.sound_manager.play_hit_medium()
+        bullets = self.player_bullets
+        enemies = self.enemies
+        if bullets.count == 0 or not enemies:
+            return
+
+        # 粗筛：把敌机放入空间网格，只有与敌机共享格子的子弹才进入精确检测
+        boxes = entity_boxes(enemies)
+        grid = self.enemy_grid
+        grid.clear()
+        grid.insert_many(boxes)
+
+        xs = bullets.x[:bullets.count]
+        ys = bullets.y[:bullets.count]
+        candidates = np.flatnonzero(grid.candidate_mask(xs, ys, bullets.width, bullets.height))
+        if len(candidates) == 0:
+            return
+
+        # 精确检测：候选子弹与全部敌机一次广播求交，并按子弹顺序解析首个命中
+        overlap = overlap_matrix(
+            xs[candidates], ys[candidates], bullets.width, bullets.height,
+            boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+        )
+        hp = np.array([enemy.hp for enemy in enemies], dtype=np.int64)
+        hits = first_hits(overlap, hp)
+
+        for i, index in zip(candidates.tolist(), hits.tolist()):
+            if index < 0:
+                continue
+            enemy = enemies[index]
+
+            # 移除子弹
+            bullets.kill(i)
 
-                    # 敌机受伤
-                    enemy.take_damage()
-                    if not enemy.is_alive():
-                        # 记录敌机位置和类型用于道具生成
-                        enemy_x, enemy_y = enemy.x, enemy.y
-                        enemy_type = enemy.enemy_type
+            # 播放敌机被击中音效 - 1.1.0新增
+            if enemy.enemy_type == "small":
+                self.sound_manager.play_hit_small()
+            else:
+                self.sound_manager.play_hit_medium()
+
+            # 敌机受伤
+            enemy.take_damage()
+            if not enemy.is_alive():
+                # 记录敌机位置和类型用于道具生成
+                enemy_x, enemy_y = enemy.x, enemy.y
+                enemy_type = enemy.enemy_type
 
-                        # 敌机被摧毁，增加分数并移除敌机
-                        self.score += enemy.score
-                        self.enemies.remove(enemy)
+                # 敌机被摧毁，增加分数并标记删除
+                self.score += enemy.score
+                self.kills[enemy_type] += 1
+                enemies.kill(index)
 
-                        # 播放爆炸音效 - 1.1.0更新
-                        self.sound_manager.play_explosion()
+                # 播放爆炸音效 - 1.1.0更新
+                self.sound_manager.play_explosion()
 
-                        # 生成道具 - 1.1.0新增
-                        self.item_manager.spawn_item(enemy_x, enemy_y, enemy_type)
+                # 生成道具 - 1.1.0新增
+                self.item_manager.spawn_item(enemy_x, enemy_y, enemy_type)
 
-                    break  # 子弹已被移除，跳出内层循环
+        bullets.compact()
+        enemies.compact()
 
     def _check_enemy_bullet_player_collision(self) -> None:
         """检查敌机子弹与玩家的碰撞。
@@ -303,14 +489,22 @@ class Game:
         当敌机子弹击中玩家时，子弹消失，玩家受伤。
         1.1.0新增：音效支持。
         """
-        for bullet in self.enemy_bullets[:]:
-            if bullet.rect.colliderect(self.player.rect):
-                self.enemy_bullets.remove(bullet)
-                # 检查是否实际受到伤害（护盾可能抵挡）
-                if self.player.take_damage():
-                    # 播放玩家被击中音效 - 1.1.0新增
-                    self.sound_manager.play_player_hit()
-                break  # 只处理一颗子弹的碰撞
+        bullets = self.enemy_bullets
+        if bullets.count == 0:
+            return
+
+        # 只处理一颗子弹的碰撞：取第一颗与玩家相交的子弹
+        hit = first_index(overlap_rect(
+            bullets.x[:bullets.count], bullets.y[:bullets.count],
+            bullets.width, bullets.height, self.player.rect
+        ))
+        if hit >= 0:
+            bullets.kill(hit)
+            bullets.compact()
+            # 检查是否实际受到伤害（护盾可能抵挡）
+            if self.player.take_damage():
+                # 播放玩家被击中音效 - 1.1.0新增
+                self.sound_manager.play_player_hit()
 
     def _check_enemy_player_collision(self) -> None:
         """检查敌机与玩家的碰撞。
@@ -318,14 +512,21 @@ class Game:
         当敌机直接撞击玩家时，敌机消失，玩家受伤。
         1.1.0新增：音效支持。
         """
-        for enemy in self.enemies[:]:
-            if enemy.rect.colliderect(self.player.rect):
-                self.enemies.remove(enemy)
-                # 检查是否实际受到伤害（护盾可能抵挡）
-                if self.player.take_damage():
-                    # 播放玩家被击中音效 - 1.1.0新增
-                    self.sound_manager.play_player_hit()
-                break  # 只处理一个敌机的碰撞
+        if not self.enemies:
+            return
+
+        # 只处理一个敌机的碰撞：取第一个与玩家相交的敌机
+        boxes = entity_boxes(self.enemies)
+        hit = first_index(overlap_rect(
+            boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3], self.player.rect
+        ))
+        if hit >= 0:
+            self.enemies.kill(hit)
+            self.enemies.compact()
+            # 检查是否实际受到伤害（护盾可能抵挡）
+            if self.player.take_damage():
+                # 播放玩家被击中音效 - 1.1.0新增
+                self.sound_manager.play_player_hit()
 
     def update_game(self) -> None:
         """更新游戏状态。
@@ -333,32 +534,46 @@ class Game:
         在游戏进行中时，更新所有游戏对象的状态，包括玩家、敌机、子弹等。
         检查碰撞并处理游戏结束条件。
         """
+        self.last_keys_pressed = None
         if not self.game_over:
-            # 获取当前按键状态
-            keys_pressed: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+            # 模拟时钟前进一个逻辑帧
+            self.sim_clock.advance()
+
+            # 从输入源获取当前按键状态
+            keys_pressed = self.input_source.get_pressed()
+            self.last_keys_pressed = keys_pressed
+
+            profiler = self.profiler
 
             # 更新玩家状态
             self.player.update(keys_pressed)
 
             # 自动发射子弹（如果启用）
-            if AUTO_FIRE:
+            if self.config.AUTO_FIRE:
                 self._handle_player_shoot()
+            profiler.lap("player")
 
             # 生成新的敌机
             self.spawn_enemies()
+            profiler.lap("spawn")
 
             # 更新所有游戏对象
             self.update_bullets()
+            profiler.lap("bullets")
             self.update_enemies()
+            profiler.lap("enemies")
 
             # 更新道具系统 - 1.1.0新增
             self.item_manager.update()
+            profiler.lap("items")
 
             # 检查所有碰撞
             self.check_collisions()
+            profiler.lap("collisions")
 
             # 检查道具碰撞 - 1.1.0新增
             self.check_item_collisions()
+            profiler.lap("item_collisions")
 
             # 检查游戏结束条件
             if not self.player.is_alive():
@@ -370,62 +585,64 @@ class Game:
         """绘制用户界面。
 
         在屏幕上绘制分数、生命值和操作提示等UI元素。
+        文字表面来自缓存，只有显示内容变化时才重新渲染；道具计时器按
+        显示精度（0.1秒）格式化，每0.1秒才产生一次新的文字。
         """
         if self.font is not None:
             try:
                 # 绘制当前分数
-                score_text: pygame.Surface = self.font.render(
-                    f"Score: {self.score}", True, WHITE
+                score_text: pygame.Surface = self.text_cache.render(
+                    f"Score: {self.score}", WHITE
                 )
-                self.screen.blit(score_text, (10, 10))
+                self._mark_dirty(self.screen.blit(score_text, (10, 10)))
 
                 # 绘制剩余生命值（如果生命值很大，显示为无敌模式）
                 if self.player.lives >= 999999999:
-                    lives_text: pygame.Surface = self.font.render(
-                        "Lives: ∞ (INVINCIBLE)", True, WHITE
+                    lives_text: pygame.Surface = self.text_cache.render(
+                        "Lives: ∞ (INVINCIBLE)", WHITE
                     )
                 else:
-                    lives_text: pygame.Surface = self.font.render(
-                        f"Lives: {self.player.lives}", True, WHITE
+                    lives_text: pygame.Surface = self.text_cache.render(
+                        f"Lives: {self.player.lives}", WHITE
                     )
-                self.screen.blit(lives_text, (10, 50))
+                self._mark_dirty(self.screen.blit(lives_text, (10, 50)))
 
                 # 绘制生命值（新的健康系统） - 1.1.0新增
-                health_text: pygame.Surface = self.font.render(
-                    f"Health: {self.player.health}/{self.player.max_health}", True, WHITE
+                health_text: pygame.Surface = self.text_cache.render(
+                    f"Health: {self.player.health}/{self.player.max_health}", WHITE
                 )
-                self.screen.blit(health_text, (10, 90))
+                self._mark_dirty(self.screen.blit(health_text, (10, 90)))
 
                 # 绘制道具效果状态 - 1.1.0新增
                 power_status = self.player.get_power_up_status()
                 y_offset = 130
 
                 if power_status['double_shot']['active']:
-                    double_shot_text = self.font.render(
+                    double_shot_text = self.text_cache.render(
                         f"Double Shot: {power_status['double_shot']['remaining']:.1f}s",
-                        True, YELLOW
+                        YELLOW
                     )
-                    self.screen.blit(double_shot_text, (SCREEN_WIDTH - 250, y_offset))
+                    self._mark_dirty(self.screen.blit(double_shot_text, (self.config.SCREEN_WIDTH - 250, y_offset)))
                     y_offset += 30
 
                 if power_status['shield']['active']:
-                    shield_text = self.font.render(
+                    shield_text = self.text_cache.render(
                         f"Shield: {power_status['shield']['remaining']:.1f}s",
-                        True, (0, 150, 255)
+                        (0, 150, 255)
                     )
-                    self.screen.blit(shield_text, (SCREEN_WIDTH - 250, y_offset))
+                    self._mark_dirty(self.screen.blit(shield_text, (self.config.SCREEN_WIDTH - 250, y_offset)))
 
                 # 绘制操作提示（仅在游戏进行中显示）
                 if not self.game_over:
-                    if AUTO_FIRE:
-                        hint_text: pygame.Surface = self.font.render(
-                            "Arrow keys to move, Auto-firing 1000 bullets/sec", True, WHITE
+                    if self.config.AUTO_FIRE:
+                        hint_text: pygame.Surface = self.text_cache.render(
+                            "Arrow keys to move, Auto-firing 1000 bullets/sec", WHITE
                         )
                     else:
-                        hint_text: pygame.Surface = self.font.render(
-                            "Arrow keys to move, Space to shoot", True, WHITE
+                        hint_text: pygame.Surface = self.text_cache.render(
+                            "Arrow keys to move, Space to shoot", WHITE
                         )
-                    self.screen.blit(hint_text, (10, SCREEN_HEIGHT - 30))
+                    self._mark_dirty(self.screen.blit(hint_text, (10, self.config.SCREEN_HEIGHT - 30)))
             except Exception as e:
                 # 字体渲染失败，使用图形替代
                 self._draw_ui_fallback()
@@ -434,77 +651,73 @@ class Game:
             self._draw_ui_fallback()
 
     def _draw_ui_fallback(self) -> None:
-        """当字体不可用时的UI绘制替代方案。"""
-        # 绘制分数区域（白色矩形）
-        pygame.draw.rect(self.screen, WHITE, (10, 10, 150, 25))
-        pygame.draw.rect(self.screen, BLACK, (12, 12, 146, 21))
+        """当字体不可用时的UI绘制替代方案。
 
-        # 用小矩形表示分数（每10分一个小矩形）
-        score_rects = min(self.score // 10, 14)  # 最多14个矩形
-        for i in range(score_rects):
-            pygame.draw.rect(self.screen, WHITE, (15 + i * 10, 15, 8, 15))
+        每个区域（白色边框及其中的内容）是一个缓存图层，只有显示的数量
+        变化时才重新绘制。
+        """
+        layers = self.layers
+
+        # 绘制分数区域（用小矩形表示分数，每10分一个，最多14个）
+        score_rects = min(self.score // 10, 14)
+        score_box = layers.get("ui_score", score_rects, (150, 25),
+                               lambda surface: _draw_count_box(surface, WHITE, score_rects))
+        self._mark_dirty(self.screen.blit(score_box, (10, 10)))
 
         # 绘制生命值区域
         if self.player.lives >= 9999999999:
-            # 无敌模式显示
-            pygame.draw.rect(self.screen, WHITE, (10, 50, 180, 25))
-            pygame.draw.rect(self.screen, BLACK, (12, 52, 176, 21))
-            # 绘制无敌符号（金色矩形）
-            pygame.draw.rect(self.screen, YELLOW, (15, 55, 170, 15))
+            # 无敌模式显示（金色矩形）
+            lives_box = layers.get("ui_lives", "invincible", (180, 25), _draw_invincible_box)
         else:
-            pygame.draw.rect(self.screen, WHITE, (10, 50, 120, 25))
-            pygame.draw.rect(self.screen, BLACK, (12, 52, 116, 21))
             # 用心形（小矩形）表示生命值（最多显示10个）
             lives_to_show = min(self.player.lives, 10)
-            for i in range(lives_to_show):
-                pygame.draw.rect(self.screen, RED, (15 + i * 10, 55, 8, 15))
+            lives_box = layers.get("ui_lives", lives_to_show, (120, 25),
+                                   lambda surface: _draw_count_box(surface, RED, lives_to_show))
+        self._mark_dirty(self.screen.blit(lives_box, (10, 50)))
 
         # 绘制操作提示区域（仅在游戏进行中）
         if not self.game_over:
-            if AUTO_FIRE:
-                pygame.draw.rect(self.screen, WHITE, (10, SCREEN_HEIGHT - 35, 400, 25))
-                pygame.draw.rect(self.screen, BLACK, (12, SCREEN_HEIGHT - 33, 396, 21))
-            else:
-                pygame.draw.rect(self.screen, WHITE, (10, SCREEN_HEIGHT - 35, 300, 25))
-                pygame.draw.rect(self.screen, BLACK, (12, SCREEN_HEIGHT - 33, 296, 21))
+            width = 400 if self.config.AUTO_FIRE else 300
+            hint_box = layers.get("ui_hint", width, (width, 25), _draw_empty_box)
+            self._mark_dirty(self.screen.blit(hint_box, (10, self.config.SCREEN_HEIGHT - 35)))
 
     def draw_game_over(self) -> None:
         """绘制游戏结束界面。
 
         在游戏结束时显示半透明遮罩、最终分数和重新开始提示。
         """
-        # 创建半透明黑色遮罩
-        overlay: pygame.Surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)  # 设置透明度
-        overlay.fill(BLACK)
+        # 半透明黑色遮罩（缓存图层，只创建一次）
+        overlay: pygame.Surface = self.layers.get(
+            "game_over_dim", None, (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT), _build_dim_overlay
+        )
         self.screen.blit(overlay, (0, 0))
 
         if self.big_font is not None and self.font is not None:
             try:
                 # 绘制"游戏结束"标题
-                game_over_text: pygame.Surface = self.big_font.render(
-                    "GAME OVER", True, WHITE
+                game_over_text: pygame.Surface = self.big_text_cache.render(
+                    "GAME OVER", WHITE
                 )
                 text_rect: pygame.Rect = game_over_text.get_rect(
-                    center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
+                    center=(self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2 - 50)
                 )
                 self.screen.blit(game_over_text, text_rect)
 
                 # 绘制最终分数
-                final_score_text: pygame.Surface = self.font.render(
-                    f"Final Score: {self.score}", True, WHITE
+                final_score_text: pygame.Surface = self.text_cache.render(
+                    f"Final Score: {self.score}", WHITE
                 )
                 score_rect: pygame.Rect = final_score_text.get_rect(
-                    center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+                    center=(self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2)
                 )
                 self.screen.blit(final_score_text, score_rect)
 
                 # 绘制重新开始提示
-                restart_text: pygame.Surface = self.font.render(
-                    "Press R to Restart", True, WHITE
+                restart_text: pygame.Surface = self.text_cache.render(
+                    "Press R to Restart", WHITE
                 )
                 restart_rect: pygame.Rect = restart_text.get_rect(
-                    center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
+                    center=(self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2 + 50)
                 )
                 self.screen.blit(restart_text, restart_rect)
             except Exception as e:
@@ -515,40 +728,50 @@ class Game:
             self._draw_game_over_fallback()
 
     def _draw_game_over_fallback(self) -> None:
-        """当字体不可用时的游戏结束界面替代方案。"""
-        center_x = SCREEN_WIDTH // 2
-        center_y = SCREEN_HEIGHT // 2
-
-        # 绘制"GAME OVER"（用大矩形表示）
-        pygame.draw.rect(self.screen, WHITE, (center_x - 150, center_y - 70, 300, 50))
-        pygame.draw.rect(self.screen, RED, (center_x - 145, center_y - 65, 290, 40))
-
-        # 绘制分数区域
-        pygame.draw.rect(self.screen, WHITE, (center_x - 100, center_y - 10, 200, 30))
-        pygame.draw.rect(self.screen, BLACK, (center_x - 95, center_y - 5, 190, 20))
-
-        # 用小矩形表示分数
-        score_rects = min(self.score // 10, 18)  # 最多18个矩形
-        for i in range(score_rects):
-            pygame.draw.rect(self.screen, WHITE, (center_x - 90 + i * 10, center_y - 2, 8, 14))
+        """当字体不可用时的游戏结束界面替代方案。
 
-        # 绘制重新开始提示区域
-        pygame.draw.rect(self.screen, WHITE, (center_x - 120, center_y + 40, 240, 30))
-        pygame.draw.rect(self.screen, GREEN, (center_x - 115, center_y + 45, 230, 20))
+        三个区域合成在一个透明图层中，只有分数矩形的数量变化时才重新绘制。
+        """
+        # 用小矩形表示分数（最多18个矩形）
+        score_rects = min(self.score // 10, 18)
+        panel = self.layers.get(
+            "game_over_fallback", score_rects, (300, 140),
+            lambda surface: _draw_game_over_panel(surface, score_rects), alpha=True
+        )
+        self.screen.blit(panel, (self.config.SCREEN_WIDTH // 2 - 150, self.config.SCREEN_HEIGHT // 2 - 70))
 
-    def restart_game(self) -> None:
+    def restart_game(self, seed: Optional[int] = None,
+                     config: Optional[GameConfig] = None) -> None:
         """重新开始游戏。
 
         重置所有游戏状态，包括分数、玩家状态和所有游戏对象列表。
+        指定种子时，同时重置随机数流和模拟时钟，开始一局可复现的新游戏；
+        否则随机数流继续使用，整个会话仍然可以由最初的种子复现。
+        指定配置时，新一局使用该配置（见 _apply_config）。
+
+        Args:
+            seed (Optional[int]): 新一局的随机种子，默认沿用当前随机数流
+            config (Optional[GameConfig]): 新一局的运行时配置，默认沿用当前配置
+
+        Raises:
+            ValueError: 有窗口时新配置改变了屏幕尺寸
         """
+        if config is not None:
+            self._apply_config(config)
+
         # 重置游戏状态
         self.game_over = False
         self.score = 0
+        self.kills = {"small": 0, "medium": 0}
+        self.items_collected = 0
+
+        if seed is not None:
+            self.rng.reseed(seed)
+            self.sim_clock.reset()
 
         # 重新创建玩家对象
-        player_x: int = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
-        player_y: int = SCREEN_HEIGHT - PLAYER_HEIGHT - 20
-        self.player = Player(player_x, player_y)
+        player_x, player_y = self.config.player_start
+        self.player = Player(player_x, player_y, clock=self.sim_clock, config=self.config)
 
         # 清空所有游戏对象列表
         self.enemies.clear()
@@ -558,77 +781,358 @@ class Game:
         # 清空道具列表 - 1.1.0新增
         self.item_manager.clear()
 
+        # 每局的第一发射击都播放音效
+        self.sound_manager.reset_shot_count()
+
         # 播放游戏开始音效 - 1.1.0新增
         self.sound_manager.play_start()
 
-    def draw(self) -> None:
+    def _apply_config(self, config: GameConfig) -> None:
+        """切换运行时配置（在两局之间由 restart_game 调用）。
+
+        子弹池、敌机网格和道具管理器按新配置重建，精灵图集补充新尺寸的精灵；
+        玩家在 restart_game 中按新配置重新创建。无窗口模式下屏幕尺寸变化时
+        重新创建离屏表面。
+
+        Args:
+            config (GameConfig): 新配置
+
+        Raises:
+            ValueError: 有窗口时新配置改变了屏幕尺寸
+        """
+        if config is self.config:
+            return
+        size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        resized = size != (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
+        if resized and not self.headless:
+            raise ValueError("the screen size can only change in headless mode")
+
+        self.config = config
+        self.enemy_spawn_rate = config.ENEMY_SPAWN_RATE
+        if resized:
+            self.screen = pygame.Surface(size)
+            self.enemy_grid = SpatialGrid(*size)
+            if self.dirty_rects is not None:
+                self.set_dirty_rect_rendering(False)
+                self.set_dirty_rect_rendering(True)
+
+        self.player_bullets = BulletPool("player", self.player_bullets.capacity, config)
+        self.enemy_bullets = BulletPool("enemy", self.enemy_bullets.capacity, config)
+        self.item_manager.set_config(config)
+        self.atlas.build(config)
+
+    def draw(self, alpha: float = 1.0) -> None:
         """绘制游戏画面。
 
         清空屏幕并绘制所有游戏对象，包括玩家、敌机、子弹和UI元素。
         如果游戏结束，还会绘制游戏结束界面。
-        """
-        # 用黑色清空屏幕
-        self.screen.fill(BLACK)
-
-        # 仅在游戏进行中绘制游戏对象
-        if not self.game_over:
-            self._draw_game_objects()
 
-        # 绘制用户界面
-        self.draw_ui()
+        alpha 是渲染时刻在上一逻辑帧和当前逻辑帧之间的位置 (0.0 - 1.0)，
+        实体绘制在两帧位置之间的插值处，渲染帧率高于逻辑帧率时运动依然平滑。
 
-        # 如果游戏结束，绘制游戏结束界面
+        启用脏矩形渲染时，只擦除上一帧绘制过的区域，并只把变化的区域
+        推送到显示器；变化面积过大或绘制了全屏遮罩时退回整屏刷新。
+        """
+        dirty = self.dirty_rects
         if self.game_over:
+            # 游戏结束画面是静态的：整屏从缓存图层合成，只在内容变化时推送整屏
+            changed = self._draw_game_over_screen()
+            if dirty is not None and (changed or not self._game_over_drawn):
+                dirty.invalidate()
+            self._game_over_drawn = True
+        else:
+            if dirty is not None and self._game_over_drawn:
+                # 刚离开游戏结束画面，屏幕上都是未记录的内容
+                dirty.full_redraw = True
+            self._game_over_drawn = False
+
+            if dirty is None or dirty.full_redraw:
+                # 用黑色清空屏幕
+                self.screen.fill(BLACK)
+            else:
+                # 只擦除上一帧绘制过的区域
+                dirty.erase(self.screen)
+
+            # 绘制游戏对象和用户界面
+            self._draw_game_objects(alpha)
+            self.draw_ui()
+
+        # 绘制帧时间分析叠加层
+        if self.show_profiler_overlay:
+            self._draw_profiler_overlay()
+        self.profiler.lap("draw")
+
+        # 更新显示缓冲区到屏幕（无窗口模式只绘制到离屏表面）
+        rects = dirty.end_frame() if dirty is not None else None
+        if not self.headless:
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+        self.profiler.lap("flip")
+
+    def _draw_game_over_screen(self) -> bool:
+        """绘制游戏结束画面（用户界面 + 半透明遮罩 + 结束文字）。
+
+        游戏结束后模拟停止，画面内容只取决于界面上显示的状态，因此整个
+        画面缓存为一个图层，状态不变时每帧只需一次整屏 blit。
+
+        Returns:
+            bool: 本帧是否重新构建了画面
+        """
+        power_status = self.player.get_power_up_status()
+        key = (
+            self.score, self.player.lives, self.player.health, self.player.max_health,
+            self.font is not None, self.big_font is not None,
+            power_status['double_shot']['active'], f"{power_status['double_shot']['remaining']:.1f}",
+            power_status['shield']['active'], f"{power_status['shield']['remaining']:.1f}",
+        )
+        builds = self.layers.builds
+
+        def build(surface: pygame.Surface) -> None:
+            self.screen.fill(BLACK)
+            self.draw_ui()
             self.draw_game_over()
+            surface.blit(self.screen, (0, 0))
 
-        # 更新显示缓冲区到屏幕
-        pygame.display.flip()
+        layer = self.layers.get("game_over_screen", key, self.screen.get_size(), build)
+        changed = self.layers.builds != builds
+        if not changed:
+            self.screen.blit(layer, (0, 0))
+        return changed
 
-    def _draw_game_objects(self) -> None:
-        """绘制所有游戏对象。
+    def _mark_dirty(self, rect: pygame.Rect) -> None:
+        """记录本帧绘制影响的矩形（未启用脏矩形渲染时不做任何事）。
 
-        绘制玩家飞机、所有敌机和所有子弹。
+        Args:
+            rect (pygame.Rect): blit() 或 pygame.draw.*() 返回的矩形
         """
-        # 绘制玩家飞机
-        self.player.draw(self.screen)
+        if self.dirty_rects is not None:
+            self.dirty_rects.add(rect)
 
-        # 绘制所有敌机
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+    def set_dirty_rect_rendering(self, enabled: bool) -> None:
+        """启用或关闭脏矩形渲染。
 
-        # 绘制所有子弹
-        for bullet in self.player_bullets:
-            bullet.draw(self.screen)
-        for bullet in self.enemy_bullets:
-            bullet.draw(self.screen)
+        Args:
+            enabled (bool): 是否启用
+        """
+        if not enabled:
+            self.dirty_rects = None
+            return
+        if self.dirty_rects is None:
+            background = self.layers.get(
+                "background", BLACK, (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT),
+                lambda surface: surface.fill(BLACK)
+            )
+            self.dirty_rects = DirtyRectTracker(
+                self.screen.get_rect(), background,
+                DIRTY_RECT_FULL_FLIP_RATIO, DIRTY_RECT_RETRY_FRAMES
+            )
+
+    def _draw_game_objects(self, alpha: float = 1.0) -> None:
+        """绘制所有游戏对象。
 
-        # 绘制道具 - 1.1.0新增
-        self.item_manager.draw(self.screen)
+        绘制玩家飞机、所有敌机、所有子弹和道具。所有实体的 (表面, 位置)
+        先按绘制顺序收集到一个序列中，再一次性提交给 Surface.blits()。
+
+        Args:
+            alpha (float): 插值系数，1.0 表示各实体的当前位置
+        """
+        batch = self.render_batch
+        batch.clear()
+
+        # 玩家飞机、敌机、子弹、道具（后加入的覆盖在上面）
+        batch.add(*self.player.sprite(alpha))
+        batch.extend([enemy.sprite(alpha) for enemy in self.enemies])
+        batch.extend(self.player_bullets.sprites(alpha))
+        batch.extend(self.enemy_bullets.sprites(alpha))
+        batch.extend(self.item_manager.sprites(alpha))
+
+        dirty = self.dirty_rects
+        if dirty is not None and dirty.tracking:
+            dirty.add_many(batch.submit(self.screen, return_rects=True))
+        else:
+            batch.submit(self.screen)
 
     def check_item_collisions(self) -> None:
         """检查道具与玩家的碰撞 - 1.1.0新增"""
         collected_items = self.item_manager.check_collision(self.player.rect)
+        self.items_collected += len(collected_items)
         for item in collected_items:
             # 应用道具效果
             if item.apply_effect(self.player):
                 # 播放道具拾取音效
                 self.sound_manager.play_item_pick()
 
+    def tick(self) -> None:
+        """推进一个固定步长的逻辑帧。
+
+        先应用上一逻辑帧之后收到的事件（与 ReplayPlayer.step 的顺序一致），
+        再更新游戏状态，并在录制时记录本逻辑帧的输入。
+        """
+        events = self.pending_events
+        self.pending_events = 0
+        self.frame_events = events
+        if events & EVENT_RESTART and self.game_over:
+            self.restart_game()
+        if events & EVENT_SHOOT and not self.game_over:
+            self._handle_player_shoot()
+
+        # 更新游戏逻辑和对象状态
+        self.update_game()
+
+        # 记录本逻辑帧输入（用于回放）
+        if self.recorder is not None:
+            self.recorder.record_frame(self.last_keys_pressed, events)
+
     def run(self) -> None:
         """运行游戏主循环。
 
-        这是游戏的核心循环，持续处理事件、更新游戏状态和绘制画面，
-        直到用户退出游戏。循环的每次迭代代表游戏的一帧。
+        模拟和渲染解耦（固定步长累加器）：经过的真实时间累加起来，每满
+        1/FPS 秒运行一次 tick()，因此游戏速度与渲染帧率无关；渲染以显示允许
+        的速度进行（最高 MAX_RENDER_FPS），实体绘制在相邻两个逻辑帧之间的
+        插值位置。
+
+        渲染严重变慢时，每个渲染帧最多补跑 MAX_TICKS_PER_FRAME 个逻辑帧，
+        多出的时间直接丢弃（游戏暂时变慢），避免补帧越补越多的死亡螺旋。
         """
+        step = 1.0 / FPS
+        max_lag = step * MAX_TICKS_PER_FRAME
+        lag = 0.0
+        previous = time.perf_counter()
+
         while self.running:
+            self.profiler.begin_frame()
+
             # 处理用户输入和系统事件
             self.handle_events()
+            self.profiler.lap("events")
+
+            now = time.perf_counter()
+            lag = min(lag + now - previous, max_lag)
+            previous = now
+
+            # 按固定步长推进模拟
+            while lag >= step:
+                self.tick()
+                lag -= step
+
+            # 绘制当前帧的画面（插值到两个逻辑帧之间）
+            self.draw(lag / step)
+            self.profiler.end_frame(self.entity_counts())
+
+            # 限制渲染帧率
+            self.clock.tick(MAX_RENDER_FPS)
+
+        # 退出时写出帧时间分析结果
+        if self.profile_dump_path and self.profiler.enabled:
+            self.profiler.dump(self.profile_dump_path)
+
+        # 退出时一次性写入游戏过程中合成的音效
+        self.sound_manager.flush_cache()
 
-            # 更新游戏逻辑和对象状态
-            self.update_game()
+    def entity_counts(self) -> dict:
+        """获取当前各类实体的数量。
 
-            # 绘制当前帧的画面
-            self.draw()
+        Returns:
+            dict: 敌机、玩家子弹、敌机子弹和道具的数量
+        """
+        return {
+            "enemies": len(self.enemies),
+            "player_bullets": len(self.player_bullets),
+            "enemy_bullets": len(self.enemy_bullets),
+            "items": len(self.item_manager.items),
+        }
+
+    def toggle_profiler_overlay(self) -> None:
+        """切换帧时间分析叠加层。
+
+        分析器未启用时，打开叠加层会临时启用分析器；关闭叠加层后恢复为
+        空操作分析器，由 --profile 或 PROFILER_ENABLED 启用的分析器保持运行。
+        """
+        if not self.profiler.enabled:
+            self.profiler = FrameProfiler(PROFILER_WINDOW)
+            self._overlay_profiler = True
+        elif self.show_profiler_overlay and self._overlay_profiler:
+            self.profiler = NullProfiler()
+            self._overlay_profiler = False
+        self.show_profiler_overlay = not self.show_profiler_overlay
+        self._profiler_overlay_lines = []
+
+    def _draw_profiler_overlay(self) -> None:
+        """绘制帧时间分析叠加层。
+
+        每隔 PROFILER_OVERLAY_REFRESH 帧重新计算分位数并渲染文字，
+        其余帧直接复用上次渲染的文字表面。没有可用字体时用条形图表示p95耗时。
+        """
+        profiler = self.profiler
+        if not self._profiler_overlay_lines or profiler.frames % PROFILER_OVERLAY_REFRESH == 0:
+            stats = profiler.percentiles()
+            counts = self.entity_counts()
+            lines = [(name, stats[name]) for name in profiler.sections + ("total",) if name in stats]
+            if self.font is not None:
+                texts = [f"{name:<16}{v['p50']:6.2f}{v['p95']:7.2f}{v['p99']:7.2f} ms"
+                         for name, v in lines]
+                texts.insert(0, "section           p50    p95    p99")
+                texts.append("E:{enemies} PB:{player_bullets} EB:{enemy_bullets} I:{items}".format(**counts))
+                small_font = getattr(self, "_profiler_font", None)
+                if small_font is None:
+                    small_font = self._profiler_font = pygame.font.Font(None, 20)
+                self._profiler_overlay_lines = [small_font.render(t, True, GREEN) for t in texts]
+            else:
+                self._profiler_overlay_lines = [min(v["p95"], 16.7) for _, v in lines]
+
+        panel = pygame.Rect(self.config.SCREEN_WIDTH - 290, 10, 280, 16 * (len(profiler.sections) + 3) + 8)
+        self._mark_dirty(self.screen.fill(BLACK, panel))
+        pygame.draw.rect(self.screen, GREEN, panel, 1)
+        y = panel.y + 4
+        for line in self._profiler_overlay_lines:
+            if isinstance(line, pygame.Surface):
+                self.screen.blit(line, (panel.x + 6, y))
+            else:
+                # 字体不可用：条形长度表示p95耗时（满格为16.7ms）
+                pygame.draw.rect(self.screen, GREEN, (panel.x + 6, y + 3, int(line / 16.7 * 260), 10))
+            y += 16
+
+    def run_headless(self, max_frames: Optional[int] = None,
+                     time_budget: Optional[float] = None,
+                     stop_on_game_over: bool = True) -> dict:
+        """以无窗口、不限帧率的方式运行模拟。
+
+        尽可能快地反复调用 update_game()，不处理事件、不绘制画面、
+        不调用 clock.tick()，用于测量纯模拟吞吐量和批量模拟对局。
+        max_frames 和 time_budget 都未指定时，运行到游戏结束为止。
+
+        Args:
+            max_frames (Optional[int]): 最多模拟的帧数
+            time_budget (Optional[float]): 最长运行时间（秒）
+            stop_on_game_over (bool): 游戏结束时是否停止，默认为True
+
+        Returns:
+            dict: 运行统计，包含 frames、elapsed、fps、score 和 game_over
+        """
+        if max_frames is None and time_budget is None and not stop_on_game_over:
+            raise ValueError("run_headless needs max_frames, time_budget or stop_on_game_over")
+
+        update_game = self.update_game
+        frames = 0
+        start = time.perf_counter()
+        deadline = start + time_budget if time_budget is not None else None
+
+        while max_frames is None or frames < max_frames:
+            if stop_on_game_over and self.game_over:
+                break
+            update_game()
+            frames += 1
+            # 每64帧检查一次时间，避免计时本身成为开销
+            if deadline is not None and frames & 63 == 0 and time.perf_counter() >= deadline:
+                break
 
-            # 控制游戏帧率
-            self.clock.tick(FPS)
+        elapsed = time.perf_counter() - start
+        return {
+            "frames": frames,
+            "elapsed": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else float("inf"),
+            "score": self.score,
+            "game_over": self.game_over,
+        }
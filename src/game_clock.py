@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""游戏时钟模块。
+
+本模块定义了可注入的游戏时钟。玩家射击冷却、道具效果持续时间等
+计时逻辑都通过时钟对象读取当前时间，而不是直接调用 time.time()。
+
+- WallClock: 读取真实时间，用于单独使用游戏对象的场景（例如组件测试）
+- SimClock: 固定步长的模拟时钟，每次 advance() 前进一个逻辑帧。
+  模拟时间只取决于已经模拟的帧数，与实际运行速度无关，因此无窗口
+  快进模拟和实时游戏的结果完全一致，可以逐位复现。
+
+典型用法示例:
+    clock = SimClock(1.0 / FPS)
+    player = Player(x=400, y=500, clock=clock)
+
+    clock.advance()       # 每个逻辑帧前进一步
+    now = clock.now()     # 当前模拟时间（秒）
+"""
+
+import time
+
+
+class WallClock:
+    """真实时间时钟类，now() 返回 time.time()。"""
+
+    def now(self) -> float:
+        """获取当前时间。
+
+        Returns:
+            float: 当前的真实时间戳（秒）
+        """
+        return time.time()
+
+
+class SimClock:
+    """固定步长的模拟时钟类。
+
+    当前时间由已前进的整数帧数乘以步长得到，不累加浮点误差，
+    相同帧数总是得到完全相同的时间值。
+
+    Attributes:
+        step (float): 每一帧代表的时间（秒）
+        ticks (int): 已经前进的帧数
+    """
+
+    def __init__(self, step: float) -> None:
+        """初始化模拟时钟。
+
+        Args:
+            step (float): 每一帧代表的时间（秒），通常为 1.0 / FPS
+        """
+        self.step: float = step
+        self.ticks: int = 0
+
+    def advance(self, ticks: int = 1) -> None:
+        """让时钟前进若干帧。
+
+        Args:
+            ticks (int): 前进的帧数，默认为1
+        """
+        self.ticks += ticks
+
+    def reset(self) -> None:
+        """把时钟重置到第0帧。"""
+        self.ticks = 0
+
+    def now(self) -> float:
+        """获取当前模拟时间。
+
+        Returns:
+            float: 当前模拟时间（秒）
+        """
+        return self.ticks * self.step
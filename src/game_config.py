@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""运行时配置模块。
+
+config.py 中的常量在导入时被各模块复制，修改后必须重启进程才能生效。
+本模块的 GameConfig 保存一组可以在运行时切换的模拟参数（见 CONFIG_KEYS），
+默认值取自 config.py，可以从 TOML 或 JSON 配置档案覆盖其中一部分：
+
+    # hard.toml
+    ENEMY_SPAWN_RATE = 0.04
+    ENEMY_BULLET_RATE = 0.01
+
+    [ITEM_DROP_TABLES]
+    small = [[0.05, "health"]]
+    medium = [[0.1, "health"], [0.2, "shield"]]
+
+派生值（玩家出生位置和移动边界、子弹发射偏移、各类敌机的属性、生成位置
+范围和子弹发射偏移）在创建配置时计算一次，游戏对象直接读取，不在每帧重新计算。
+GameConfig 创建后不再修改；需要不同的参数时用 replace() 创建新的配置，
+在两局之间通过 Game.restart_game(config=...) 切换，不需要重新导入模块。
+
+颜色、音效、字体、渲染和性能分析等设置只在启动时读取，不属于运行时配置。
+
+典型用法示例:
+    config = load_config("profiles/hard.toml")
+    game.restart_game(seed=1, config=config)
+    easy = config.replace(ENEMY_SPAWN_RATE=0.01)
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+import config as defaults
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 及更早版本
+    tomllib = None
+
+# 运行时可以切换的参数（与 config.py 中的常量同名）
+CONFIG_KEYS: Tuple[str, ...] = (
+    "SCREEN_WIDTH", "SCREEN_HEIGHT",
+    "PLAYER_WIDTH", "PLAYER_HEIGHT", "PLAYER_SPEED", "PLAYER_INITIAL_LIVES",
+    "BULLET_COOLDOWN", "AUTO_FIRE",
+    "ENEMY_SMALL_WIDTH", "ENEMY_SMALL_HEIGHT", "ENEMY_SMALL_SPEED", "ENEMY_SMALL_HP", "ENEMY_SMALL_SCORE",
+    "ENEMY_MEDIUM_WIDTH", "ENEMY_MEDIUM_HEIGHT", "ENEMY_MEDIUM_SPEED", "ENEMY_MEDIUM_HP", "ENEMY_MEDIUM_SCORE",
+    "BULLET_WIDTH", "BULLET_HEIGHT", "PLAYER_BULLET_SPEED", "ENEMY_BULLET_SPEED",
+    "ENEMY_SPAWN_RATE", "ENEMY_BULLET_RATE", "ENEMY_MEDIUM_BULLET_MULTIPLIER",
+    "ITEM_DROP_TABLES",
+)
+
+ITEM_KINDS: Tuple[str, ...] = ("health", "power_up", "shield")  # 掉落表中可用的道具种类
+ENEMY_TYPES: Tuple[str, ...] = ("small", "medium")
+
+DOUBLE_SHOT_SPREAD: int = 15  # 双发子弹相对飞机中心的水平偏移
+PLAYER_BOTTOM_MARGIN: int = 20  # 玩家出生位置距屏幕底部的距离
+
+# 必须为正数的参数（按名称后缀）；其余数值参数（概率、倍数、冷却、分数）不能为负
+POSITIVE_SUFFIXES: Tuple[str, ...] = ("_WIDTH", "_HEIGHT", "_HP", "_SPEED", "_LIVES")
+
+
+def _coerce(key: str, value: Any, default: Any) -> Any:
+    """按默认值的类型检查并转换一个参数值，不合法时抛出 ValueError。"""
+    if key == "ITEM_DROP_TABLES":
+        return _coerce_drop_tables(value)
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError(f"{key} must be a boolean")
+        return value
+    if isinstance(default, int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"{key} must be an integer")
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{key} must be a number")
+    if key.endswith(POSITIVE_SUFFIXES) and value <= 0:
+        raise ValueError(f"{key} must be positive")
+    if value < 0:
+        raise ValueError(f"{key} must not be negative")
+    return value if isinstance(default, int) else float(value)
+
+
+def _coerce_drop_tables(value: Any) -> Dict[str, Tuple[Tuple[float, str], ...]]:
+    """检查并规范化道具掉落表（JSON/TOML 中的列表转换为元组）。"""
+    if not isinstance(value, dict):
+        raise ValueError("ITEM_DROP_TABLES must be a table of enemy types")
+    tables = {}
+    for enemy_type, entries in value.items():
+        if enemy_type not in ENEMY_TYPES:
+            raise ValueError(f"ITEM_DROP_TABLES: unknown enemy type: {enemy_type}")
+        if not isinstance(entries, (list, tuple)):
+            raise ValueError(f"ITEM_DROP_TABLES: {enemy_type} must be a list of [threshold, item] entries")
+        table = []
+        previous = 0.0
+        for entry in entries:
+            if (not isinstance(entry, (list, tuple)) or len(entry) != 2
+                    or isinstance(entry[0], bool) or not isinstance(entry[0], (int, float))
+                    or entry[1] not in ITEM_KINDS):
+                raise ValueError(f"ITEM_DROP_TABLES: bad entry for {enemy_type}: {entry!r}")
+            threshold = float(entry[0])
+            if not 0.0 <= threshold <= 1.0:
+                raise ValueError(f"ITEM_DROP_TABLES: thresholds for {enemy_type} must be in [0, 1]")
+            if threshold < previous:
+                raise ValueError(f"ITEM_DROP_TABLES: thresholds for {enemy_type} must not decrease")
+            previous = threshold
+            table.append((threshold, entry[1]))
+        tables[enemy_type] = tuple(table)
+    return tables
+
+
+class GameConfig:
+    """运行时配置类。
+
+    CONFIG_KEYS 中的每个参数都是同名属性（例如 config.ENEMY_SPAWN_RATE）。
+
+    Attributes:
+        name (str): 配置名称（从文件加载时为文件名）
+        values (Dict[str, Any]): 全部参数
+        player_start (Tuple[int, int]): 玩家出生位置
+        player_max_x (int): 玩家可移动到的最大x坐标
+        player_max_y (int): 玩家可移动到的最大y坐标
+        bullet_offset (int): 单发子弹相对飞机x坐标的偏移
+        double_bullet_offsets (Tuple[int, int]): 双发子弹（左、右）相对飞机x坐标的偏移
+        enemy_types (Dict[str, Dict[str, Any]]): 每种敌机的属性：width、height、speed、
+            hp、score、bullet_rate（已乘以中型敌机倍数）、max_x（生成时x坐标的上限）、
+            bullet_offset（子弹相对敌机的 (dx, dy)）
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None, name: str = "default") -> None:
+        """创建配置。
+
+        Args:
+            overrides (Optional[Dict[str, Any]]): 覆盖默认值的参数
+            name (str): 配置名称
+
+        Raises:
+            ValueError: 参数名不在 CONFIG_KEYS 中，或参数值不合法
+        """
+        values = {key: getattr(defaults, key) for key in CONFIG_KEYS}
+        for key, value in (overrides or {}).items():
+            if key not in values:
+                raise ValueError(f"unknown or non-reloadable config key: {key}")
+            values[key] = _coerce(key, value, values[key])
+        if values["PLAYER_WIDTH"] > values["SCREEN_WIDTH"] or values["PLAYER_HEIGHT"] > values["SCREEN_HEIGHT"]:
+            raise ValueError("the player must fit on the screen")
+
+        self.name: str = name
+        self.values: Dict[str, Any] = values
+        for key, value in values.items():
+            setattr(self, key, value)
+        self._derive()
+
+    def _derive(self) -> None:
+        """计算派生值（每个配置只计算一次）。"""
+        width, height = self.SCREEN_WIDTH, self.SCREEN_HEIGHT
+        self.player_start: Tuple[int, int] = (
+            width // 2 - self.PLAYER_WIDTH // 2,
+            height - self.PLAYER_HEIGHT - PLAYER_BOTTOM_MARGIN,
+        )
+        self.player_max_x: int = width - self.PLAYER_WIDTH
+        self.player_max_y: int = height - self.PLAYER_HEIGHT
+
+        center = self.PLAYER_WIDTH // 2
+        half_bullet = self.BULLET_WIDTH // 2
+        self.bullet_offset: int = center - half_bullet
+        self.double_bullet_offsets: Tuple[int, int] = (
+            center - DOUBLE_SHOT_SPREAD - half_bullet,
+            center + DOUBLE_SHOT_SPREAD - half_bullet,
+        )
+
+        self.enemy_types: Dict[str, Dict[str, Any]] = {}
+        for enemy_type in ENEMY_TYPES:
+            prefix = f"ENEMY_{enemy_type.upper()}_"
+            enemy_width = self.values[prefix + "WIDTH"]
+            enemy_height = self.values[prefix + "HEIGHT"]
+            bullet_rate = self.ENEMY_BULLET_RATE
+            if enemy_type == "medium":
+                bullet_rate = bullet_rate * self.ENEMY_MEDIUM_BULLET_MULTIPLIER
+            self.enemy_types[enemy_type] = {
+                "width": enemy_width,
+                "height": enemy_height,
+                "speed": self.values[prefix + "SPEED"],
+                "hp": self.values[prefix + "HP"],
+                "score": self.values[prefix + "SCORE"],
+                "bullet_rate": bullet_rate,
+                "max_x": max(0, width - enemy_width),
+                "bullet_offset": (enemy_width // 2 - half_bullet, enemy_height),
+            }
+
+    def replace(self, name: Optional[str] = None, **overrides: Any) -> "GameConfig":
+        """创建一个修改了部分参数的新配置（本配置不变）。
+
+        Args:
+            name (Optional[str]): 新配置的名称，默认沿用本配置的名称
+            **overrides: 要修改的参数
+
+        Returns:
+            GameConfig: 新配置
+        """
+        values = dict(self.values)
+        values.update(overrides)
+        return GameConfig(values, name=self.name if name is None else name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """获取所有参数（可以写成 JSON 配置档案）。
+
+        Returns:
+            Dict[str, Any]: 参数名 -> 值
+        """
+        return dict(self.values)
+
+    def __repr__(self) -> str:
+        return f"GameConfig({self.name!r})"
+
+
+DEFAULT_CONFIG: GameConfig = GameConfig()  # config.py 中的默认参数
+
+
+def load_config(path: str) -> GameConfig:
+    """从 TOML 或 JSON 配置档案加载配置，未给出的参数使用默认值。
+
+    Args:
+        path (str): 配置档案路径（.toml 或 .json）
+
+    Returns:
+        GameConfig: 加载的配置，名称为文件名（不含扩展名）
+
+    Raises:
+        ValueError: 文件格式不受支持，或参数不合法
+        OSError: 文件无法读取
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".toml":
+        if tomllib is None:
+            raise ValueError("TOML config files need Python 3.11 or later")
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    elif extension == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        raise ValueError(f"unsupported config file type: {path}")
+    if not isinstance(data, dict):
+        raise ValueError(f"config file must contain a table of parameters: {path}")
+    name = os.path.splitext(os.path.basename(path))[0]
+    return GameConfig(data, name=name)
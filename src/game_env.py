@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""强化学习环境模块。
+
+本模块把无窗口模式的 Game 包装为 gym 风格的环境：reset(seed) 开始新的一局，
+step(action) 推进若干逻辑帧并返回 (观测, 奖励, 是否结束, 信息)。
+
+- 动作空间：离散动作，对应 Player.update 使用的方向键组合（见 ACTION_KEYS）
+- 观测：定长 float32 特征向量，包含玩家状态，以及距离玩家最近的若干敌机、
+  敌机子弹和道具的相对位置（见 OBS_SIZE 和各 *_FEATURES 常量）；
+  observation_type="pixels" 时为 84×84 uint8 灰度画面（见 pixel_obs.py）
+- 奖励：分数增量，减去 hit_penalty × 损失的生命值
+- 配置：reset(seed, config) 可以为新一局切换运行时配置（见 game_config.py），
+  坐标按当前配置的屏幕尺寸归一化
+
+观测向量、按键状态和信息字典都在创建环境时预先分配，step() 原地写入并
+返回同一个对象，每步不创建新的缓冲区。需要保留某一步的观测时请自行复制。
+
+典型用法示例:
+    env = PlaneWarsEnv()
+    obs = env.reset(seed=1)
+    done = False
+    while not done:
+        obs, reward, done, info = env.step(policy(obs))
+"""
+
+import numpy as np
+import pygame
+from typing import Any, Dict, Optional, Tuple
+from game import Game
+from game_config import GameConfig
+from input_source import KeyState, ScriptedInput
+from pixel_obs import PixelRenderer
+
+# 离散动作对应的方向键（与 Player.update 一致）
+ACTION_KEYS: Tuple[Tuple[int, ...], ...] = (
+    (),                                # 0: 不动
+    (pygame.K_LEFT,),                  # 1: 左
+    (pygame.K_RIGHT,),                 # 2: 右
+    (pygame.K_UP,),                    # 3: 上
+    (pygame.K_DOWN,),                  # 4: 下
+    (pygame.K_UP, pygame.K_LEFT),      # 5: 左上
+    (pygame.K_UP, pygame.K_RIGHT),     # 6: 右上
+    (pygame.K_DOWN, pygame.K_LEFT),    # 7: 左下
+    (pygame.K_DOWN, pygame.K_RIGHT),   # 8: 右下
+)
+N_ACTIONS: int = len(ACTION_KEYS)
+
+# 观测中每类实体保留的槽位数（按与玩家的距离从近到远排列，不足的槽位为0）
+MAX_ENEMIES: int = 8
+MAX_ENEMY_BULLETS: int = 16
+MAX_ITEMS: int = 4
+
+# 每个槽位的特征数
+PLAYER_FEATURES: int = 6  # x, y, 生命值比例, 双发子弹, 护盾, 敌机数量比例
+ENEMY_FEATURES: int = 5   # dx, dy, 存在标志, 是否中型敌机, 血量比例
+BULLET_FEATURES: int = 3  # dx, dy, 存在标志
+ITEM_FEATURES: int = 4    # dx, dy, 存在标志, 道具种类编码
+
+OBS_SIZE: int = (PLAYER_FEATURES + MAX_ENEMIES * ENEMY_FEATURES
+                 + MAX_ENEMY_BULLETS * BULLET_FEATURES + MAX_ITEMS * ITEM_FEATURES)
+
+# 观测类型
+OBSERVATION_TYPES: Tuple[str, ...] = ("features", "pixels")
+
+# 道具种类编码
+ITEM_KIND_CODES: Dict[str, float] = {"health": 1 / 3, "power_up": 2 / 3, "shield": 1.0}
+
+
+class PlaneWarsEnv:
+    """飞机大战强化学习环境类（无窗口、无音频）。
+
+    Attributes:
+        game (Game): 被包装的无窗口游戏实例，reset() 时复用
+        frame_skip (int): 每次 step() 推进的逻辑帧数（动作在这些帧中保持不变）
+        max_steps (Optional[int]): 每局最多的步数，达到后 done 为True 并在
+            info["truncated"] 中标记；None表示不限制
+        hit_penalty (float): 每损失1点生命值扣除的奖励
+        observation (numpy.ndarray): 预分配的观测，特征向量形状为 (OBS_SIZE,)，
+            像素观测形状为 (84, 84)
+        renderer (Optional[PixelRenderer]): 像素观测渲染器（特征观测时为None）
+        info (Dict[str, Any]): 预分配的信息字典（score、ticks、health、truncated）
+        steps (int): 本局已执行的步数
+    """
+
+    def __init__(self, seed: Optional[int] = None, frame_skip: int = 1,
+                 max_steps: Optional[int] = None, hit_penalty: float = 10.0,
+                 observation_type: str = "features",
+                 config: Optional[GameConfig] = None) -> None:
+        """初始化环境。
+
+        Args:
+            seed (Optional[int]): 第一局的随机种子
+            frame_skip (int): 每次 step() 推进的逻辑帧数，默认为1
+            max_steps (Optional[int]): 每局最多的步数，默认不限制
+            hit_penalty (float): 每损失1点生命值扣除的奖励
+            observation_type (str): "features"（特征向量）或 "pixels"（灰度画面）
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
+        """
+        if frame_skip < 1:
+            raise ValueError("frame_skip must be at least 1")
+        if observation_type not in OBSERVATION_TYPES:
+            raise ValueError(f"unknown observation type: {observation_type}")
+        self.frame_skip: int = frame_skip
+        self.max_steps: Optional[int] = max_steps
+        self.hit_penalty: float = hit_penalty
+
+        self._input = ScriptedInput()
+        self._key_states = [KeyState(keys) for keys in ACTION_KEYS]
+        self.game: Game = Game(headless=True, input_source=self._input, seed=seed, config=config)
+
+        # 像素观测直接使用渲染器的缓冲区
+        self.renderer: Optional[PixelRenderer] = None
+        if observation_type == "pixels":
+            self.renderer = PixelRenderer(config=self.game.config)
+
+        # 观测向量及其各部分的视图
+        self.observation: np.ndarray = np.zeros(OBS_SIZE, dtype=np.float32)
+        offset = PLAYER_FEATURES
+        self._player_obs = self.observation[:offset]
+        self._enemy_obs = self.observation[offset:offset + MAX_ENEMIES * ENEMY_FEATURES] \
+            .reshape(MAX_ENEMIES, ENEMY_FEATURES)
+        offset += MAX_ENEMIES * ENEMY_FEATURES
+        self._bullet_obs = self.observation[offset:offset + MAX_ENEMY_BULLETS * BULLET_FEATURES] \
+            .reshape(MAX_ENEMY_BULLETS, BULLET_FEATURES)
+        offset += MAX_ENEMY_BULLETS * BULLET_FEATURES
+        self._item_obs = self.observation[offset:].reshape(MAX_ITEMS, ITEM_FEATURES)
+
+        # 计算最近实体用的临时数组（实体数量超过容量时按2倍扩容）
+        self._capacity: int = 0
+        self._reserve(64)
+        if self.renderer is not None:
+            self.observation = self.renderer.frame
+
+        self.info: Dict[str, Any] = {"score": 0, "ticks": 0, "health": 0, "truncated": False}
+        self.steps: int = 0
+        self._last_score: int = 0
+        self._last_health: int = 0
+
+    def _reserve(self, n: int) -> None:
+        """确保临时数组至少能容纳 n 个实体。"""
+        if n <= self._capacity:
+            return
+        capacity = max(n, self._capacity * 2)
+        self._xs = np.zeros(capacity)
+        self._ys = np.zeros(capacity)
+        self._a = np.zeros(capacity)
+        self._b = np.zeros(capacity)
+        self._d2 = np.zeros(capacity)
+        self._tmp = np.zeros(capacity)
+        self._capacity = capacity
+
+    def reset(self, seed: Optional[int] = None,
+              config: Optional[GameConfig] = None) -> np.ndarray:
+        """开始新的一局。
+
+        Args:
+            seed (Optional[int]): 新一局的随机种子；为None时沿用当前随机数流
+            config (Optional[GameConfig]): 新一局的运行时配置；为None时沿用当前配置
+
+        Returns:
+            numpy.ndarray: 初始观测（即 self.observation）
+        """
+        self.game.restart_game(seed, config)
+        self.steps = 0
+        self._last_score = 0
+        self._last_health = self.game.player.health
+        self.info["truncated"] = False
+        self._update_info()
+        return self._observe()
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, Dict[str, Any]]:
+        """执行一个动作。
+
+        Args:
+            action (int): 动作编号 (0 - N_ACTIONS-1)，见 ACTION_KEYS
+
+        Returns:
+            Tuple[numpy.ndarray, float, bool, Dict[str, Any]]: (观测, 奖励, 是否结束, 信息)；
+                观测和信息是每步复用的同一个对象
+        """
+        game = self.game
+        self._input.state = self._key_states[action]
+        for _ in range(self.frame_skip):
+            game.update_game()
+            if game.game_over:
+                break
+        self.steps += 1
+
+        score = game.score
+        health = game.player.health
+        reward = float(score - self._last_score)
+        if health < self._last_health:
+            reward -= self.hit_penalty * (self._last_health - health)
+        self._last_score = score
+        self._last_health = health
+
+        truncated = self.max_steps is not None and self.steps >= self.max_steps
+        self.info["truncated"] = truncated and not game.game_over
+        self._update_info()
+        return self._observe(), reward, game.game_over or truncated, self.info
+
+    def _update_info(self) -> None:
+        info = self.info
+        game = self.game
+        info["score"] = game.score
+        info["ticks"] = game.sim_clock.ticks
+        info["health"] = game.player.health
+
+    def _nearest(self, n: int, px: float, py: float, k: int) -> np.ndarray:
+        """在临时数组的前 n 个实体中找距离 (px, py) 最近的至多 k 个，按距离排序。"""
+        d2 = self._d2[:n]
+        tmp = self._tmp[:n]
+        np.subtract(self._xs[:n], px, out=d2)
+        np.multiply(d2, d2, out=d2)
+        np.subtract(self._ys[:n], py, out=tmp)
+        np.multiply(tmp, tmp, out=tmp)
+        d2 += tmp
+        if n > k:
+            index = np.argpartition(d2, k - 1)[:k]
+            return index[np.argsort(d2[index])]
+        return np.argsort(d2)
+
+    def _fill(self, rows: np.ndarray, n: int, px: float, py: float) -> Optional[np.ndarray]:
+        """把最近实体的相对位置和存在标志写入观测槽位，返回所选实体的下标。"""
+        rows.fill(0.0)
+        if n == 0:
+            return None
+        index = self._nearest(n, px, py, len(rows))
+        m = len(index)
+        config = self.game.config
+        rows[:m, 0] = (self._xs[index] - px) * (1.0 / config.SCREEN_WIDTH)
+        rows[:m, 1] = (self._ys[index] - py) * (1.0 / config.SCREEN_HEIGHT)
+        rows[:m, 2] = 1.0
+        return index
+
+    def _observe(self) -> np.ndarray:
+        """把当前游戏状态写入观测向量。"""
+        game = self.game
+        if self.renderer is not None:
+            return self.renderer.render(game)
+        player = game.player
+        px = player.x + player.width * 0.5
+        py = player.y + player.height * 0.5
+        enemies = game.enemies
+        bullets = game.enemy_bullets
+        items = game.item_manager.items
+        self._reserve(max(len(enemies), bullets.count, len(items)))
+        xs, ys, a, b = self._xs, self._ys, self._a, self._b
+
+        # 玩家状态
+        obs = self._player_obs
+        obs[0] = px / game.config.SCREEN_WIDTH
+        obs[1] = py / game.config.SCREEN_HEIGHT
+        obs[2] = player.health / player.max_health
+        obs[3] = player.double_shot_active
+        obs[4] = player.shield_active
+        obs[5] = min(len(enemies), MAX_ENEMIES) / MAX_ENEMIES
+
+        # 敌机（中心点）
+        n = len(enemies)
+        for i, enemy in enumerate(enemies):
+            xs[i] = enemy.x + enemy.width * 0.5
+            ys[i] = enemy.y + enemy.height * 0.5
+            a[i] = enemy.enemy_type == "medium"
+            b[i] = enemy.hp / enemy.max_hp
+        index = self._fill(self._enemy_obs, n, px, py)
+        if index is not None:
+            m = len(index)
+            self._enemy_obs[:m, 3] = a[index]
+            self._enemy_obs[:m, 4] = b[index]
+
+        # 敌机子弹（直接读取子弹池数组）
+        n = bullets.count
+        np.add(bullets.x[:n], bullets.width * 0.5, out=xs[:n])
+        np.add(bullets.y[:n], bullets.height * 0.5, out=ys[:n])
+        self._fill(self._bullet_obs, n, px, py)
+
+        # 道具
+        n = len(items)
+        for i, item in enumerate(items):
+            xs[i] = item.x + item.width * 0.5
+            ys[i] = item.y + item.height * 0.5
+            a[i] = ITEM_KIND_CODES.get(item.kind, 0.0)
+        index = self._fill(self._item_obs, n, px, py)
+        if index is not None:
+            self._item_obs[:len(index), 3] = a[index]
+
+        return self.observation
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""输入源模块。
+
+本模块定义了游戏读取按键状态的输入源。Game 通过输入源获取每帧的按键
+状态，而不是直接调用 pygame.key.get_pressed()，这样无窗口（headless）
+模拟、脚本化测试和回放都可以替换输入来源。
+
+输入源返回的按键状态只需支持 keys[pygame.K_LEFT] 这样的下标访问，
+与 pygame.key.ScancodeWrapper 的用法一致。
+
+典型用法示例:
+    # 实时游戏：读取键盘
+    game = Game(input_source=KeyboardInput())
+
+    # 无窗口模拟：由代码控制按键
+    source = ScriptedInput()
+    game = Game(headless=True, input_source=source)
+    source.set_pressed({pygame.K_LEFT})
+    game.update_game()
+"""
+
+import pygame
+from abc import ABC, abstractmethod
+from typing import FrozenSet, Iterable
+
+
+class KeyState:
+    """按键状态类。
+
+    用按下按键的集合模拟 pygame.key.ScancodeWrapper 的下标访问接口。
+
+    Attributes:
+        pressed (FrozenSet[int]): 当前按下的按键代码集合
+    """
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        """初始化按键状态。
+
+        Args:
+            pressed (Iterable[int]): 按下的按键代码，例如 pygame.K_LEFT
+        """
+        self.pressed: FrozenSet[int] = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class InputSource(ABC):
+    """输入源抽象基类。
+
+    子类需要实现 get_pressed()，返回当前帧的按键状态。
+    """
+
+    @abstractmethod
+    def get_pressed(self):
+        """获取当前帧的按键状态。
+
+        Returns:
+            支持 keys[key_code] 下标访问的按键状态对象
+        """
+
+
+class KeyboardInput(InputSource):
+    """键盘输入源，直接读取 pygame 的键盘状态（需要显示窗口）。"""
+
+    def get_pressed(self) -> pygame.key.ScancodeWrapper:
+        """读取当前的键盘状态。
+
+        Returns:
+            pygame.key.ScancodeWrapper: 当前按下的键盘按键状态
+        """
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput(InputSource):
+    """脚本输入源，按键状态由代码设置，默认不按任何键。
+
+    Attributes:
+        state (KeyState): 当前的按键状态
+    """
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        """初始化脚本输入源。
+
+        Args:
+            pressed (Iterable[int]): 初始按下的按键代码
+        """
+        self.state: KeyState = KeyState(pressed)
+
+    def set_pressed(self, pressed: Iterable[int]) -> None:
+        """设置之后各帧的按键状态。
+
+        Args:
+            pressed (Iterable[int]): 按下的按键代码
+        """
+        self.state = KeyState(pressed)
+
+    def get_pressed(self) -> KeyState:
+        """返回当前设置的按键状态。
+
+        Returns:
+            KeyState: 当前的按键状态
+        """
+        return self.state
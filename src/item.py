@@ -7,22 +7,30 @@
 
 import pygame
 import random
-from typing import List, Tuple
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from typing import List
+from config import SCREEN_HEIGHT
+from game_config import DEFAULT_CONFIG
+from collision import entity_boxes, overlap_rect
+from entity_list import EntityList
+from sprite_atlas import get_atlas
 
 class Item:
     """道具基类"""
+
+    kind = None  # 精灵图集中的道具种类（子类设置）
     
-    def __init__(self, x: float, y: float):
+    def __init__(self, x: float, y: float, max_y: int = SCREEN_HEIGHT):
         """
         初始化道具
         
         Args:
             x: 道具x坐标
             y: 道具y坐标
+            max_y: y坐标超过此值（屏幕底部）时道具被销毁
         """
         self.x = x
         self.y = y
+        self.max_y = max_y
         self.width = 20
         self.height = 20
         self.speed = 2
@@ -33,12 +41,21 @@ class Item:
         self.y += self.speed
         
         # 超出屏幕底部则销毁
-        if self.y > SCREEN_HEIGHT:
+        if self.y > self.max_y:
             self.active = False
     
     def draw(self, screen):
         """绘制道具（子类需要重写）"""
         pass
+
+    def sprite(self, alpha: float = 1.0):
+        """获取预先光栅化的道具图形及其绘制位置，用于批量绘制"""
+        surface, (dx, dy) = get_atlas().item(self.kind, self.width, self.height)
+        y = self.y
+        if alpha < 1.0:
+            # 道具匀速下落，上一逻辑帧的位置由速度推算
+            y = int(y - self.speed * (1.0 - alpha))
+        return surface, (self.x + dx, y + dy)
     
     def get_rect(self):
         """获取道具的碰撞矩形"""
@@ -51,29 +68,15 @@ class Item:
 class HealthItem(Item):
     """加血道具"""
     
-    def __init__(self, x: float, y: float):
-        super().__init__(x, y)
+    kind = "health"
+
+    def __init__(self, x: float, y: float, max_y: int = SCREEN_HEIGHT):
+        super().__init__(x, y, max_y)
         self.color = (0, 255, 0)  # 绿色
         
     def draw(self, screen):
         """绘制绿色十字"""
-        # 绘制十字形状
-        cross_size = 16
-        cross_thickness = 4
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        
-        # 垂直线
-        pygame.draw.rect(screen, self.color, 
-                        (center_x - cross_thickness // 2, 
-                         center_y - cross_size // 2,
-                         cross_thickness, cross_size))
-        
-        # 水平线
-        pygame.draw.rect(screen, self.color,
-                        (center_x - cross_size // 2,
-                         center_y - cross_thickness // 2,
-                         cross_size, cross_thickness))
+        screen.blit(*self.sprite())
     
     def apply_effect(self, player):
         """增加玩家生命值"""
@@ -85,32 +88,15 @@ class HealthItem(Item):
 class PowerUpItem(Item):
     """子弹强化道具"""
     
-    def __init__(self, x: float, y: float):
-        super().__init__(x, y)
+    kind = "power_up"
+
+    def __init__(self, x: float, y: float, max_y: int = SCREEN_HEIGHT):
+        super().__init__(x, y, max_y)
         self.color = (255, 255, 0)  # 黄色
         
     def draw(self, screen):
         """绘制黄色星形"""
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        
-        # 绘制星形（简化为菱形）
-        points = [
-            (center_x, center_y - 8),  # 上
-            (center_x + 8, center_y),  # 右
-            (center_x, center_y + 8),  # 下
-            (center_x - 8, center_y)   # 左
-        ]
-        pygame.draw.polygon(screen, self.color, points)
-        
-        # 添加内部小菱形
-        inner_points = [
-            (center_x, center_y - 4),
-            (center_x + 4, center_y),
-            (center_x, center_y + 4),
-            (center_x - 4, center_y)
-        ]
-        pygame.draw.polygon(screen, (255, 255, 255), inner_points)
+        screen.blit(*self.sprite())
     
     def apply_effect(self, player):
         """激活双发子弹效果"""
@@ -120,30 +106,57 @@ class PowerUpItem(Item):
 class ShieldItem(Item):
     """护盾道具"""
     
-    def __init__(self, x: float, y: float):
-        super().__init__(x, y)
+    kind = "shield"
+
+    def __init__(self, x: float, y: float, max_y: int = SCREEN_HEIGHT):
+        super().__init__(x, y, max_y)
         self.color = (0, 100, 255)  # 蓝色
         
     def draw(self, screen):
         """绘制蓝色圆形护盾"""
-        center_x = int(self.x + self.width // 2)
-        center_y = int(self.y + self.height // 2)
-        
-        # 外圆
-        pygame.draw.circle(screen, self.color, (center_x, center_y), 8)
-        # 内圆
-        pygame.draw.circle(screen, (150, 200, 255), (center_x, center_y), 5)
+        screen.blit(*self.sprite())
     
     def apply_effect(self, player):
         """激活护盾效果"""
         player.activate_shield(30.0)  # 30秒护盾效果
         return True
 
+# 道具种类 -> 道具类
+ITEM_CLASSES = {
+    "health": HealthItem,
+    "power_up": PowerUpItem,
+    "shield": ShieldItem,
+}
+
 class ItemManager:
     """道具管理器"""
     
-    def __init__(self):
-        self.items: List[Item] = []
+    def __init__(self, rng=None, config=None):
+        """
+        初始化道具管理器
+        
+        Args:
+            rng: 道具掉落使用的随机数源，需提供 random() 和 randint()；
+                 默认使用 random 模块
+            config: 运行时配置（GameConfig），提供屏幕尺寸和道具掉落表；
+                    默认使用 config.py 中的值
+        """
+        self.items: EntityList[Item] = EntityList()
+        self.rng = rng if rng is not None else random
+        self.set_config(config)
+
+    def set_config(self, config=None):
+        """
+        切换运行时配置（在两局之间调用）
+        
+        Args:
+            config: 运行时配置（GameConfig），默认使用 config.py 中的值
+        """
+        if config is None:
+            config = DEFAULT_CONFIG
+        self.drop_tables = config.ITEM_DROP_TABLES  # 道具掉落表，格式同 ITEM_DROP_TABLES
+        self.max_x = config.SCREEN_WIDTH - 20  # 道具生成位置x坐标的上限
+        self.max_y = config.SCREEN_HEIGHT  # 道具落出屏幕的y坐标
         
     def spawn_item(self, x: float, y: float, enemy_type: str = "small"):
         """
@@ -155,39 +168,34 @@ class ItemManager:
             enemy_type: 敌机类型，影响道具掉落概率
         """
         # 添加随机偏移
-        offset_x = random.randint(-20, 20)
-        spawn_x = max(0, min(SCREEN_WIDTH - 20, x + offset_x))
+        offset_x = self.rng.randint(-20, 20)
+        spawn_x = max(0, min(self.max_x, x + offset_x))
         
         # 根据敌机类型和概率生成道具
-        rand = random.random()
+        rand = self.rng.random()
         
-        if enemy_type == "medium":
-            # 中型敌机掉落概率更高
-            if rand < 0.15:  # 15% 加血道具
-                self.items.append(HealthItem(spawn_x, y))
-            elif rand < 0.35:  # 20% 子弹强化道具
-                self.items.append(PowerUpItem(spawn_x, y))
-            elif rand < 0.45:  # 10% 护盾道具
-                self.items.append(ShieldItem(spawn_x, y))
-        else:
-            # 小型敌机掉落概率较低
-            if rand < 0.05:  # 5% 加血道具
-                self.items.append(HealthItem(spawn_x, y))
-            elif rand < 0.25:  # 20% 子弹强化道具
-                self.items.append(PowerUpItem(spawn_x, y))
-            # 小型敌机不掉落护盾道具
+        for threshold, kind in self.drop_tables.get(enemy_type, ()):
+            if rand < threshold:
+                self.items.append(ITEM_CLASSES[kind](spawn_x, y, self.max_y))
+                break
     
     def update(self):
         """更新所有道具"""
-        for item in self.items[:]:
+        items = self.items
+        for index, item in items.indexed():
             item.update()
             if not item.active:
-                self.items.remove(item)
+                items.kill(index)
+        items.compact()
     
     def draw(self, screen):
         """绘制所有道具"""
         for item in self.items:
             item.draw(screen)
+
+    def sprites(self, alpha: float = 1.0):
+        """获取所有道具的 (表面, 位置)，用于批量绘制"""
+        return [item.sprite(alpha) for item in self.items]
     
     def check_collision(self, player_rect) -> List[Item]:
         """
@@ -199,11 +207,23 @@ class ItemManager:
         Returns:
             List[Item]: 碰撞的道具列表
         """
+        if not self.items:
+            return []
+
+        # 一次广播求出所有与玩家相交的道具
+        boxes = entity_boxes(self.items)
+        mask = overlap_rect(
+            boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3], player_rect
+        ).tolist()
+        if not any(mask):
+            return []
+
         collected_items = []
-        for item in self.items[:]:
-            if item.get_rect().colliderect(player_rect):
-                collected_items.append(item)
-                self.items.remove(item)
+        for index, hit in enumerate(mask):
+            if hit:
+                collected_items.append(self.items[index])
+                self.items.kill(index)
+        self.items.compact()
         return collected_items
     
     def clear(self):
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""静态图层缓存模块。
+
+本模块缓存很少变化的屏幕图层：背景、游戏结束遮罩、整个游戏结束画面，
+以及没有可用字体时的替代图形。每个图层有一个名称和一个状态键，
+状态键不变时直接复用上次构建的表面；状态键变化时在原表面上重新构建
+（尺寸不变时不会分配新的表面）。
+
+典型用法示例:
+    layers = LayerCache()
+
+    def build(surface):
+        surface.fill(BLACK)
+        pygame.draw.rect(surface, WHITE, (0, 0, 150, 25), 2)
+
+    surface = layers.get("score_box", score // 10, (150, 25), build)
+    screen.blit(surface, (10, 10))
+"""
+
+import pygame
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Layer:
+    """单个缓存图层（表面 + 构建时的状态键）。"""
+
+    __slots__ = ("surface", "key", "alpha")
+
+    def __init__(self, surface: pygame.Surface, key: Hashable, alpha: bool) -> None:
+        self.surface: pygame.Surface = surface
+        self.key: Hashable = key
+        self.alpha: bool = alpha
+
+
+class LayerCache:
+    """静态图层缓存类。
+
+    每个名称只保留一个表面，因此内存占用不随状态数量增长。
+
+    Attributes:
+        builds (int): 图层被（重新）构建的次数（统计用）
+    """
+
+    def __init__(self) -> None:
+        """初始化空的图层缓存。"""
+        self._layers: Dict[str, _Layer] = {}
+        self.builds: int = 0
+
+    def get(self, name: str, key: Hashable, size: Tuple[int, int],
+            build: Callable[[pygame.Surface], None], alpha: bool = False) -> pygame.Surface:
+        """获取图层表面，状态键变化时重新构建。
+
+        Args:
+            name (str): 图层名称
+            key (Hashable): 图层内容的状态键，相同的键表示内容相同
+            size (Tuple[int, int]): 图层尺寸
+            build (Callable[[pygame.Surface], None]): 在给定表面上绘制图层内容的函数，
+                调用前表面已被清空（透明图层为全透明，否则为黑色）
+            alpha (bool): 是否为带逐像素透明度的图层，默认为False
+
+        Returns:
+            pygame.Surface: 图层表面（会被后续调用复用，调用者不应修改它）
+        """
+        layer = self._layers.get(name)
+        if layer is not None and layer.key == key:
+            return layer.surface
+
+        if layer is not None and layer.alpha == alpha and layer.surface.get_size() == tuple(size):
+            surface = layer.surface
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = _new_surface(size, alpha)
+
+        build(surface)
+        self._layers[name] = _Layer(surface, key, alpha)
+        self.builds += 1
+        return surface
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """使图层失效，下次获取时重新构建。
+
+        Args:
+            name (Optional[str]): 图层名称，默认使所有图层失效
+        """
+        if name is None:
+            for layer in self._layers.values():
+                layer.key = _INVALID
+        elif name in self._layers:
+            self._layers[name].key = _INVALID
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+
+# 不会与任何状态键相等的占位键
+_INVALID = object()
+
+
+def _new_surface(size: Tuple[int, int], alpha: bool) -> pygame.Surface:
+    """创建图层表面，已有显示窗口时转换为显示格式。"""
+    if alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+    else:
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+    surface.fill((0, 0, 0, 0))
+    return surface
@@ -18,15 +18,72 @@
 
 使用方法:
     python main.py
+    python main.py --headless --frames 10000   # 无窗口模拟，输出模拟吞吐量
+    python main.py --record session.pwr        # 录制本局输入
+    python main.py --replay session.pwr        # 以最高速度回放并输出吞吐量
+    python main.py --profile profile.json      # 记录各阶段帧时间，退出时写出（F3显示叠加层）
+    python main.py --startup-timing            # 输出启动各阶段耗时
+    python main.py --config hard.toml          # 使用TOML/JSON配置档案中的参数
 
 作者: AI Assistant
 版本: 1.0
 """
 
+import time
+
+# 程序入口时间，启动时间明细中的 imports 阶段从这里开始计算
+_STARTED: float = time.perf_counter()
+
+import argparse
 import pygame
 import sys
-from typing import NoReturn
+from typing import List, NoReturn, Optional
 from game import Game
+from game_config import load_config
+from startup import StartupTimer
+from replay import MAX_SEED, ReplayPlayer, ReplayRecorder, load_replay
+from profiler import FrameProfiler
+from config import PROFILER_WINDOW
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """解析命令行参数。
+
+    Args:
+        argv (Optional[List[str]]): 命令行参数列表，默认读取sys.argv
+
+    Returns:
+        argparse.Namespace: 解析后的参数
+    """
+    parser = argparse.ArgumentParser(description="飞机大战")
+    parser.add_argument("--headless", action="store_true",
+                        help="无窗口、不限帧率地运行模拟并输出吞吐量")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="无窗口模式下最多模拟的帧数")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help="无窗口模式下最长运行时间（秒）")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="随机种子，相同种子和输入可复现同一局游戏")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="把本局输入录制到回放文件")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="以无窗口、最高速度回放录制的对局")
+    parser.add_argument("--render-every", type=int, default=0,
+                        help="回放时每N帧渲染并显示一次画面，0表示不渲染")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="启用帧时间分析，退出时写出结果（.json或.csv）")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="输出启动各阶段的耗时")
+    parser.add_argument("--config", metavar="PATH", default=None,
+                        help="从TOML或JSON配置档案加载游戏参数")
+    args = parser.parse_args(argv)
+    if args.config and (args.record or args.replay):
+        # 回放文件只记录种子和输入，回放总是使用默认配置
+        parser.error("--config 不能与 --record 或 --replay 同时使用")
+    if args.record and args.seed is not None and not 0 <= args.seed < MAX_SEED:
+        # 在对局开始前拒绝，避免录完整局后才因种子无法写入而丢失录像
+        parser.error("--record 要求 --seed 在 0 到 2**64-1 之间")
+    return args
 
 
 def main() -> NoReturn:
@@ -38,16 +95,48 @@ def main() -> NoReturn:
     Raises:
         SystemExit: 当游戏正常结束时退出程序
     """
+    args = parse_args()
     try:
+        config = load_config(args.config) if args.config else None
+        if args.replay:
+            # 回放：按录制的输入重新模拟整局游戏
+            if args.render_every:
+                pygame.init()
+            player = ReplayPlayer(load_replay(args.replay),
+                                  render_every=args.render_every,
+                                  display=args.render_every > 0)
+            stats = player.run()
+            print(f"回放 {stats['frames']} 帧，用时 {stats['elapsed']:.3f} 秒，"
+                  f"{stats['fps']:.0f} 帧/秒，分数 {stats['score']}")
+            return
+
+        if args.headless:
+            # 无窗口模拟：不初始化显示和音频
+            game = Game(headless=True, seed=args.seed, config=config)
+            stats = game.run_headless(max_frames=args.frames, time_budget=args.seconds)
+            print(f"模拟 {stats['frames']} 帧，用时 {stats['elapsed']:.3f} 秒，"
+                  f"{stats['fps']:.0f} 帧/秒，分数 {stats['score']}")
+            return
+
         # 初始化Pygame库
         pygame.init()
 
         # 创建游戏实例
-        game = Game()
+        game = Game(seed=args.seed, startup_timer=StartupTimer(_STARTED), config=config)
+        if args.startup_timing:
+            print(game.startup_timer.report())
+        if args.record:
+            game.recorder = ReplayRecorder(game.rng.seed)
+        if args.profile:
+            game.profiler = FrameProfiler(PROFILER_WINDOW)
+            game.profile_dump_path = args.profile
 
         # 运行游戏主循环
         game.run()
 
+        if game.recorder is not None:
+            game.recorder.save(args.record)
+
     except Exception as e:
         # 如果发生错误，打印错误信息
         print(f"游戏运行时发生错误: {e}")
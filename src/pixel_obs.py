@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""像素观测模块。
+
+本模块把游戏状态直接光栅化到一个预先分配的小尺寸灰度缓冲区（默认 84×84），
+供从像素学习的智能体使用。不经过 pygame 绘制，也不用 surfarray.array3d
+复制整个 800×600 画面，不绘制 HUD：
+
+- 每个实体的矩形按比例缩放到观测分辨率，用 NumPy 切片写入该类实体的灰度值
+- 缩放后的矩形至少占1个像素，宽度远小于1个像素的子弹也不会消失
+- 子弹池直接读取坐标数组：子弹尺寸固定，屏幕坐标到像素下标的换算预先做成
+  查找表，每帧只需几次 take/put，不逐颗遍历、也不做裁剪运算
+
+每次 render() 原地重写同一个缓冲区并返回它，需要保留某一帧时请自行复制。
+查找表按游戏的运行时配置（屏幕和子弹尺寸）生成，游戏切换配置后在下一次
+render() 时重新生成。
+
+典型用法示例:
+    renderer = PixelRenderer()
+    game.update_game()
+    frame = renderer.render(game)  # 形状为 (84, 84) 的 uint8 数组
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from game_config import GameConfig, DEFAULT_CONFIG
+
+OBS_WIDTH: int = 84   # 观测宽度（像素）
+OBS_HEIGHT: int = 84  # 观测高度（像素）
+
+# 各类实体的灰度值（按下面的顺序绘制，后绘制的覆盖先绘制的）
+OBS_INTENSITY: Dict[str, int] = {
+    "player_bullet": 80,
+    "item": 120,
+    "small": 160,     # 小型敌机
+    "medium": 200,    # 中型敌机
+    "enemy_bullet": 230,
+    "player": 255,
+}
+
+
+def _axis_tables(pixels: int, screen: int, size: int, stride: int,
+                 invisible: int) -> Tuple[int, List[np.ndarray]]:
+    """生成一个坐标轴上固定尺寸矩形的查找表。
+
+    Args:
+        pixels (int): 观测在该轴上的像素数
+        screen (int): 屏幕在该轴上的长度
+        size (int): 矩形在该轴上的长度
+        stride (int): 像素下标乘以的步长（行为观测宽度，列为1）
+        invisible (int): 矩形完全在观测外时使用的下标
+
+    Returns:
+        Tuple[int, List[numpy.ndarray]]: (查找表起点坐标, 每个像素偏移量一张表)。
+            表中第 i 项对应坐标 起点+i，值为 偏移像素的下标×stride；偏移量超出
+            矩形覆盖的像素数时重复最后一个像素。表的两端都在观测外。
+    """
+    start = -size - 1
+    coords = np.arange(start, screen + 2)
+    first = np.clip(coords * pixels // screen, 0, pixels)
+    last = np.clip(-(-(coords + size) * pixels // screen), 0, pixels) - 1
+    covered = last - first + 1
+    tables = []
+    for offset in range(max(1, int(covered.max()))):
+        index = np.minimum(first + offset, last) * stride
+        tables.append(np.where(covered > 0, index, invisible))
+    return start, tables
+
+
+class PixelRenderer:
+    """像素观测渲染器类。
+
+    Attributes:
+        width (int): 观测宽度
+        height (int): 观测高度
+        frame (numpy.ndarray): 预分配的灰度缓冲区，形状为 (height, width)，uint8
+    """
+
+    def __init__(self, width: int = OBS_WIDTH, height: int = OBS_HEIGHT,
+                 config: Optional[GameConfig] = None) -> None:
+        """初始化渲染器。
+
+        Args:
+            width (int): 观测宽度，默认为 OBS_WIDTH
+            height (int): 观测高度，默认为 OBS_HEIGHT
+            config (Optional[GameConfig]): 初始的运行时配置，默认使用 config.py 中的值
+        """
+        if width < 1 or height < 1:
+            raise ValueError("observation size must be positive")
+        self.width: int = width
+        self.height: int = height
+        # 缓冲区末尾多一个字节，观测外的子弹写到这里（frame 是前面部分的连续视图）
+        self._buffer: np.ndarray = np.zeros(width * height + 1, dtype=np.uint8)
+        self.frame: np.ndarray = self._buffer[:width * height].reshape(height, width)
+        self._configure(config if config is not None else DEFAULT_CONFIG)
+
+    def _configure(self, config: GameConfig) -> None:
+        """按运行时配置生成子弹查找表。"""
+        width, height = self.width, self.height
+        self._config: GameConfig = config
+        self._screen_width: int = config.SCREEN_WIDTH
+        self._screen_height: int = config.SCREEN_HEIGHT
+
+        # 子弹的坐标 -> 像素下标查找表；行下标与列下标相加即为缓冲区下标，
+        # 任一方向在观测外时和至少为 width * height，写入时被截断到末尾字节
+        trash = width * height
+        self._bullet_x0, self._bullet_cols = _axis_tables(
+            width, config.SCREEN_WIDTH, config.BULLET_WIDTH, 1, trash)
+        self._bullet_y0, self._bullet_rows = _axis_tables(
+            height, config.SCREEN_HEIGHT, config.BULLET_HEIGHT, width, trash)
+
+    def _fill_rect(self, x: int, y: int, w: int, h: int, value: int) -> None:
+        """把一个屏幕坐标的矩形缩放后写入缓冲区。"""
+        width, height = self.width, self.height
+        screen_width, screen_height = self._screen_width, self._screen_height
+        # 左上角向下取整、右下角向上取整，保证至少覆盖1个像素
+        x0 = max(0, x * width // screen_width)
+        x1 = min(width, -(-(x + w) * width // screen_width))
+        y0 = max(0, y * height // screen_height)
+        y1 = min(height, -(-(y + h) * height // screen_height))
+        if x0 < x1 and y0 < y1:
+            self.frame[y0:y1, x0:x1] = value
+
+    def _fill_pool(self, pool, value: int) -> None:
+        """把子弹池中所有存活子弹写入缓冲区。"""
+        n = pool.count
+        if n == 0:
+            return
+        x = pool.x[:n]
+        y = pool.y[:n]
+        alive = pool.alive[:n]
+        if not alive.all():
+            x = x[alive]
+            y = y[alive]
+        x = x - self._bullet_x0
+        y = y - self._bullet_y0
+
+        buffer = self._buffer
+        cols = [table.take(x, mode="clip") for table in self._bullet_cols]
+        for table in self._bullet_rows:
+            rows = table.take(y, mode="clip")
+            for col in cols:
+                buffer.put(rows + col, value, mode="clip")
+
+    def render(self, game) -> np.ndarray:
+        """把游戏当前状态光栅化到缓冲区。
+
+        Args:
+            game (Game): 游戏实例（只读取实体位置，不调用任何绘制方法）
+
+        Returns:
+            numpy.ndarray: 灰度缓冲区（即 self.frame），形状为 (height, width)
+        """
+        if game.config is not self._config:
+            self._configure(game.config)
+        self._buffer.fill(0)
+        fill_rect = self._fill_rect
+
+        self._fill_pool(game.player_bullets, OBS_INTENSITY["player_bullet"])
+
+        value = OBS_INTENSITY["item"]
+        for item in game.item_manager.items:
+            fill_rect(int(item.x), int(item.y), item.width, item.height, value)
+
+        for enemy in game.enemies:
+            fill_rect(enemy.x, enemy.y, enemy.width, enemy.height, OBS_INTENSITY[enemy.enemy_type])
+
+        self._fill_pool(game.enemy_bullets, OBS_INTENSITY["enemy_bullet"])
+
+        player = game.player
+        fill_rect(player.x, player.y, player.width, player.height, OBS_INTENSITY["player"])
+        return self.frame
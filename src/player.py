@@ -15,13 +15,10 @@
 """
 
 import pygame
-import time
 from typing import Optional, Tuple
-from config import (
-    PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_INITIAL_LIVES,
-    BULLET_COOLDOWN, BULLET_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT,
-    BLUE, WHITE
-)
+from game_clock import WallClock
+from game_config import DEFAULT_CONFIG
+from sprite_atlas import get_atlas
 
 
 class Player:
@@ -37,27 +34,42 @@ class Player:
         height (int): 飞机的高度
         speed (int): 飞机的移动速度
         lives (int): 飞机的剩余生命值
+        bullet_cooldown (float): 两次射击之间的最短间隔（秒）
+        config (GameConfig): 运行时配置（移动边界和子弹偏移取自其派生值）
         last_bullet_time (float): 上次发射子弹的时间戳
+        clock: 提供当前时间的时钟对象（射击冷却和道具计时使用）
         rect (pygame.Rect): 用于碰撞检测的矩形区域
     """
 
-    def __init__(self, x: int, y: int) -> None:
+    def __init__(self, x: int, y: int, clock=None, config=None) -> None:
         """初始化玩家飞机。
 
         Args:
             x (int): 飞机初始x坐标位置
             y (int): 飞机初始y坐标位置
+            clock: 时钟对象，需提供 now() 方法；默认使用真实时间
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值
         """
+        self.clock = clock if clock is not None else WallClock()
+        self.config = config if config is not None else DEFAULT_CONFIG
+        config = self.config
         self.x: int = x
         self.y: int = y
-        self.width: int = PLAYER_WIDTH
-        self.height: int = PLAYER_HEIGHT
-        self.speed: int = PLAYER_SPEED
+        # 上一个逻辑帧的位置（渲染插值使用）
+        self.prev_x: int = x
+        self.prev_y: int = y
+        self.width: int = config.PLAYER_WIDTH
+        self.height: int = config.PLAYER_HEIGHT
+        self.speed: int = config.PLAYER_SPEED
+        self.bullet_cooldown: float = config.BULLET_COOLDOWN
+        # 移动边界（配置的派生值）
+        self._max_x: int = config.player_max_x
+        self._max_y: int = config.player_max_y
 
         # 生命值系统 - 1.1.0新增
         self.health: int = 3  # 当前生命值
         self.max_health: int = 5  # 最大生命值上限
-        self.lives: int = PLAYER_INITIAL_LIVES  # 保持兼容性
+        self.lives: int = config.PLAYER_INITIAL_LIVES  # 保持兼容性
 
         # 射击系统
         self.last_bullet_time: float = 0.0
@@ -80,16 +92,18 @@ class Player:
         Args:
             keys_pressed (pygame.key.ScancodeWrapper): 当前按下的键盘按键状态
         """
+        self.prev_x, self.prev_y = self.x, self.y
+
         # 处理左右移动
         if keys_pressed[pygame.K_LEFT] and self.x > 0:
             self.x -= self.speed
-        if keys_pressed[pygame.K_RIGHT] and self.x < SCREEN_WIDTH - self.width:
+        if keys_pressed[pygame.K_RIGHT] and self.x < self._max_x:
             self.x += self.speed
 
         # 处理上下移动
         if keys_pressed[pygame.K_UP] and self.y > 0:
             self.y -= self.speed
-        if keys_pressed[pygame.K_DOWN] and self.y < SCREEN_HEIGHT - self.height:
+        if keys_pressed[pygame.K_DOWN] and self.y < self._max_y:
             self.y += self.speed
 
         # 更新碰撞检测矩形位置
@@ -97,7 +111,7 @@ class Player:
         self.rect.y = self.y
 
         # 更新道具效果状态 - 1.1.0新增
-        current_time = time.time()
+        current_time = self.clock.now()
 
         # 检查双发子弹效果是否过期
         if self.double_shot_active and current_time >= self.double_shot_end_time:
@@ -116,8 +130,8 @@ class Player:
         Returns:
             bool: 如果可以发射子弹返回True，否则返回False
         """
-        current_time: float = time.time()
-        return current_time - self.last_bullet_time >= BULLET_COOLDOWN
+        current_time: float = self.clock.now()
+        return current_time - self.last_bullet_time >= self.bullet_cooldown
 
     def shoot(self) -> Optional[list]:
         """发射子弹。
@@ -130,24 +144,14 @@ class Player:
                            否则返回None
         """
         if self.can_shoot():
-            self.last_bullet_time = time.time()
-            bullets = []
-
+            self.last_bullet_time = self.clock.now()
+            # 子弹相对飞机的偏移是配置的派生值，不在每次射击时重新计算
             if self.double_shot_active:
                 # 双发子弹模式 - 1.1.0新增
-                left_bullet_x = self.x + self.width // 2 - 15 - BULLET_WIDTH // 2
-                right_bullet_x = self.x + self.width // 2 + 15 - BULLET_WIDTH // 2
-                bullet_y = self.y
-
-                bullets.append((left_bullet_x, bullet_y))
-                bullets.append((right_bullet_x, bullet_y))
-            else:
-                # 单发子弹模式
-                bullet_x = self.x + self.width // 2 - BULLET_WIDTH // 2
-                bullet_y = self.y
-                bullets.append((bullet_x, bullet_y))
-
-            return bullets
+                left, right = self.config.double_bullet_offsets
+                return [(self.x + left, self.y), (self.x + right, self.y)]
+            # 单发子弹模式
+            return [(self.x + self.config.bullet_offset, self.y)]
         return None
 
     def take_damage(self) -> bool:
@@ -180,25 +184,31 @@ class Player:
         """绘制玩家飞机。
 
         在屏幕上绘制玩家飞机的图形表示。使用简单的几何图形
-        来表示飞机，包括主体和驾驶舱。
+        来表示飞机，包括主体和驾驶舱（护盾激活时还有护盾光圈）。
 
         Args:
             screen (pygame.Surface): 要绘制到的屏幕表面
         """
-        # 绘制蓝色矩形代表玩家飞机主体
-        pygame.draw.rect(screen, BLUE, (self.x, self.y, self.width, self.height))
+        screen.blit(*self.sprite())
 
-        # 绘制护盾效果 - 1.1.0新增
-        if self.shield_active:
-            pygame.draw.circle(screen, (0, 150, 255),
-                             (self.x + self.width // 2, self.y + self.height // 2),
-                             max(self.width, self.height) // 2 + 5, 2)
+    def sprite(self, alpha: float = 1.0) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """获取玩家飞机当前的精灵表面及其绘制位置，用于批量绘制。
+
+        主体、护盾光圈和驾驶舱预先光栅化在精灵图集中。
 
-        # 绘制白色矩形代表飞机的驾驶舱
-        cockpit_rect: pygame.Rect = pygame.Rect(
-            self.x + 20, self.y + 10, 20, 30
-        )
-        pygame.draw.rect(screen, WHITE, cockpit_rect)
+        Args:
+            alpha (float): 插值系数，绘制位置为上一逻辑帧位置到当前位置之间的
+                alpha 处；1.0 表示当前位置
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: (表面, 左上角位置)
+        """
+        surface, (dx, dy) = get_atlas().player(self.width, self.height, self.shield_active)
+        x, y = self.x, self.y
+        if alpha < 1.0:
+            x = int(self.prev_x + (x - self.prev_x) * alpha)
+            y = int(self.prev_y + (y - self.prev_y) * alpha)
+        return surface, (x + dx, y + dy)
 
     # 道具效果激活方法 - 1.1.0新增
     def activate_double_shot(self, duration: float) -> None:
@@ -208,7 +218,7 @@ class Player:
             duration: 效果持续时间（秒）
         """
         self.double_shot_active = True
-        self.double_shot_end_time = time.time() + duration
+        self.double_shot_end_time = self.clock.now() + duration
 
     def activate_shield(self, duration: float) -> None:
         """激活护盾效果
@@ -217,7 +227,7 @@ class Player:
             duration: 效果持续时间（秒）
         """
         self.shield_active = True
-        self.shield_end_time = time.time() + duration
+        self.shield_end_time = self.clock.now() + duration
 
     def get_power_up_status(self) -> dict:
         """获取当前道具效果状态
@@ -225,7 +235,7 @@ class Player:
         Returns:
             dict: 包含各种道具效果状态和剩余时间的字典
         """
-        current_time = time.time()
+        current_time = self.clock.now()
         return {
             'double_shot': {
                 'active': self.double_shot_active,
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""帧时间分析模块。
+
+本模块提供按子系统统计每帧耗时的分析器。游戏循环在各个阶段之间调用
+lap()，分析器记录相邻两次调用之间的耗时，并在最近若干帧的滑动窗口上
+计算 p50/p95/p99 分位数，同时记录每帧的实体数量。
+
+未启用时 Game 使用 NullProfiler，所有调用都是空操作，开销可以忽略。
+
+典型用法示例:
+    profiler = FrameProfiler(window=300)
+
+    profiler.begin_frame()
+    handle_events()
+    profiler.lap("events")
+    update_game()
+    profiler.lap("update")
+    profiler.end_frame({"enemies": len(enemies)})
+
+    print(profiler.percentiles())
+    profiler.dump("frame_profile.json")
+"""
+
+import csv
+import json
+import time
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+# 游戏循环中的各个阶段（按执行顺序）
+FRAME_SECTIONS: Tuple[str, ...] = (
+    "events",           # Game.handle_events
+    "player",           # 玩家更新和自动射击
+    "spawn",            # Game.spawn_enemies
+    "bullets",          # Game.update_bullets
+    "enemies",          # Game.update_enemies
+    "items",            # ItemManager.update
+    "collisions",       # Game.check_collisions
+    "item_collisions",  # Game.check_item_collisions
+    "draw",             # Game.draw（不含翻转）
+    "flip",             # pygame.display.flip
+)
+
+# 每帧记录的实体数量
+ENTITY_COUNTERS: Tuple[str, ...] = ("enemies", "player_bullets", "enemy_bullets", "items")
+
+PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+
+
+class NullProfiler:
+    """空分析器类，所有方法都是空操作（分析未启用时使用）。"""
+
+    enabled: bool = False
+
+    def begin_frame(self) -> None:
+        pass
+
+    def lap(self, section: str) -> None:
+        pass
+
+    def end_frame(self, counts: Dict[str, int]) -> None:
+        pass
+
+
+class FrameProfiler:
+    """帧时间分析器类。
+
+    每个阶段的耗时保存在固定大小的环形缓冲区中，内存占用不随运行时间增长。
+
+    Attributes:
+        sections (Tuple[str, ...]): 统计的阶段名称
+        window (int): 滑动窗口大小（帧数）
+        frames (int): 已记录的总帧数
+    """
+
+    enabled: bool = True
+
+    def __init__(self, window: int = 300, sections: Sequence[str] = FRAME_SECTIONS) -> None:
+        """初始化分析器。
+
+        Args:
+            window (int): 计算分位数使用的最近帧数，默认为300（约5秒）
+            sections (Sequence[str]): 统计的阶段名称
+        """
+        self.sections: Tuple[str, ...] = tuple(sections)
+        self.window: int = window
+        self.frames: int = 0
+
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self.sections)}
+        self._times: np.ndarray = np.zeros((window, len(self.sections)), dtype=np.float64)
+        self._counts: np.ndarray = np.zeros((window, len(ENTITY_COUNTERS)), dtype=np.int64)
+        self._current: List[float] = [0.0] * len(self.sections)
+        self._last: float = time.perf_counter()
+
+    def begin_frame(self) -> None:
+        """开始新的一帧，重置本帧的计时。"""
+        current = self._current
+        for i in range(len(current)):
+            current[i] = 0.0
+        self._last = time.perf_counter()
+
+    def lap(self, section: str) -> None:
+        """把距上一次 lap()（或 begin_frame()）以来的耗时计入指定阶段。
+
+        Args:
+            section (str): 阶段名称
+        """
+        now = time.perf_counter()
+        self._current[self._index[section]] += now - self._last
+        self._last = now
+
+    def end_frame(self, counts: Dict[str, int]) -> None:
+        """结束本帧，把本帧的耗时和实体数量写入滑动窗口。
+
+        Args:
+            counts (Dict[str, int]): 本帧的实体数量
+        """
+        row = self.frames % self.window
+        self._times[row] = self._current
+        self._counts[row] = [counts.get(name, 0) for name in ENTITY_COUNTERS]
+        self.frames += 1
+
+    def _filled(self) -> int:
+        return min(self.frames, self.window)
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """计算滑动窗口内每个阶段和整帧耗时的分位数。
+
+        Returns:
+            Dict[str, Dict[str, float]]: {阶段名称: {"p50": 毫秒, "p95": 毫秒, "p99": 毫秒}}，
+                其中 "total" 为各阶段之和
+        """
+        n = self._filled()
+        if n == 0:
+            return {}
+
+        times = self._times[:n] * 1000.0
+        table = np.column_stack((times, times.sum(axis=1)))
+        values = np.percentile(table, PERCENTILES, axis=0)
+
+        result: Dict[str, Dict[str, float]] = {}
+        for column, name in enumerate(self.sections + ("total",)):
+            result[name] = {
+                f"p{p}": float(values[row, column]) for row, p in enumerate(PERCENTILES)
+            }
+        return result
+
+    def entity_counts(self) -> Dict[str, Dict[str, float]]:
+        """统计滑动窗口内的实体数量。
+
+        Returns:
+            Dict[str, Dict[str, float]]: {实体名称: {"mean": 平均值, "max": 最大值}}
+        """
+        n = self._filled()
+        if n == 0:
+            return {}
+        counts = self._counts[:n]
+        return {
+            name: {"mean": float(counts[:, i].mean()), "max": int(counts[:, i].max())}
+            for i, name in enumerate(ENTITY_COUNTERS)
+        }
+
+    def summary(self) -> dict:
+        """汇总分位数和实体数量。
+
+        Returns:
+            dict: 包含 frames、window、percentiles_ms 和 entities 的字典
+        """
+        return {
+            "frames": self.frames,
+            "window": self._filled(),
+            "percentiles_ms": self.percentiles(),
+            "entities": self.entity_counts(),
+        }
+
+    def dump(self, path: str) -> None:
+        """把统计结果写入文件。
+
+        文件扩展名为 .csv 时写出滑动窗口内的逐帧数据（毫秒），
+        否则写出包含分位数汇总和逐帧数据的JSON。
+
+        Args:
+            path (str): 输出文件路径
+        """
+        n = self._filled()
+        # 按时间顺序排列环形缓冲区中的帧
+        order = (np.arange(n) + (self.frames - n)) % self.window
+        times = self._times[order] * 1000.0
+        counts = self._counts[order]
+
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(("frame",) + self.sections + ("total",)
+                                + tuple(f"n_{name}" for name in ENTITY_COUNTERS))
+                first = self.frames - n
+                for i in range(n):
+                    writer.writerow(
+                        [first + i]
+                        + [f"{t:.4f}" for t in times[i]]
+                        + [f"{times[i].sum():.4f}"]
+                        + counts[i].tolist()
+                    )
+        else:
+            data = self.summary()
+            data["sections"] = list(self.sections)
+            data["frames_ms"] = np.round(times, 4).tolist()
+            data["frame_entities"] = counts.tolist()
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""批量绘制模块。
+
+本模块把一帧中所有要绘制的 (表面, 位置) 收集到一个序列中，再通过一次
+Surface.blits() 调用提交（pygame-ce 提供 Surface.fblits() 时优先使用它）。
+实体数量达到数百时，逐个调用 blit() 的Python层开销远大于实际的像素拷贝。
+
+典型用法示例:
+    batch = RenderBatch()
+    batch.clear()
+    batch.add(*player.sprite())
+    batch.extend(enemy.sprite() for enemy in enemies)
+    batch.extend(bullet_pool.sprites())
+    batch.submit(screen)
+"""
+
+import pygame
+from typing import Iterable, List, Optional, Tuple
+
+# 一次绘制：(表面, 左上角位置)
+BlitPair = Tuple[pygame.Surface, Tuple[int, int]]
+
+# pygame-ce 提供不返回矩形、开销更低的 fblits()
+HAS_FBLITS: bool = hasattr(pygame.Surface, "fblits")
+
+
+class RenderBatch:
+    """批量绘制序列类。
+
+    绘制顺序与加入顺序一致，后加入的表面覆盖在先加入的表面之上。
+    """
+
+    def __init__(self) -> None:
+        """初始化空的绘制序列。"""
+        self._sequence: List[BlitPair] = []
+
+    def clear(self) -> None:
+        """清空绘制序列（每帧开始时调用）。"""
+        self._sequence.clear()
+
+    def add(self, surface: pygame.Surface, position: Tuple[int, int]) -> None:
+        """加入一次绘制。
+
+        Args:
+            surface (pygame.Surface): 要绘制的表面
+            position (Tuple[int, int]): 左上角位置
+        """
+        self._sequence.append((surface, position))
+
+    def extend(self, pairs: Iterable[BlitPair]) -> None:
+        """加入多次绘制。
+
+        Args:
+            pairs (Iterable[BlitPair]): (表面, 位置) 序列
+        """
+        self._sequence.extend(pairs)
+
+    def submit(self, screen: pygame.Surface,
+               return_rects: bool = False) -> Optional[List[pygame.Rect]]:
+        """一次性把序列中的所有表面绘制到屏幕上。
+
+        Args:
+            screen (pygame.Surface): 要绘制到的屏幕表面
+            return_rects (bool): 是否返回每次绘制影响的矩形，默认为False
+
+        Returns:
+            Optional[List[pygame.Rect]]: return_rects为True时返回绘制影响的矩形列表，
+                否则返回None
+        """
+        sequence = self._sequence
+        if return_rects:
+            return screen.blits(sequence, doreturn=True) if sequence else []
+        if sequence:
+            if HAS_FBLITS:
+                screen.fblits(sequence)
+            else:
+                screen.blits(sequence, doreturn=False)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._sequence)
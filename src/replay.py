@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""输入回放模块。
+
+本模块实现对局的录制与回放。录制文件只保存随机种子和每帧的输入
+（Player.update 使用的方向键，以及 Game.handle_events 中的重新开始/射击事件），
+不保存任何游戏状态。由于游戏逻辑只依赖种子、逻辑帧数和输入，
+回放时以无窗口模式重新模拟即可逐位复现整局游戏。
+
+每帧输入编码为一个字节，文件中按游程编码（RLE）存储，长时间按住同一
+组按键只占几个字节。
+
+文件格式（小端序）:
+    头部:  魔数 b"PWRP" | 版本 uint8 | 帧数 uint32 | 种子 uint64
+    数据:  若干个 (输入字节 uint8, 重复次数 uint16) 游程
+
+典型用法示例:
+    # 录制
+    game = Game(seed=42)
+    game.recorder = ReplayRecorder(game.rng.seed)
+    game.run()
+    game.recorder.save("session.pwr")
+
+    # 以最高速度回放，每60帧渲染一次
+    player = ReplayPlayer(load_replay("session.pwr"), render_every=60)
+    stats = player.run()
+"""
+
+import struct
+import time
+import pygame
+from typing import List, Optional
+from input_source import InputSource, KeyState
+
+# 每帧输入字节中各位的含义
+INPUT_LEFT: int = 1 << 0
+INPUT_RIGHT: int = 1 << 1
+INPUT_UP: int = 1 << 2
+INPUT_DOWN: int = 1 << 3
+EVENT_RESTART: int = 1 << 4  # 按R键重新开始（Game.handle_events）
+EVENT_SHOOT: int = 1 << 5    # 按空格键射击（仅非自动发射模式）
+
+KEY_MASK: int = INPUT_LEFT | INPUT_RIGHT | INPUT_UP | INPUT_DOWN
+
+REPLAY_MAGIC: bytes = b"PWRP"
+REPLAY_VERSION: int = 1
+
+_HEADER = struct.Struct("<4sBIQ")
+_RUN = struct.Struct("<BH")
+_MAX_RUN: int = 0xFFFF
+MAX_SEED: int = 2 ** 64  # 头部以 uint64 存储种子
+
+# 方向键与输入位的对应关系
+_KEY_BITS = (
+    (pygame.K_LEFT, INPUT_LEFT),
+    (pygame.K_RIGHT, INPUT_RIGHT),
+    (pygame.K_UP, INPUT_UP),
+    (pygame.K_DOWN, INPUT_DOWN),
+)
+
+
+def keys_to_mask(keys_pressed) -> int:
+    """把按键状态编码为输入位掩码。
+
+    Args:
+        keys_pressed: 支持 keys[key_code] 下标访问的按键状态，None表示无输入
+
+    Returns:
+        int: 方向键对应的输入位掩码
+    """
+    if keys_pressed is None:
+        return 0
+    mask = 0
+    for key, bit in _KEY_BITS:
+        if keys_pressed[key]:
+            mask |= bit
+    return mask
+
+
+def mask_to_keys(mask: int) -> KeyState:
+    """把输入位掩码还原为按键状态。
+
+    Args:
+        mask (int): 输入位掩码
+
+    Returns:
+        KeyState: 对应的按键状态
+    """
+    return KeyState(key for key, bit in _KEY_BITS if mask & bit)
+
+
+class Replay:
+    """回放数据类。
+
+    Attributes:
+        seed (int): 对局的随机种子
+        frames (bytearray): 每帧一个字节的输入序列
+    """
+
+    def __init__(self, seed: int, frames: Optional[bytearray] = None) -> None:
+        """初始化回放数据。
+
+        Args:
+            seed (int): 对局的随机种子
+            frames (Optional[bytearray]): 每帧输入字节序列，默认为空
+        """
+        self.seed: int = seed
+        self.frames: bytearray = frames if frames is not None else bytearray()
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def to_bytes(self) -> bytes:
+        """把回放数据编码为紧凑的二进制格式。
+
+        Returns:
+            bytes: 编码后的文件内容
+        """
+        chunks: List[bytes] = [
+            _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(self.frames), self.seed)
+        ]
+        frames = self.frames
+        i = 0
+        n = len(frames)
+        while i < n:
+            value = frames[i]
+            j = i + 1
+            while j < n and frames[j] == value and j - i < _MAX_RUN:
+                j += 1
+            chunks.append(_RUN.pack(value, j - i))
+            i = j
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """从二进制数据解码回放。
+
+        Args:
+            data (bytes): to_bytes() 生成的文件内容
+
+        Returns:
+            Replay: 解码后的回放数据
+
+        Raises:
+            ValueError: 当数据不是有效的回放文件时
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("replay data too short")
+        magic, version, frame_count, seed = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version: {version}")
+
+        frames = bytearray()
+        for value, run in _RUN.iter_unpack(data[_HEADER.size:]):
+            frames.extend(bytes((value,)) * run)
+        if len(frames) != frame_count:
+            raise ValueError("replay frame count mismatch")
+        return cls(seed, frames)
+
+
+def load_replay(path: str) -> Replay:
+    """从文件加载回放。
+
+    Args:
+        path (str): 回放文件路径
+
+    Returns:
+        Replay: 回放数据
+    """
+    with open(path, "rb") as f:
+        return Replay.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """回放录制器类。
+
+    Game 在每一帧结束时调用 record_frame()，记录该帧的按键和事件。
+
+    Attributes:
+        replay (Replay): 正在录制的回放数据
+    """
+
+    def __init__(self, seed: int) -> None:
+        """初始化录制器。
+
+        Args:
+            seed (int): 被录制对局的随机种子
+
+        Raises:
+            ValueError: 当种子无法以 uint64 写入回放文件时
+        """
+        if not 0 <= seed < MAX_SEED:
+            raise ValueError(f"replay seed must be in [0, 2**64): {seed}")
+        self.replay: Replay = Replay(seed)
+
+    def record_frame(self, keys_pressed, events: int = 0) -> None:
+        """记录一帧的输入。
+
+        Args:
+            keys_pressed: 该帧 update_game 读取的按键状态，None表示未读取
+            events (int): 该帧发生的事件位（EVENT_RESTART、EVENT_SHOOT）
+        """
+        self.replay.frames.append(keys_to_mask(keys_pressed) | events)
+
+    def save(self, path: str) -> None:
+        """把录制结果写入文件。
+
+        Args:
+            path (str): 回放文件路径
+        """
+        with open(path, "wb") as f:
+            f.write(self.replay.to_bytes())
+
+
+class ReplayInput(InputSource):
+    """回放输入源，返回回放器设置的当前帧按键状态。"""
+
+    def __init__(self) -> None:
+        self._states: List[KeyState] = [mask_to_keys(mask) for mask in range(KEY_MASK + 1)]
+        self.state: KeyState = self._states[0]
+
+    def set_mask(self, mask: int) -> None:
+        """设置当前帧的输入位掩码。
+
+        Args:
+            mask (int): 输入位掩码（事件位会被忽略）
+        """
+        self.state = self._states[mask & KEY_MASK]
+
+    def get_pressed(self) -> KeyState:
+        """返回当前帧的按键状态。
+
+        Returns:
+            KeyState: 当前帧的按键状态
+        """
+        return self.state
+
+
+class ReplayPlayer:
+    """回放播放器类。
+
+    以无窗口模式重新模拟录制的对局，不限帧率。可以选择每N帧渲染一次，
+    用于观看回放或对 draw() 进行真实负载的性能分析。
+
+    Attributes:
+        replay (Replay): 要播放的回放数据
+        render_every (int): 每隔多少帧渲染一次，0表示不渲染
+        display (bool): 渲染时是否显示到窗口
+        game (Game): 用于重新模拟的游戏实例
+    """
+
+    def __init__(self, replay: Replay, render_every: int = 0, display: bool = False) -> None:
+        """初始化回放播放器。
+
+        Args:
+            replay (Replay): 要播放的回放数据
+            render_every (int): 每隔多少帧渲染一次，默认为0（不渲染）
+            display (bool): 渲染时是否创建窗口显示画面，默认为False
+        """
+        from game import Game
+
+        self.replay: Replay = replay
+        self.render_every: int = render_every
+        self.display: bool = display
+        self.input: ReplayInput = ReplayInput()
+        self.game = Game(headless=True, input_source=self.input, seed=replay.seed)
+        self._window: Optional[pygame.Surface] = None
+
+        if display and render_every:
+            self._window = pygame.display.set_mode(self.game.screen.get_size())
+            pygame.display.set_caption("飞机大战 - 回放")
+            self.game._init_fonts()
+
+    def step(self, mask: int) -> None:
+        """按录制时的顺序重放一帧：先处理事件，再更新游戏逻辑。
+
+        Args:
+            mask (int): 该帧的输入字节
+        """
+        game = self.game
+        if mask & EVENT_RESTART and game.game_over:
+            game.restart_game()
+        if mask & EVENT_SHOOT and not game.game_over:
+            game._handle_player_shoot()
+        self.input.set_mask(mask)
+        game.update_game()
+
+    def run(self) -> dict:
+        """播放整个回放。
+
+        Returns:
+            dict: 运行统计，包含 frames、rendered、elapsed、fps 和 score
+        """
+        game = self.game
+        step = self.step
+        render_every = self.render_every
+        rendered = 0
+        start = time.perf_counter()
+
+        for frame, mask in enumerate(self.replay.frames):
+            step(mask)
+            if render_every and frame % render_every == 0:
+                self._render()
+                rendered += 1
+
+        elapsed = time.perf_counter() - start
+        frames = len(self.replay.frames)
+        return {
+            "frames": frames,
+            "rendered": rendered,
+            "elapsed": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else float("inf"),
+            "score": game.score,
+        }
+
+    def _render(self) -> None:
+        """渲染当前帧，需要时显示到窗口。"""
+        self.game.draw()
+        if self._window is not None:
+            pygame.event.pump()
+            self._window.blit(self.game.screen, (0, 0))
+            pygame.display.flip()
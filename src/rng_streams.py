@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""随机数流模块。
+
+本模块为每局游戏提供由同一个种子派生的多个独立随机数流。
+敌机生成、敌机射击和道具掉落各自使用独立的流，某一个子系统多消耗
+或少消耗随机数不会影响其他子系统，同一个种子总能复现同一局游戏。
+
+典型用法示例:
+    streams = RngStreams(seed=12345)
+    if streams.spawn.random() < ENEMY_SPAWN_RATE:
+        ...
+"""
+
+import random
+from typing import Optional
+
+
+class RngStreams:
+    """每局游戏的随机数流集合类。
+
+    Attributes:
+        seed (int): 本局游戏的种子
+        spawn (random.Random): 敌机生成使用的随机数流
+        enemy (random.Random): 敌机射击使用的随机数流
+        item (random.Random): 道具掉落使用的随机数流
+    """
+
+    STREAM_NAMES = ("spawn", "enemy", "item")
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """初始化随机数流。
+
+        Args:
+            seed (Optional[int]): 种子；为None时随机选择一个种子并记录下来
+        """
+        self.seed: int = 0
+        self.spawn: random.Random = random.Random()
+        self.enemy: random.Random = random.Random()
+        self.item: random.Random = random.Random()
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """用新的种子重新初始化所有随机数流。
+
+        每个流的种子由本局种子和流名称共同决定，各流之间互不相关。
+
+        Args:
+            seed (Optional[int]): 种子；为None时随机选择一个种子并记录下来
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.STREAM_NAMES:
+            getattr(self, name).seed(f"plane_wars:{seed}:{name}")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""并行对局模块。
+
+本模块用进程池并行运行大量带种子的无窗口对局，用于平衡性调参：
+给定参数网格和策略，每组参数 × 每个种子运行一局，结果在完成时逐个返回。
+
+- 参数网格：{参数名: [取值, ...]}，参数名是运行时配置的参数
+  （见 game_config.CONFIG_KEYS），parameter_grid() 展开为所有组合；
+  每组参数在基础配置上覆盖后得到一个 GameConfig
+- 策略：可被 pickle 的可调用对象 policy(observation) -> 动作编号，
+  观测和动作与 PlaneWarsEnv 相同；如果策略有 reset(seed) 方法，
+  每局开始前调用一次。None 表示一直不动（只靠自动射击）
+- 每个工作进程只创建一个 PlaneWarsEnv，之后的对局都复用其中的游戏实例，
+  每局开始时通过 reset(seed, config) 切换到本组参数的配置，不需要新进程；
+  每组参数的配置（含派生值）在每个工作进程中只创建一次
+- 对局按 chunk_size 分组提交，减少进程间通信；工作进程之间不共享状态，
+  吞吐量随核心数近似线性增长
+
+每局的结果是一个字典：params_index、params、seed、score、ticks、
+kills_small、kills_medium、items_collected 和 truncated。
+
+典型用法示例:
+    grid = {"ENEMY_SPAWN_RATE": [0.01, 0.02, 0.04], "ENEMY_BULLET_RATE": [0.005, 0.01]}
+    for result in run_rollouts(grid, seeds=range(100), workers=8):
+        print(result["params"], result["score"])
+"""
+
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from game_config import CONFIG_KEYS, DEFAULT_CONFIG, GameConfig
+from game_env import PlaneWarsEnv, N_ACTIONS
+
+# 一局对局的任务：(参数组编号, 参数, 种子)
+MatchTask = Tuple[int, Dict[str, Any], int]
+
+Policy = Callable[[Any], int]
+
+
+class RandomPolicy:
+    """随机策略类：每步均匀随机选择一个动作（每局按种子重置）。"""
+
+    def __init__(self) -> None:
+        self.rng: random.Random = random.Random(0)
+
+    def reset(self, seed: int) -> None:
+        """按对局种子重置随机数源。
+
+        Args:
+            seed (int): 对局种子
+        """
+        self.rng.seed(seed)
+
+    def __call__(self, observation: Any) -> int:
+        return self.rng.randrange(N_ACTIONS)
+
+
+def parameter_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """展开参数网格。
+
+    Args:
+        grid (Dict[str, Sequence[Any]]): 参数名 -> 取值列表
+
+    Returns:
+        List[Dict[str, Any]]: 所有参数组合（按参数出现的顺序排列）
+
+    Raises:
+        ValueError: 参数名不在 CONFIG_KEYS 中
+    """
+    for name in grid:
+        if name not in CONFIG_KEYS:
+            raise ValueError(f"unknown parameter: {name}")
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+# 工作进程的状态（每个进程一份）
+_worker_env: Optional[PlaneWarsEnv] = None
+_worker_policy: Optional[Policy] = None
+_worker_base: GameConfig = DEFAULT_CONFIG
+_worker_configs: Dict[int, GameConfig] = {}  # 参数组编号 -> 配置
+
+
+def _init_worker(policy: Optional[Policy], frame_skip: int, max_steps: Optional[int],
+                 base: GameConfig) -> None:
+    """工作进程初始化：创建本进程复用的环境。"""
+    global _worker_env, _worker_policy, _worker_base
+    _worker_env = PlaneWarsEnv(frame_skip=frame_skip, max_steps=max_steps, config=base)
+    _worker_policy = policy
+    _worker_base = base
+    _worker_configs.clear()
+
+
+def play_match(env: PlaneWarsEnv, policy: Optional[Policy], params_index: int,
+               params: Dict[str, Any], seed: int,
+               config: Optional[GameConfig] = None) -> Dict[str, Any]:
+    """在给定环境中运行一局。
+
+    Args:
+        env (PlaneWarsEnv): 环境（其中的游戏实例被复用）
+        policy (Optional[Policy]): 策略，None 表示一直不动
+        params_index (int): 参数组编号（原样写入结果）
+        params (Dict[str, Any]): 本局的参数（原样写入结果）
+        seed (int): 本局种子
+        config (Optional[GameConfig]): 本局的配置，默认为 DEFAULT_CONFIG 覆盖 params 后的配置
+
+    Returns:
+        Dict[str, Any]: 本局结果
+    """
+    if config is None:
+        config = DEFAULT_CONFIG.replace(**params)
+    game = env.game
+    observation = env.reset(seed, config)
+    if policy is not None and hasattr(policy, "reset"):
+        policy.reset(seed)
+
+    done = False
+    info = env.info
+    while not done:
+        action = policy(observation) if policy is not None else 0
+        observation, _, done, info = env.step(action)
+
+    return {
+        "params_index": params_index,
+        "params": params,
+        "seed": seed,
+        "score": game.score,
+        "ticks": game.sim_clock.ticks,
+        "kills_small": game.kills["small"],
+        "kills_medium": game.kills["medium"],
+        "items_collected": game.items_collected,
+        "truncated": info["truncated"],
+    }
+
+
+def _worker_config(index: int, params: Dict[str, Any]) -> GameConfig:
+    """获取参数组的配置（每个工作进程中每组参数只创建一次）。"""
+    config = _worker_configs.get(index)
+    if config is None:
+        config = _worker_configs[index] = _worker_base.replace(**params)
+    return config
+
+
+def _run_chunk(tasks: List[MatchTask]) -> List[Dict[str, Any]]:
+    """工作进程：依次运行一组对局。"""
+    return [play_match(_worker_env, _worker_policy, index, params, seed, _worker_config(index, params))
+            for index, params, seed in tasks]
+
+
+def run_rollouts(grid: Dict[str, Sequence[Any]], policy: Optional[Policy] = None,
+                 seeds: Iterable[int] = range(10), workers: Optional[int] = None,
+                 frame_skip: int = 1, max_steps: Optional[int] = None,
+                 chunk_size: int = 4,
+                 config: Optional[GameConfig] = None) -> Iterator[Dict[str, Any]]:
+    """用进程池运行参数网格中每组参数 × 每个种子的对局。
+
+    结果按完成顺序逐个产出（不是提交顺序），可以用 params_index 和 seed 对应回任务。
+
+    Args:
+        grid (Dict[str, Sequence[Any]]): 参数网格，见 parameter_grid()
+        policy (Optional[Policy]): 策略，需要能被 pickle；None 表示一直不动
+        seeds (Iterable[int]): 每组参数运行的种子
+        workers (Optional[int]): 工作进程数，默认为 CPU 核心数
+        frame_skip (int): 每个动作持续的逻辑帧数
+        max_steps (Optional[int]): 每局最多的步数，默认运行到游戏结束
+        chunk_size (int): 每次提交给工作进程的对局数
+        config (Optional[GameConfig]): 基础配置（例如 load_config() 加载的配置档案），
+            网格中的参数覆盖其中的同名参数；默认为 DEFAULT_CONFIG
+
+    Yields:
+        Dict[str, Any]: 每局的结果
+
+    Raises:
+        ValueError: 参数名不在 CONFIG_KEYS 中，或参数值不合法
+    """
+    base = config if config is not None else DEFAULT_CONFIG
+    combos = parameter_grid(grid)
+    for params in combos:
+        base.replace(**params)  # 提交前检查参数值，避免在工作进程中才出错
+    seeds = list(seeds)
+    tasks: List[MatchTask] = [(index, params, seed)
+                              for index, params in enumerate(combos) for seed in seeds]
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(policy, frame_skip, max_steps, base)) as pool:
+        futures = [pool.submit(_run_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """按参数组汇总对局结果（各项统计的平均值）。
+
+    Args:
+        results (Iterable[Dict[str, Any]]): run_rollouts() 产出的结果
+
+    Returns:
+        List[Dict[str, Any]]: 按 params_index 排序的汇总，每项包含 params、matches
+            以及 score、ticks、kills_small、kills_medium、items_collected 的平均值
+    """
+    keys = ("score", "ticks", "kills_small", "kills_medium", "items_collected")
+    groups: Dict[int, Dict[str, Any]] = {}
+    for result in results:
+        group = groups.setdefault(result["params_index"], {
+            "params_index": result["params_index"], "params": result["params"], "matches": 0,
+            **{key: 0 for key in keys},
+        })
+        group["matches"] += 1
+        for key in keys:
+            group[key] += result[key]
+    for group in groups.values():
+        for key in keys:
+            group[key] /= group["matches"]
+    return [groups[index] for index in sorted(groups)]
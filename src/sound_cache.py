@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""音效缓存文件模块。
+
+本模块把合成好的 PCM 数据保存到用户缓存目录中的一个二进制文件，
+以后启动时直接读取，不需要导入 NumPy 重新合成。
+
+文件格式（小端序）:
+    文件头: 魔数 b"PWSC"、格式版本(uint16)、采样率(uint32)、声道数(uint8)、条目数(uint32)
+    每个条目: 名称长度(uint16)、参数摘要(20字节)、数据长度(uint32)、名称(UTF-8)、PCM数据
+
+参数摘要由格式版本、音效参数、采样率和声道数计算得出。参数或混音器设置
+变化后摘要不再匹配，对应的音效会被重新合成；文件头不匹配时整个文件被忽略。
+
+典型用法示例:
+    entries = load_sound_cache(path, 22050, 2)
+    digest, pcm = entries["shot"]
+    if digest == sound_key(SOUND_SPECS["shot"], 22050, 2):
+        sound = pygame.mixer.Sound(buffer=pcm)
+"""
+
+import hashlib
+import json
+import os
+import struct
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+SOUND_CACHE_MAGIC: bytes = b"PWSC"
+SOUND_CACHE_VERSION: int = 1
+
+_HEADER = struct.Struct("<4sHIBI")
+_ENTRY = struct.Struct("<H20sI")
+
+# 缓存条目：(参数摘要, PCM数据)
+CacheEntry = Tuple[bytes, Any]
+
+
+def sound_key(params: Mapping[str, Any], sample_rate: int, channels: int) -> bytes:
+    """计算音效参数的摘要。
+
+    Args:
+        params (Mapping[str, Any]): 音效参数
+        sample_rate (int): 采样率
+        channels (int): 声道数
+
+    Returns:
+        bytes: 20字节的 SHA-1 摘要
+    """
+    text = json.dumps([SOUND_CACHE_VERSION, params, sample_rate, channels], sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).digest()
+
+
+def load_sound_cache(path: Optional[str], sample_rate: int, channels: int) -> Dict[str, CacheEntry]:
+    """读取音效缓存文件。
+
+    PCM 数据以 memoryview 的形式返回，指向一次读入的文件内容，不做额外拷贝。
+
+    Args:
+        path (Optional[str]): 缓存文件路径
+        sample_rate (int): 混音器采样率
+        channels (int): 混音器声道数
+
+    Returns:
+        Dict[str, CacheEntry]: {音效名称: (参数摘要, PCM数据)}；文件不存在、损坏或
+            采样率/声道数不匹配时返回空字典
+    """
+    if not path:
+        return {}
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return {}
+
+    view = memoryview(data)
+    try:
+        magic, version, rate, chans, count = _HEADER.unpack_from(view, 0)
+        if (magic, version, rate, chans) != (SOUND_CACHE_MAGIC, SOUND_CACHE_VERSION,
+                                             sample_rate, channels):
+            return {}
+
+        entries: Dict[str, CacheEntry] = {}
+        offset = _HEADER.size
+        for _ in range(count):
+            name_len, digest, nbytes = _ENTRY.unpack_from(view, offset)
+            offset += _ENTRY.size
+            name = bytes(view[offset:offset + name_len]).decode("utf-8")
+            offset += name_len
+            if offset + nbytes > len(view):
+                return {}
+            entries[name] = (digest, view[offset:offset + nbytes])
+            offset += nbytes
+    except (struct.error, UnicodeDecodeError):
+        return {}
+    return entries
+
+
+def save_sound_cache(path: Optional[str], sample_rate: int, channels: int,
+                     entries: Mapping[str, CacheEntry]) -> bool:
+    """写入音效缓存文件（先写临时文件再替换，避免留下半个文件）。
+
+    Args:
+        path (Optional[str]): 缓存文件路径
+        sample_rate (int): 混音器采样率
+        channels (int): 混音器声道数
+        entries (Mapping[str, CacheEntry]): {音效名称: (参数摘要, PCM数据)}
+
+    Returns:
+        bool: 是否写入成功
+    """
+    if not path:
+        return False
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SOUND_CACHE_MAGIC, SOUND_CACHE_VERSION,
+                                 sample_rate, channels, len(entries)))
+            for name, (digest, pcm) in entries.items():
+                encoded = name.encode("utf-8")
+                f.write(_ENTRY.pack(len(encoded), digest, len(pcm)))
+                f.write(encoded)
+                f.write(pcm)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
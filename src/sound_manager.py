@@ -5,6 +5,16 @@
 本模块负责管理游戏中的所有音效，包括射击、击杀、爆炸等音效。
 支持音效的加载、播放和音量控制。
 
+音效由 SOUND_SPECS 中的参数程序化合成（见 sound_synth.py）。合成结果按
+混音器采样率、声道数和参数保存到用户缓存目录（见 sound_cache.py），之后
+启动时直接从缓存加载，不需要导入 NumPy；缓存缺少的音效在后台线程中合成，
+或者在第一次播放时合成。后台线程结束时写一次缓存；第一次播放时合成的
+音效只在退出时由 flush_cache() 统一写入，游戏过程中不写文件。
+
+播放请求经过 VoiceManager 筛选（见 voice_manager.py）：每类音效有保留的
+混音器通道，同一音效有最小重播间隔，通道用完时按 SOUND_VOICES 中的优先级
+抢占或丢弃；射击音效每 SHOOT_SOUND_INTERVAL 次射击才请求一次。
+
 典型用法示例:
     sound_manager = SoundManager()
     sound_manager.play_shoot()
@@ -12,398 +22,305 @@
 """
 
 import pygame
-import os
-from typing import Dict, Optional
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from config import (
+    SOUND_CACHE_ENABLED, SOUND_PRELOAD_IN_BACKGROUND, SHOOT_SOUND_INTERVAL,
+    SOUND_MAX_VOICES, SOUND_RESERVED_CHANNELS, SOUND_MIN_INTERVALS
+)
+from sound_cache import CacheEntry, load_sound_cache, save_sound_cache, sound_key
+from user_cache import cache_file
+from voice_manager import VoiceManager
+
+# 音效缓存文件名（位于用户缓存目录）
+SOUND_CACHE_FILE: str = "sounds.bin"
+
+# 音效合成参数（1.1.0 需求音效）
+#   synth:     合成方式（"tone" 正弦音、"noisy" 正弦加噪音、"distorted" 失真正弦音）
+#   duration:  时长（秒）
+#   amplitude: 振幅（int16）
+#   envelope:  包络 (类型, 速率)
+#   volume:    相对于总音量的音量系数
+SOUND_SPECS: Dict[str, Dict[str, Any]] = {
+    # 玩家操作音效
+    'shot': {  # 发射子弹音效：高频噪音模拟射击声，快速衰减
+        'synth': 'noisy', 'duration': 0.1, 'amplitude': 32767, 'envelope': ('decay', 20),
+        'frequencies': (800,), 'tone_gain': 1.0, 'noise': 0.3, 'seed': 1, 'volume': 0.3,
+    },
+    # 战斗音效
+    'hit_small': {  # 小型敌机被击中：低频短促"噗"声
+        'synth': 'tone', 'duration': 0.1, 'amplitude': 16383, 'envelope': ('decay', 30),
+        'frequency': (200, 200), 'volume': 0.4,
+    },
+    'hit_medium': {  # 中型敌机被击中：中频稍长"嘭"声
+        'synth': 'tone', 'duration': 0.15, 'amplitude': 20000, 'envelope': ('decay', 15),
+        'frequency': (150, 150), 'volume': 0.5,
+    },
+    'explosion': {  # 敌机爆炸：低频加大量噪音，中等衰减
+        'synth': 'noisy', 'duration': 0.3, 'amplitude': 32767, 'envelope': ('decay', 5),
+        'frequencies': (100, 200), 'tone_gain': 0.3, 'noise': 0.8, 'seed': 2, 'volume': 0.6,
+    },
+    'player_hit': {  # 玩家被击中：低频厚重"咚"声
+        'synth': 'tone', 'duration': 0.2, 'amplitude': 25000, 'envelope': ('decay', 8),
+        'frequency': (80, 80), 'volume': 0.6,
+    },
+    'hit': {  # 受击警告声：带失真效果的中频音
+        'synth': 'distorted', 'duration': 0.2, 'amplitude': 32767, 'envelope': ('decay', 8),
+        'frequency': 400, 'volume': 0.4,
+    },
+    'enemy_spawn': {  # 敌机出现：上升音调，快速上升包络
+        'synth': 'tone', 'duration': 0.15, 'amplitude': 32767, 'envelope': ('attack', 10),
+        'frequency': (200, 600), 'gain': 0.5, 'volume': 0.3,
+    },
+    # 道具音效
+    'item_pick': {  # 道具拾取：高频清脆"叮"声
+        'synth': 'tone', 'duration': 0.2, 'amplitude': 15000, 'envelope': ('decay', 12),
+        'frequency': (1200, 1200), 'volume': 0.3,
+    },
+    # 状态音效
+    'start': {  # 游戏开始：A4 上升到 A5
+        'synth': 'tone', 'duration': 1.5, 'amplitude': 20000, 'envelope': ('decay_fade', 2),
+        'frequency': (440, 880), 'volume': 0.4,
+    },
+    'game_over': {  # 游戏结束：A3 下降到 A2 的低沉长音
+        'synth': 'tone', 'duration': 1.5, 'amplitude': 25000, 'envelope': ('decay', 1.5),
+        'frequency': (220, 110), 'volume': 0.5,
+    },
+}
+
+# 每个音效的声部设置：(类别, 优先级)，优先级数值越大越重要
+SOUND_VOICES: Dict[str, Tuple[str, int]] = {
+    'start': ('jingle', 5),
+    'game_over': ('jingle', 5),
+    'player_hit': ('alert', 4),
+    'hit': ('alert', 4),
+    'item_pick': ('alert', 3),
+    'explosion': ('explosion', 3),
+    'hit_medium': ('hit', 2),
+    'hit_small': ('hit', 2),
+    'shot': ('player', 1),
+    'enemy_spawn': ('ambient', 0),
+}
+
+# 保持兼容性的旧音效名称
+SOUND_ALIASES: Dict[str, str] = {
+    'shoot': 'shot',
+    'enemy_kill': 'explosion',
+}
 
 
 class SoundManager:
     """音效管理器类。
-    
+
     负责管理游戏中的所有音效，包括加载、播放和控制音效。
     支持程序生成的音效，无需外部音频文件。
-    
+
     Attributes:
         enabled (bool): 是否启用音效
         volume (float): 音效音量 (0.0 - 1.0)
-        sounds (Dict): 存储所有音效的字典
+        sounds (Dict): 已创建的音效对象（按需创建，键为 SOUND_SPECS 中的名称）
+        sample_rate (int): 混音器实际采样率
+        channels (int): 混音器实际声道数
+        voices (Optional[VoiceManager]): 声部管理器（音效未启用时为None）
+        shoot_sound_interval (int): 每多少次射击播放一次射击音效
     """
-    
-    def __init__(self, enabled: bool = True, volume: float = 0.7) -> None:
+
+    def __init__(self, enabled: bool = True, volume: float = 0.7,
+                 cache_enabled: bool = SOUND_CACHE_ENABLED,
+                 preload: bool = SOUND_PRELOAD_IN_BACKGROUND,
+                 clock=None) -> None:
         """初始化音效管理器。
 
         Args:
             enabled (bool): 是否启用音效，默认为True
             volume (float): 音效音量，范围0.0-1.0，默认为0.7（按需求1.1.0）
+            cache_enabled (bool): 是否使用磁盘上的音效缓存
+            preload (bool): 是否在后台线程合成缓存中缺少的音效
+            clock: 时钟对象（计算重播间隔使用），需提供 now() 方法；默认使用真实时间
         """
         self.enabled: bool = enabled
         self.volume: float = max(0.0, min(1.0, volume))
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.sample_rate: int = 0
+        self.channels: int = 0
+        self.voices: Optional[VoiceManager] = None
+        self.shoot_sound_interval: int = max(1, SHOOT_SOUND_INTERVAL)
+        self._shot_count: int = 0
+
+        # 音效的参数摘要与 PCM 数据（后台线程也会写入，访问时加锁）
+        self._pcm: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._cache_path: Optional[str] = None
+        self._cache_dirty: bool = False  # 是否有尚未写入缓存文件的音效
+
+        # 禁用音效时不初始化音频设备（例如无窗口模拟）
+        if not self.enabled:
+            return
 
         # 初始化pygame音频模块
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-            self._generate_sounds()
+            # 设备可能给出与请求不同的格式，按实际格式生成 PCM 数据
+            self.sample_rate, size, self.channels = pygame.mixer.get_init()
+            if size != -16:
+                raise pygame.error(f"unsupported sample format: {size}")
+            self.voices = VoiceManager(SOUND_MAX_VOICES, SOUND_RESERVED_CHANNELS, clock=clock)
         except pygame.error as e:
             print(f"Warning: Could not initialize sound system: {e}")
             self.enabled = False
-            
-    def _generate_sounds(self) -> None:
-        """生成程序化音效。
-        
-        使用pygame生成简单的音效，无需外部音频文件。
-        """
+            return
+
+        if cache_enabled:
+            self._cache_path = cache_file(SOUND_CACHE_FILE)
+        self._load_cache()
+
+        missing = [name for name in SOUND_SPECS if name not in self._pcm]
+        if missing and preload:
+            self._worker = threading.Thread(target=self._preload, args=(missing,),
+                                            name="sound-synth", daemon=True)
+            self._worker.start()
+
+    def _key(self, name: str) -> bytes:
+        return sound_key(SOUND_SPECS[name], self.sample_rate, self.channels)
+
+    def _load_cache(self) -> None:
+        """从缓存文件加载参数未变化的音效数据。"""
+        entries = load_sound_cache(self._cache_path, self.sample_rate, self.channels)
+        for name in SOUND_SPECS:
+            entry = entries.get(name)
+            if entry is not None and entry[0] == self._key(name):
+                self._pcm[name] = entry
+
+    def _save_cache(self) -> None:
+        """把目前所有音效数据写回缓存文件。"""
+        with self._lock:
+            entries = dict(self._pcm)
+        save_sound_cache(self._cache_path, self.sample_rate, self.channels, entries)
+
+    def _synthesize(self, name: str) -> CacheEntry:
+        """合成一个音效（只在这里导入 NumPy）。"""
+        from sound_synth import synthesize, to_pcm
+
+        wave = synthesize(SOUND_SPECS[name], self.sample_rate)
+        return self._key(name), to_pcm(wave, self.channels)
+
+    def _preload(self, names: List[str]) -> None:
+        """后台线程：合成缓存中缺少的音效并保存缓存。"""
         try:
-            # 1.1.0 需求音效
-            # 玩家操作音效
-            self.sounds['shot'] = self._create_shoot_sound()  # 发射子弹音效
-
-            # 战斗音效
-            self.sounds['hit_small'] = self._create_hit_small_sound()  # 小型敌机被击中
-            self.sounds['hit_medium'] = self._create_hit_medium_sound()  # 中型敌机被击中
-            self.sounds['explosion'] = self._create_explosion_sound()  # 敌机爆炸
-            self.sounds['player_hit'] = self._create_player_hit_sound()  # 玩家被击中
-
-            # 道具音效
-            self.sounds['item_pick'] = self._create_item_pick_sound()  # 道具拾取
+            for name in names:
+                entry = self._synthesize(name)
+                with self._lock:
+                    self._pcm.setdefault(name, entry)
+        except Exception as e:
+            print(f"Warning: Could not generate sounds: {e}")
+            return
+        self._save_cache()
 
-            # 状态音效
-            self.sounds['start'] = self._create_start_sound()  # 游戏开始
-            self.sounds['game_over'] = self._create_game_over_sound()  # 游戏结束
+    def flush_cache(self) -> None:
+        """把第一次播放时合成的音效写入缓存文件（退出时调用）。"""
+        if self._cache_dirty and self.is_ready():
+            self._cache_dirty = False
+            self._save_cache()
 
-            # 保持兼容性的旧音效名称
-            self.sounds['shoot'] = self.sounds['shot']
-            self.sounds['enemy_kill'] = self.sounds['explosion']
-            self.sounds['enemy_spawn'] = self._create_spawn_sound()
+    def is_ready(self) -> bool:
+        """检查后台合成是否已经结束。
 
-        except Exception as e:
-            print(f"Warning: Could not generate sounds: {e}")
-            self.enabled = False
-            
-    def _create_shoot_sound(self) -> pygame.mixer.Sound:
-        """创建射击音效。
-        
         Returns:
-            pygame.mixer.Sound: 射击音效对象
+            bool: 没有正在运行的后台合成线程时返回True
         """
-        # 创建短促的射击声
-        duration = 0.1  # 0.1秒
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        # 生成音频数据
-        import numpy as np
-        
-        # 高频噪音模拟射击声
-        frequency = 800  # 800Hz
-        t = np.linspace(0, duration, frames, False)
-        
-        # 基础正弦波
-        wave = np.sin(frequency * 2 * np.pi * t)
-        
-        # 添加噪音
-        noise = np.random.normal(0, 0.3, frames)
-        wave = wave + noise
-        
-        # 应用包络（快速衰减）
-        envelope = np.exp(-t * 20)
-        wave = wave * envelope
-        
-        # 转换为pygame音频格式
-        wave = (wave * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.3)  # 射击声音较小
-        
-        return sound
-        
-    def _create_explosion_sound(self) -> pygame.mixer.Sound:
-        """创建爆炸音效。
-        
-        Returns:
-            pygame.mixer.Sound: 爆炸音效对象
-        """
-        # 创建爆炸声
-        duration = 0.3  # 0.3秒
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        import numpy as np
-        
-        t = np.linspace(0, duration, frames, False)
-        
-        # 低频爆炸声
-        frequency1 = 100  # 100Hz
-        frequency2 = 200  # 200Hz
-        
-        wave1 = np.sin(frequency1 * 2 * np.pi * t)
-        wave2 = np.sin(frequency2 * 2 * np.pi * t)
-        
-        # 添加大量噪音模拟爆炸
-        noise = np.random.normal(0, 0.8, frames)
-        wave = (wave1 + wave2) * 0.3 + noise
-        
-        # 应用包络（中等衰减）
-        envelope = np.exp(-t * 5)
-        wave = wave * envelope
-        
-        # 转换为pygame音频格式
-        wave = (wave * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.6)  # 爆炸声音较大
-        
-        return sound
-        
-    def _create_hit_sound(self) -> pygame.mixer.Sound:
-        """创建受击音效。
-        
+        return self._worker is None or not self._worker.is_alive()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """等待后台合成结束。
+
+        Args:
+            timeout (Optional[float]): 最长等待秒数，None表示一直等待
+
         Returns:
-            pygame.mixer.Sound: 受击音效对象
+            bool: 后台合成是否已经结束
         """
-        # 创建受击声
-        duration = 0.2  # 0.2秒
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        import numpy as np
-        
-        t = np.linspace(0, duration, frames, False)
-        
-        # 中频警告声
-        frequency = 400  # 400Hz
-        wave = np.sin(frequency * 2 * np.pi * t)
-        
-        # 添加失真效果
-        wave = np.sign(wave) * np.power(np.abs(wave), 0.5)
-        
-        # 应用包络
-        envelope = np.exp(-t * 8)
-        wave = wave * envelope
-        
-        # 转换为pygame音频格式
-        wave = (wave * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.4)
-        
-        return sound
-        
-    def _create_spawn_sound(self) -> pygame.mixer.Sound:
-        """创建敌机出现音效。
-        
-        Returns:
-            pygame.mixer.Sound: 敌机出现音效对象
+        if self._worker is not None:
+            self._worker.join(timeout)
+        return self.is_ready()
+
+    def _get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """获取音效对象，第一次使用时创建。
+
+        后台线程仍在合成该音效时返回None（本次不播放）；没有后台线程时
+        在这里同步合成，缓存文件留到 flush_cache() 时再写。
         """
-        # 创建敌机出现声
-        duration = 0.15  # 0.15秒
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        import numpy as np
-        
-        t = np.linspace(0, duration, frames, False)
-        
-        # 上升音调
-        frequency_start = 200
-        frequency_end = 600
-        frequency = frequency_start + (frequency_end - frequency_start) * t / duration
-        
-        wave = np.sin(frequency * 2 * np.pi * t)
-        
-        # 应用包络
-        envelope = 1 - np.exp(-t * 10)  # 快速上升
-        wave = wave * envelope * 0.5
-        
-        # 转换为pygame音频格式
-        wave = (wave * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.3)
-        
+        name = SOUND_ALIASES.get(sound_name, sound_name)
+        sound = self.sounds.get(name)
+        if sound is not None or name not in SOUND_SPECS:
+            return sound
+
+        with self._lock:
+            entry = self._pcm.get(name)
+        if entry is None:
+            if not self.is_ready():
+                return None
+            try:
+                entry = self._synthesize(name)
+            except Exception as e:
+                print(f"Warning: Could not generate sounds: {e}")
+                self.enabled = False
+                return None
+            with self._lock:
+                self._pcm[name] = entry
+            self._cache_dirty = True
+
+        # 直接使用缓存文件中的数据片段创建音效，不经过 NumPy 数组
+        sound = pygame.mixer.Sound(buffer=entry[1])
+        sound.set_volume(self.volume * SOUND_SPECS[name]['volume'])
+        self.sounds[name] = sound
         return sound
-        
+
     def play_shoot(self) -> None:
         """播放射击音效。"""
-        if self.enabled and 'shoot' in self.sounds:
-            try:
-                self.sounds['shoot'].play()
-            except pygame.error:
-                pass  # 忽略播放错误
-                
+        self._play_sound('shoot')
+
     def play_enemy_kill(self) -> None:
         """播放敌机击杀音效。"""
-        if self.enabled and 'enemy_kill' in self.sounds:
-            try:
-                self.sounds['enemy_kill'].play()
-            except pygame.error:
-                pass
-                
-    def play_player_hit(self) -> None:
-        """播放玩家受击音效。"""
-        if self.enabled and 'player_hit' in self.sounds:
-            try:
-                self.sounds['player_hit'].play()
-            except pygame.error:
-                pass
-                
+        self._play_sound('enemy_kill')
+
     def play_enemy_spawn(self) -> None:
         """播放敌机出现音效。"""
-        if self.enabled and 'enemy_spawn' in self.sounds:
-            try:
-                self.sounds['enemy_spawn'].play()
-            except pygame.error:
-                pass
-                
+        self._play_sound('enemy_spawn')
+
     def set_volume(self, volume: float) -> None:
         """设置音效音量。
-        
+
         Args:
             volume (float): 音量值，范围0.0-1.0
         """
         self.volume = max(0.0, min(1.0, volume))
-        for sound in self.sounds.values():
-            sound.set_volume(self.volume)
-            
+        for name, sound in self.sounds.items():
+            sound.set_volume(self.volume * SOUND_SPECS[name]['volume'])
+
     def toggle_sound(self) -> None:
         """切换音效开关。"""
         self.enabled = not self.enabled
-        
+
     def is_enabled(self) -> bool:
         """检查音效是否启用。
-        
+
         Returns:
             bool: 音效是否启用
         """
         return self.enabled
 
-    # 1.1.0 新增音效创建方法
-    def _create_hit_small_sound(self) -> pygame.mixer.Sound:
-        """创建小型敌机被击中音效（短促"噗"声）"""
-        duration = 0.1
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 低频短促声
-        frequency = 200
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 30)  # 快速衰减
-        wave = wave * envelope
-
-        wave = (wave * 16383).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.4)
-        return sound
-
-    def _create_hit_medium_sound(self) -> pygame.mixer.Sound:
-        """创建中型敌机被击中音效（稍长"嘭"声）"""
-        duration = 0.15
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 中频稍长声
-        frequency = 150
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 15)  # 较慢衰减
-        wave = wave * envelope
-
-        wave = (wave * 20000).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.5)
-        return sound
-
-    def _create_player_hit_sound(self) -> pygame.mixer.Sound:
-        """创建玩家被击中音效（低沉"咚"声）"""
-        duration = 0.2
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 低频厚重声
-        frequency = 80
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 8)  # 慢衰减
-        wave = wave * envelope
-
-        wave = (wave * 25000).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.6)
-        return sound
-
-    def _create_item_pick_sound(self) -> pygame.mixer.Sound:
-        """创建道具拾取音效（轻快"叮"声）"""
-        duration = 0.2
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 高频清脆声
-        frequency = 1200
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 12)
-        wave = wave * envelope
-
-        wave = (wave * 15000).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.3)
-        return sound
-
-    def _create_start_sound(self) -> pygame.mixer.Sound:
-        """创建游戏开始音效（激昂短音乐段）"""
-        duration = 1.5
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 上升音调
-        freq_start = 440  # A4
-        freq_end = 880    # A5
-        frequency = freq_start + (freq_end - freq_start) * t / duration
-
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 2) * (1 - t / duration)
-        wave = wave * envelope
-
-        wave = (wave * 20000).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.4)
-        return sound
-
-    def _create_game_over_sound(self) -> pygame.mixer.Sound:
-        """创建游戏结束音效（低沉长音）"""
-        duration = 1.5
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-
-        import numpy as np
-        t = np.linspace(0, duration, frames, False)
-
-        # 下降音调
-        freq_start = 220  # A3
-        freq_end = 110    # A2
-        frequency = freq_start - (freq_start - freq_end) * t / duration
-
-        wave = np.sin(frequency * 2 * np.pi * t)
-        envelope = np.exp(-t * 1.5)
-        wave = wave * envelope
-
-        wave = (wave * 25000).astype(np.int16)
-        sound = pygame.sndarray.make_sound(wave)
-        sound.set_volume(self.volume * 0.5)
-        return sound
-
     # 1.1.0 新增便捷播放方法
     def play_shot(self):
-        """播放发射子弹音效"""
-        self._play_sound('shot')
+        """播放发射子弹音效（每 shoot_sound_interval 次射击播放一次）"""
+        count = self._shot_count
+        self._shot_count = count + 1
+        if count % self.shoot_sound_interval == 0:
+            self._play_sound('shot')
+
+    def reset_shot_count(self) -> None:
+        """重置射击计数，使下一次射击播放音效（新一局开始时调用）。"""
+        self._shot_count = 0
 
     def play_hit_small(self):
         """播放小型敌机被击中音效"""
@@ -435,8 +352,15 @@ class SoundManager:
 
     def _play_sound(self, sound_name: str):
         """内部音效播放方法"""
-        if self.enabled and sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except pygame.error:
-                pass
+        if not self.enabled:
+            return
+        name = SOUND_ALIASES.get(sound_name, sound_name)
+        voice = SOUND_VOICES.get(name)
+        if voice is None:
+            return
+        try:
+            sound = self._get_sound(name)
+            if sound is not None:
+                self.voices.play(name, sound, voice[0], voice[1], SOUND_MIN_INTERVALS.get(name, 0.0))
+        except pygame.error:
+            pass
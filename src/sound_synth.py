@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""程序化音效合成模块。
+
+本模块根据 sound_manager.SOUND_SPECS 中的参数用 NumPy 合成单声道 int16
+PCM 波形。只有音效缓存中缺少某个音效时才需要导入本模块，因此 NumPy
+不会拖慢从缓存加载音效的正常启动。
+
+典型用法示例:
+    from sound_synth import synthesize, to_pcm
+
+    wave = synthesize(SOUND_SPECS["shot"], sample_rate=22050)
+    pcm = to_pcm(wave, channels=2)
+    sound = pygame.mixer.Sound(buffer=pcm)
+"""
+
+import numpy as np
+from typing import Any, Callable, Dict, Mapping
+
+
+def _envelope(t: np.ndarray, duration: float, envelope: Any) -> np.ndarray:
+    """计算包络。
+
+    envelope 为 (类型, 速率)：
+        "decay"      指数衰减 exp(-t * k)
+        "attack"     快速上升 1 - exp(-t * k)
+        "decay_fade" 指数衰减并线性淡出到0
+    """
+    kind, rate = envelope
+    if kind == "decay":
+        return np.exp(-t * rate)
+    if kind == "attack":
+        return 1 - np.exp(-t * rate)
+    if kind == "decay_fade":
+        return np.exp(-t * rate) * (1 - t / duration)
+    raise ValueError(f"unknown envelope: {kind}")
+
+
+def _tone(t: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    """正弦音（频率可以从起始值线性滑到结束值）。"""
+    duration = params["duration"]
+    freq_start, freq_end = params["frequency"]
+    frequency = freq_start + (freq_end - freq_start) * t / duration
+    wave = np.sin(frequency * 2 * np.pi * t)
+    return wave * _envelope(t, duration, params["envelope"]) * params.get("gain", 1.0)
+
+
+def _noisy(t: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    """若干正弦音叠加高斯噪音（射击、爆炸）。噪音使用固定种子，缓存结果可复现。"""
+    rng = np.random.default_rng(params["seed"])
+    wave = sum(np.sin(frequency * 2 * np.pi * t) for frequency in params["frequencies"])
+    wave = wave * params["tone_gain"] + rng.normal(0, params["noise"], len(t))
+    return wave * _envelope(t, params["duration"], params["envelope"])
+
+
+def _distorted(t: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    """带失真效果的正弦音（受击警告声）。"""
+    wave = np.sin(params["frequency"] * 2 * np.pi * t)
+    wave = np.sign(wave) * np.power(np.abs(wave), 0.5)
+    return wave * _envelope(t, params["duration"], params["envelope"])
+
+
+SYNTHS: Dict[str, Callable[[np.ndarray, Mapping[str, Any]], np.ndarray]] = {
+    "tone": _tone,
+    "noisy": _noisy,
+    "distorted": _distorted,
+}
+
+
+def synthesize(params: Mapping[str, Any], sample_rate: int) -> np.ndarray:
+    """合成一个音效的单声道波形。
+
+    Args:
+        params (Mapping[str, Any]): 音效参数（见 sound_manager.SOUND_SPECS）
+        sample_rate (int): 采样率
+
+    Returns:
+        numpy.ndarray: int16 单声道波形
+    """
+    duration = params["duration"]
+    frames = int(duration * sample_rate)
+    t = np.linspace(0, duration, frames, False)
+    wave = SYNTHS[params["synth"]](t, params) * params["amplitude"]
+    # 叠加噪音后可能超出 int16 范围，截断而不是回绕
+    return np.clip(wave, -32768, 32767).astype(np.int16)
+
+
+def to_pcm(wave: np.ndarray, channels: int) -> bytes:
+    """把单声道波形转换为混音器使用的交错 PCM 数据。
+
+    Args:
+        wave (numpy.ndarray): int16 单声道波形
+        channels (int): 混音器声道数
+
+    Returns:
+        bytes: 每帧 channels 个 int16 采样的 PCM 数据
+    """
+    if channels == 1:
+        return wave.tobytes()
+    return np.repeat(wave[:, None], channels, axis=1).tobytes()
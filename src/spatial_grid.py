@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""空间网格模块。
+
+本模块实现了覆盖整个游戏区域的均匀网格，用作碰撞检测的粗筛阶段
+（broad-phase）。网格只记录每个格子是否被敌机等较少的对象占用；大量子弹
+只需检查自己所在的格子是否被占用，只有与对象共享格子的子弹才进入精确检测。
+精确检测把这些候选子弹与全部对象一次广播求交（见 collision.py），
+不需要格子到对象的索引表。
+
+典型用法示例:
+    grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT)
+    grid.clear()
+    grid.insert_many(boxes)  # boxes 每行为(x, y, w, h)
+
+    mask = grid.candidate_mask(bullet_xs, bullet_ys, BULLET_WIDTH, BULLET_HEIGHT)
+    candidates = np.flatnonzero(mask)
+    overlap = overlap_matrix(bullet_xs[candidates], bullet_ys[candidates],
+                             BULLET_WIDTH, BULLET_HEIGHT,
+                             boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3])
+"""
+
+import numpy as np
+
+
+class SpatialGrid:
+    """均匀网格空间索引类。
+
+    把游戏区域划分为固定大小的格子，每个格子记录是否有对象与之重叠。
+    超出游戏区域的对象会被归入最近的边缘格子，这样相互重叠的两个矩形
+    一定至少共享一个格子，粗筛不会漏掉任何碰撞。
+
+    Attributes:
+        width (int): 索引覆盖区域的宽度（像素）
+        height (int): 索引覆盖区域的高度（像素）
+        cell_size (int): 每个格子的边长（像素）
+        cols (int): 格子列数
+        rows (int): 格子行数
+        occupied (numpy.ndarray): 每个格子是否有对象的布尔数组，形状为(rows, cols)
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int = 64) -> None:
+        """初始化空间网格。
+
+        Args:
+            width (int): 索引覆盖区域的宽度（像素）
+            height (int): 索引覆盖区域的高度（像素）
+            cell_size (int): 每个格子的边长（像素），默认为64
+        """
+        self.width: int = width
+        self.height: int = height
+        self.cell_size: int = cell_size
+        self.cols: int = max(1, -(-width // cell_size))
+        self.rows: int = max(1, -(-height // cell_size))
+        self.occupied: np.ndarray = np.zeros((self.rows, self.cols), dtype=bool)
+        self._empty: bool = True
+
+    def clear(self) -> None:
+        """清空网格中的所有对象。"""
+        if not self._empty:
+            self.occupied.fill(False)
+            self._empty = True
+
+    def insert_many(self, boxes: np.ndarray) -> None:
+        """向量化地插入一组对象，标记它们覆盖的所有格子。
+
+        Args:
+            boxes (numpy.ndarray): 形状为(N, 4)的数组，每行为(x, y, w, h)
+        """
+        if len(boxes) == 0:
+            return
+
+        cs = self.cell_size
+        x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+        c0 = np.clip(x // cs, 0, self.cols - 1)
+        c1 = np.clip((x + w - 1) // cs, 0, self.cols - 1)
+        r0 = np.clip(y // cs, 0, self.rows - 1)
+        r1 = np.clip((y + h - 1) // cs, 0, self.rows - 1)
+
+        # 逐个偏移标记每个矩形覆盖的格子，超出范围的偏移落回最后一行/列
+        occ = self.occupied
+        for dr in range(int((r1 - r0).max()) + 1):
+            rows = np.minimum(r0 + dr, r1)
+            for dc in range(int((c1 - c0).max()) + 1):
+                occ[rows, np.minimum(c0 + dc, c1)] = True
+
+        self._empty = False
+
+    def candidate_mask(self, xs: np.ndarray, ys: np.ndarray, w: int, h: int) -> np.ndarray:
+        """向量化地找出与任意对象共享格子的矩形。
+
+        所有被查询的矩形尺寸相同（例如子弹），且不超过一个格子，
+        因此每个矩形最多覆盖2x2个格子，只需检查四个角所在的格子。
+
+        Args:
+            xs (numpy.ndarray): 矩形左上角x坐标数组
+            ys (numpy.ndarray): 矩形左上角y坐标数组
+            w (int): 矩形宽度（不超过cell_size）
+            h (int): 矩形高度（不超过cell_size）
+
+        Returns:
+            numpy.ndarray: 布尔数组，True表示该矩形需要进入精确检测
+        """
+        if self._empty:
+            return np.zeros(len(xs), dtype=bool)
+
+        cs = self.cell_size
+        c0 = np.clip(xs // cs, 0, self.cols - 1)
+        c1 = np.clip((xs + (w - 1)) // cs, 0, self.cols - 1)
+        r0 = np.clip(ys // cs, 0, self.rows - 1)
+        r1 = np.clip((ys + (h - 1)) // cs, 0, self.rows - 1)
+
+        occ = self.occupied
+        return occ[r0, c0] | occ[r0, c1] | occ[r1, c0] | occ[r1, c1]
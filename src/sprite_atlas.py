@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""精灵图集模块。
+
+本模块把玩家、敌机（含每种血量条状态）、道具和子弹的图形预先光栅化
+为缓存的 Surface，绘制时只需一次 blit，而不是每帧重新调用
+pygame.draw.rect/polygon/circle。
+
+精灵按实体的类型和尺寸作为键缓存。运行时配置中的尺寸发生变化时，
+新尺寸会得到新的精灵，旧精灵不会被误用；显示窗口创建后，所有精灵会被
+转换为显示格式以获得最快的 blit 速度。
+
+每个精灵附带一个相对于实体坐标 (x, y) 的偏移量，因为护盾光圈、血量条
+和武器会超出实体的碰撞矩形。
+
+典型用法示例:
+    atlas = get_atlas()
+    atlas.build()  # 启动时预先生成所有精灵
+
+    surface, (dx, dy) = atlas.enemy(enemy)
+    screen.blit(surface, (enemy.x + dx, enemy.y + dy))
+"""
+
+import pygame
+from typing import Dict, Hashable, Optional, Tuple
+from config import BLUE, WHITE, RED, DARK_RED, GREEN, YELLOW
+from game_config import DEFAULT_CONFIG
+
+# 精灵：(表面, 相对于实体坐标的偏移量)
+Sprite = Tuple[pygame.Surface, Tuple[int, int]]
+
+SHIELD_COLOR: Tuple[int, int, int] = (0, 150, 255)  # 玩家护盾光圈颜色
+ITEM_SIZE: int = 20  # 道具的宽度和高度（与 item.Item 一致）
+
+
+def _new_surface(width: int, height: int) -> pygame.Surface:
+    """创建一个完全透明的表面。"""
+    surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    return surface
+
+
+def _render_player(width: int, height: int, shield: bool) -> Sprite:
+    """光栅化玩家飞机（与原 Player.draw 的图形一致）。"""
+    left, top, right, bottom = 0, 0, width, height
+    cx, cy = width // 2, height // 2
+    radius = max(width, height) // 2 + 5
+    if shield:
+        left, top = min(left, cx - radius), min(top, cy - radius)
+        right, bottom = max(right, cx + radius + 1), max(bottom, cy + radius + 1)
+
+    surface = _new_surface(right - left, bottom - top)
+    ox, oy = -left, -top
+
+    # 蓝色主体
+    pygame.draw.rect(surface, BLUE, (ox, oy, width, height))
+    # 护盾光圈
+    if shield:
+        pygame.draw.circle(surface, SHIELD_COLOR, (ox + cx, oy + cy), radius, 2)
+    # 白色驾驶舱
+    pygame.draw.rect(surface, WHITE, (ox + 20, oy + 10, 20, 30))
+    return surface, (left, top)
+
+
+def _render_enemy(width: int, height: int, color: Tuple[int, int, int],
+                  hp: int, max_hp: int) -> Sprite:
+    """光栅化敌机（与原 Enemy.draw 的图形一致，受伤时包含血量条）。"""
+    show_bar = hp < max_hp
+    top = -8 if show_bar else 0
+    bottom = max(height, height - 5 + 8)
+
+    surface = _new_surface(width, bottom - top)
+    oy = -top
+
+    # 敌机主体
+    pygame.draw.rect(surface, color, (0, oy, width, height))
+
+    # 血量条（红色背景 + 绿色当前血量）
+    if show_bar:
+        pygame.draw.rect(surface, RED, (0, oy - 8, width, 4))
+        current_width = int(width * (hp / max_hp))
+        pygame.draw.rect(surface, GREEN, (0, oy - 8, current_width, 4))
+
+    # 武器（底部中央的黄色小矩形）
+    pygame.draw.rect(surface, YELLOW, (width // 2 - 2, oy + height - 5, 4, 8))
+    return surface, (0, top)
+
+
+def _render_item(kind: str, width: int, height: int) -> Sprite:
+    """光栅化道具（与原各道具类的 draw 图形一致）。"""
+    surface = _new_surface(width, height)
+    cx, cy = width // 2, height // 2
+
+    if kind == "health":
+        # 绿色十字
+        size, thickness = 16, 4
+        color = (0, 255, 0)
+        pygame.draw.rect(surface, color, (cx - thickness // 2, cy - size // 2, thickness, size))
+        pygame.draw.rect(surface, color, (cx - size // 2, cy - thickness // 2, size, thickness))
+    elif kind == "power_up":
+        # 黄色菱形 + 白色内部菱形
+        pygame.draw.polygon(surface, (255, 255, 0),
+                            [(cx, cy - 8), (cx + 8, cy), (cx, cy + 8), (cx - 8, cy)])
+        pygame.draw.polygon(surface, (255, 255, 255),
+                            [(cx, cy - 4), (cx + 4, cy), (cx, cy + 4), (cx - 4, cy)])
+    elif kind == "shield":
+        # 蓝色外圆 + 浅蓝内圆
+        pygame.draw.circle(surface, (0, 100, 255), (cx, cy), 8)
+        pygame.draw.circle(surface, (150, 200, 255), (cx, cy), 5)
+    else:
+        raise ValueError(f"unknown item kind: {kind}")
+    return surface, (0, 0)
+
+
+def _render_bullet(width: int, height: int, color: Tuple[int, int, int]) -> Sprite:
+    """光栅化子弹（纯色矩形）。"""
+    surface = pygame.Surface((width, height))
+    surface.fill(color)
+    return surface, (0, 0)
+
+
+class SpriteAtlas:
+    """精灵图集类。
+
+    按（实体种类, 尺寸, 状态）缓存预先光栅化的精灵，首次请求时生成。
+
+    Attributes:
+        converted (bool): 精灵是否已转换为显示格式
+    """
+
+    def __init__(self) -> None:
+        """初始化空的精灵图集。"""
+        self._sprites: Dict[Hashable, Sprite] = {}
+        self.converted: bool = False
+
+    def _get(self, key: Hashable, factory, *args) -> Sprite:
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = factory(*args)
+            if self.converted:
+                sprite = self._convert(sprite)
+            self._sprites[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _convert(sprite: Sprite) -> Sprite:
+        surface, offset = sprite
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha(), offset
+        return surface.convert(), offset
+
+    def player(self, width: int, height: int, shield: bool) -> Sprite:
+        """获取玩家飞机精灵。
+
+        Args:
+            width (int): 飞机宽度
+            height (int): 飞机高度
+            shield (bool): 是否显示护盾光圈
+
+        Returns:
+            Sprite: (表面, 偏移量)
+        """
+        return self._get(("player", width, height, shield), _render_player, width, height, shield)
+
+    def enemy(self, enemy) -> Sprite:
+        """获取敌机精灵（包含当前血量对应的血量条）。
+
+        Args:
+            enemy (Enemy): 敌机对象
+
+        Returns:
+            Sprite: (表面, 偏移量)
+        """
+        key = ("enemy", enemy.width, enemy.height, enemy.color, enemy.hp, enemy.max_hp)
+        return self._get(key, _render_enemy, enemy.width, enemy.height,
+                         enemy.color, enemy.hp, enemy.max_hp)
+
+    def item(self, kind: str, width: int = ITEM_SIZE, height: int = ITEM_SIZE) -> Sprite:
+        """获取道具精灵。
+
+        Args:
+            kind (str): 道具种类（"health"、"power_up" 或 "shield"）
+            width (int): 道具宽度
+            height (int): 道具高度
+
+        Returns:
+            Sprite: (表面, 偏移量)
+        """
+        return self._get(("item", kind, width, height), _render_item, kind, width, height)
+
+    def bullet(self, width: int, height: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """获取子弹表面（也用于多颗相接子弹合并成的子弹流长条）。
+
+        Args:
+            width (int): 子弹宽度
+            height (int): 子弹高度
+            color (Tuple[int, int, int]): 子弹颜色
+
+        Returns:
+            pygame.Surface: 子弹表面
+        """
+        return self._get(("bullet", width, height, color), _render_bullet, width, height, color)[0]
+
+    def build(self, config=None) -> None:
+        """按配置中的尺寸预先生成所有精灵（包括每种血量条状态）。
+
+        Args:
+            config (Optional[GameConfig]): 运行时配置，默认使用 config.py 中的值；
+                切换配置后再次调用即可生成新尺寸的精灵
+        """
+        config = config if config is not None else DEFAULT_CONFIG
+        self.player(config.PLAYER_WIDTH, config.PLAYER_HEIGHT, False)
+        self.player(config.PLAYER_WIDTH, config.PLAYER_HEIGHT, True)
+
+        small = config.enemy_types["small"]
+        medium = config.enemy_types["medium"]
+        for width, height, color, max_hp in (
+            (small["width"], small["height"], RED, small["hp"]),
+            (medium["width"], medium["height"], DARK_RED, medium["hp"]),
+        ):
+            for hp in range(1, max_hp + 1):
+                key = ("enemy", width, height, color, hp, max_hp)
+                self._get(key, _render_enemy, width, height, color, hp, max_hp)
+
+        for kind in ("health", "power_up", "shield"):
+            self.item(kind)
+
+        self.bullet(config.BULLET_WIDTH, config.BULLET_HEIGHT, YELLOW)
+        self.bullet(config.BULLET_WIDTH, config.BULLET_HEIGHT, RED)
+
+    def convert(self) -> None:
+        """把所有精灵转换为当前显示格式（需要已创建显示窗口）。"""
+        self._sprites = {key: self._convert(sprite) for key, sprite in self._sprites.items()}
+        self.converted = True
+
+    def clear(self) -> None:
+        """清空所有缓存的精灵，之后按需重新生成。"""
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+
+_atlas: Optional[SpriteAtlas] = None
+
+
+def get_atlas() -> SpriteAtlas:
+    """获取全局共享的精灵图集。
+
+    显示窗口创建之后第一次调用时，会把已有精灵转换为显示格式。
+
+    Returns:
+        SpriteAtlas: 全局精灵图集
+    """
+    global _atlas
+    atlas = _atlas
+    if atlas is None:
+        atlas = _atlas = SpriteAtlas()
+    if not atlas.converted and pygame.display.get_init() and pygame.display.get_surface() is not None:
+        atlas.convert()
+    return atlas
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""文字表面缓存模块。
+
+本模块缓存 font.render() 生成的文字表面。HUD 中的大部分文字（提示语、
+无敌模式的生命显示等）是静态的，分数和计时器也只在数值变化时才需要
+重新渲染，字体光栅化是每帧开销最大的调用之一。
+
+缓存以（文字内容, 颜色）为键，超过容量时淘汰最久未使用的表面（LRU）。
+
+典型用法示例:
+    cache = TextCache(font, maxsize=64)
+    surface = cache.render(f"Score: {score}", WHITE)  # 分数不变时直接复用
+    screen.blit(surface, (10, 10))
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+
+
+class TextCache:
+    """带LRU淘汰的文字表面缓存类。
+
+    Attributes:
+        font (pygame.font.Font): 用于渲染文字的字体
+        maxsize (int): 最多缓存的表面数量
+        hits (int): 缓存命中次数
+        misses (int): 缓存未命中（实际渲染）次数
+    """
+
+    def __init__(self, font: pygame.font.Font, maxsize: int = 64) -> None:
+        """初始化文字缓存。
+
+        Args:
+            font (pygame.font.Font): 用于渲染文字的字体
+            maxsize (int): 最多缓存的表面数量，默认为64
+        """
+        self.font: pygame.font.Font = font
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._surfaces: "OrderedDict[Tuple[str, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
+
+    def render(self, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """获取文字表面，缓存中没有时才调用 font.render()。
+
+        返回的表面会被后续调用复用，调用者不应修改它。
+
+        Args:
+            text (str): 要渲染的文字
+            color (Tuple[int, ...]): 文字颜色
+
+        Returns:
+            pygame.Surface: 渲染好的文字表面（开启抗锯齿）
+        """
+        key = (text, color)
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = self.font.render(text, True, color)
+        surfaces[key] = surface
+        self.misses += 1
+        if len(surfaces) > self.maxsize:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """清空缓存。"""
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
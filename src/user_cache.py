@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""用户缓存目录模块。
+
+本模块确定保存可再生数据（音效缓存、字体解析结果等）的按用户缓存目录。
+缓存文件随时可以删除，游戏会在下次启动时重新生成。
+
+目录按平台选择：
+    Windows: %LOCALAPPDATA%\\plane_wars\\Cache
+    macOS:   ~/Library/Caches/plane_wars
+    其他:    $XDG_CACHE_HOME/plane_wars（默认为 ~/.cache/plane_wars）
+
+设置环境变量 PLANE_WARS_CACHE_DIR 可以指定其他目录。
+
+典型用法示例:
+    path = cache_file("sounds.bin")
+    if path is not None:
+        with open(path, "wb") as f:
+            f.write(data)
+"""
+
+import os
+import sys
+from typing import Optional
+
+APP_NAME: str = "plane_wars"
+CACHE_DIR_ENV: str = "PLANE_WARS_CACHE_DIR"
+
+
+def user_cache_dir() -> str:
+    """获取本游戏的按用户缓存目录（不保证目录已存在）。
+
+    Returns:
+        str: 缓存目录路径
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, APP_NAME, "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(os.path.expanduser("~/Library/Caches"), APP_NAME)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, APP_NAME)
+
+
+def cache_file(name: str) -> Optional[str]:
+    """获取缓存目录中的文件路径，必要时创建缓存目录。
+
+    Args:
+        name (str): 缓存文件名
+
+    Returns:
+        Optional[str]: 文件路径；缓存目录无法创建时返回None
+    """
+    directory = user_cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(directory, name)
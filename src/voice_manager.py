@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""声部管理模块。
+
+自动射击时每帧都会请求射击音效，每颗命中的子弹都会请求一次被击中音效。
+如果每个请求都交给 Sound.play()，混音器会不停地寻找空闲通道、打断正在
+播放的声音，既浪费 CPU 又会产生爆音。本模块在播放前做三层筛选：
+
+1. 最小重播间隔：同一音效在间隔内的重复请求直接丢弃（只比较一次时间）。
+2. 通道分类保留：每类音效有自己保留的通道，另有一组共享通道，
+   射击声再多也不会占满爆炸声和玩家受击声的通道。
+3. 按优先级抢占：没有空闲通道时，抢占可用通道中优先级最低、最早开始的
+   声部；新声音的优先级比它们都低时丢弃新声音。
+
+所有通道都通过 pygame.mixer.set_reserved() 保留下来，混音器不会再自动
+分配通道，同时播放的声部数不会超过通道总数。
+
+典型用法示例:
+    voices = VoiceManager(max_voices=16, reserved={"player": 2, "hit": 3}, clock=sim_clock)
+    voices.play("shot", sound, category="player", priority=1, min_interval=0.0)
+"""
+
+import pygame
+from typing import Dict, List, Mapping, Optional
+from game_clock import WallClock
+
+
+class VoiceManager:
+    """声部管理器类。
+
+    Attributes:
+        clock: 提供当前时间的时钟对象（计算重播间隔使用）
+        max_voices (int): 混音器通道总数（同时播放的最大声部数）
+        played (int): 已播放的声音数
+        dropped (int): 被丢弃的播放请求数（间隔过短或没有可抢占的通道）
+        stolen (int): 抢占正在播放声部的次数
+    """
+
+    def __init__(self, max_voices: int, reserved: Mapping[str, int], clock=None) -> None:
+        """初始化声部管理器并分配混音器通道（需要已初始化混音器）。
+
+        Args:
+            max_voices (int): 同时播放的最大声部数，不能小于保留通道总数
+            reserved (Mapping[str, int]): 每类音效保留的通道数
+            clock: 时钟对象，需提供 now() 方法；默认使用真实时间
+
+        Raises:
+            ValueError: 保留通道总数超过最大声部数
+        """
+        total_reserved = sum(reserved.values())
+        if total_reserved > max_voices:
+            raise ValueError(f"reserved channels ({total_reserved}) exceed max voices ({max_voices})")
+
+        self.clock = clock if clock is not None else WallClock()
+        self.max_voices: int = max_voices
+        self.played: int = 0
+        self.dropped: int = 0
+        self.stolen: int = 0
+
+        pygame.mixer.set_num_channels(max_voices)
+        pygame.mixer.set_reserved(max_voices)
+        self._channels: List[pygame.mixer.Channel] = [pygame.mixer.Channel(i) for i in range(max_voices)]
+
+        # 每个类别可用的通道：先是自己保留的通道，再是共享通道
+        shared = list(range(total_reserved, max_voices))
+        self._shared: List[int] = shared
+        self._pools: Dict[str, List[int]] = {}
+        start = 0
+        for category, count in reserved.items():
+            self._pools[category] = list(range(start, start + count)) + shared
+            start += count
+
+        # 每个通道上当前声部的优先级和开始时间
+        self._priorities: List[int] = [0] * max_voices
+        self._started: List[float] = [0.0] * max_voices
+        # 每个音效最近一次播放的时间
+        self._last_played: Dict[str, float] = {}
+
+    def _find_channel(self, pool: List[int], priority: int) -> Optional[int]:
+        """在通道池中找空闲通道，没有时找可以抢占的通道。"""
+        channels = self._channels
+        victim = None
+        for index in pool:
+            if not channels[index].get_busy():
+                return index
+            if self._priorities[index] <= priority and (
+                    victim is None
+                    or (self._priorities[index], self._started[index])
+                    < (self._priorities[victim], self._started[victim])):
+                victim = index
+        if victim is not None:
+            self.stolen += 1
+        return victim
+
+    def play(self, name: str, sound: pygame.mixer.Sound, category: str,
+             priority: int = 0, min_interval: float = 0.0) -> bool:
+        """按声部规则播放一个声音。
+
+        Args:
+            name (str): 音效名称（重播间隔按名称计算）
+            sound (pygame.mixer.Sound): 要播放的声音
+            category (str): 音效类别（决定可用的通道）；未保留通道的类别只使用共享通道
+            priority (int): 优先级，数值越大越重要
+            min_interval (float): 同一音效两次播放之间的最小间隔（秒）
+
+        Returns:
+            bool: 是否播放了声音
+        """
+        now = self.clock.now()
+        last = self._last_played.get(name)
+        # 时钟被重置（新的一局）时 now 会小于 last，此时不限制
+        if last is not None and 0.0 <= now - last < min_interval:
+            self.dropped += 1
+            return False
+
+        index = self._find_channel(self._pools.get(category, self._shared), priority)
+        if index is None:
+            self.dropped += 1
+            return False
+
+        self._channels[index].play(sound)
+        self._priorities[index] = priority
+        self._started[index] = now
+        self._last_played[name] = now
+        self.played += 1
+        return True
+
+    def active_voices(self) -> int:
+        """统计当前正在播放的声部数。
+
+        Returns:
+            int: 正在播放的通道数
+        """
+        return sum(1 for channel in self._channels if channel.get_busy())
+
+    def stop(self) -> None:
+        """停止所有声部。"""
+        for channel in self._channels:
+            channel.stop()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+游戏循环性能基准测试脚本
+以无窗口模式驱动 Game，在固定场景下测量模拟和渲染性能，
+结果写入JSON文件，可与其他提交的结果对比以发现性能回退
+
+用法:
+    python tests/benchmark_game.py                          # 运行全部场景
+    python tests/benchmark_game.py -s idle -s bullets_1000  # 只运行部分场景
+    python tests/benchmark_game.py -o new.json --compare old.json
+    python tests/benchmark_game.py --dirty-rects            # 使用脏矩形渲染测量
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, BULLET_WIDTH, BULLET_HEIGHT, PLAYER_BULLET_SPEED
+from game import Game
+from item import HealthItem, PowerUpItem, ShieldItem
+
+RESULT_VERSION = 1
+DEFAULT_SEED = 20250713
+
+
+def _keep_player_alive(game):
+    """让玩家在基准测试中不会死亡，保证每个场景运行固定帧数"""
+    game.player.health = 10 ** 9
+    game.player.lives = 10 ** 12
+
+
+def _fill_player_bullets(target):
+    """每帧补充玩家子弹，使存活子弹数保持在 target 附近"""
+    # 子弹从屏幕底部飞到顶部需要的帧数，决定每帧需要补充的数量
+    lifetime = (SCREEN_HEIGHT + BULLET_HEIGHT) // PLAYER_BULLET_SPEED
+    per_frame = max(1, -(-target // lifetime))
+
+    def hook(game, frame):
+        pool = game.player_bullets
+        if len(pool) >= target:
+            return
+        rng = game.rng.spawn
+        for _ in range(min(per_frame, target - len(pool))):
+            pool.spawn(rng.randrange(SCREEN_WIDTH), SCREEN_HEIGHT - 1)
+    return hook
+
+
+def _fire_stream(shots_per_second):
+    """模拟不受帧率限制的自动射击：每帧从炮口连续补充多颗子弹，形成子弹流"""
+    per_frame = max(1, shots_per_second // 60)
+
+    def hook(game, frame):
+        player = game.player
+        x = player.x + player.width // 2 - BULLET_WIDTH // 2
+        for k in range(per_frame):
+            game.player_bullets.spawn(x, player.y - k * PLAYER_BULLET_SPEED // per_frame)
+    return hook
+
+
+def _item_storm(target):
+    """每帧补充道具，使屏幕上的道具数保持在 target 附近"""
+    kinds = (HealthItem, PowerUpItem, ShieldItem)
+
+    def hook(game, frame):
+        items = game.item_manager.items
+        rng = game.rng.item
+        for _ in range(min(8, target - len(items))):
+            kind = kinds[rng.randrange(len(kinds))]
+            items.append(kind(rng.randrange(SCREEN_WIDTH - 20), rng.randrange(-20, SCREEN_HEIGHT // 2)))
+    return hook
+
+
+def _setup_spawn_rate(rate):
+    def setup(game):
+        game.enemy_spawn_rate = rate
+    return setup
+
+
+def _setup_double_shot(game):
+    game.player.activate_double_shot(10.0 ** 9)
+
+
+# 场景定义: 名称 -> (说明, 初始化函数, 每帧钩子)
+SCENARIOS = {
+    "idle": ("不生成敌机，只有玩家自动射击", _setup_spawn_rate(0.0), None),
+    "default": ("默认配置下的正常对局", None, None),
+    "bullets_100": ("保持约100颗存活玩家子弹", _setup_spawn_rate(0.0), _fill_player_bullets(100)),
+    "bullets_1000": ("保持约1000颗存活玩家子弹", _setup_spawn_rate(0.0), _fill_player_bullets(1000)),
+    "bullets_10000": ("保持约10000颗存活玩家子弹", _setup_spawn_rate(0.0), _fill_player_bullets(10000)),
+    "fire_stream": ("每秒1000发的连续子弹流（同一列）", _setup_spawn_rate(0.0), _fire_stream(1000)),
+    "dense_waves": ("密集敌机波次（每帧50%概率生成敌机）", _setup_spawn_rate(0.5), None),
+    "double_shot": ("双发子弹道具持续生效，密集敌机", lambda g: (_setup_double_shot(g), _setup_spawn_rate(0.2)(g)), None),
+    "item_storm": ("屏幕上保持约200个道具", _setup_spawn_rate(0.05), _item_storm(200)),
+}
+
+
+def _make_game(name, seed, dirty_rects=False):
+    """创建并初始化一个场景的游戏实例"""
+    _, setup, hook = SCENARIOS[name]
+    game = Game(headless=True, seed=seed)
+    game._init_fonts()  # 渲染测量包含HUD文字
+    game.set_dirty_rect_rendering(dirty_rects)
+    _keep_player_alive(game)
+    if setup is not None:
+        setup(game)
+    return game, hook
+
+
+def run_scenario(name, frames, warmup, seed, dirty_rects=False):
+    """运行一个场景并返回测量结果
+
+    模拟和渲染分开计时：每帧先调用 update_game() 再调用 draw()。
+    峰值内存在单独的一轮中用 tracemalloc 测量，避免其开销影响计时。
+    """
+    game, hook = _make_game(name, seed, dirty_rects)
+    for frame in range(warmup):
+        if hook:
+            hook(game, frame)
+        game.update_game()
+
+    update_time = 0.0
+    draw_time = 0.0
+    entities = {key: 0 for key in game.entity_counts()}
+    perf = time.perf_counter
+    for frame in range(frames):
+        if hook:
+            hook(game, frame)
+        t0 = perf()
+        game.update_game()
+        t1 = perf()
+        game.draw()
+        t2 = perf()
+        update_time += t1 - t0
+        draw_time += t2 - t1
+        for key, value in game.entity_counts().items():
+            entities[key] = max(entities[key], value)
+
+    # 峰值内存：重新运行一轮较短的模拟
+    memory_frames = max(1, frames // 4)
+    tracemalloc.start()
+    game, hook = _make_game(name, seed, dirty_rects)
+    for frame in range(warmup + memory_frames):
+        if hook:
+            hook(game, frame)
+        game.update_game()
+        if frame >= warmup:
+            game.draw()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "description": SCENARIOS[name][0],
+        "frames": frames,
+        "sim_ticks_per_sec": frames / update_time if update_time > 0 else float("inf"),
+        "render_fps": frames / draw_time if draw_time > 0 else float("inf"),
+        "sim_ms_per_tick": update_time * 1000.0 / frames,
+        "render_ms_per_frame": draw_time * 1000.0 / frames,
+        "peak_memory_kb": peak / 1024.0,
+        "max_entities": entities,
+        "final_score": game.score,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """对比两次结果，返回是否存在超过阈值的性能回退"""
+    regressed = False
+    print(f"\n{'scenario':<16}{'metric':<20}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, current in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            continue
+        for metric in ("sim_ticks_per_sec", "render_fps"):
+            before, after = old[metric], current[metric]
+            change = (after - before) / before if before else 0.0
+            flag = ""
+            if change < -threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f"{name:<16}{metric:<20}{before:>12.0f}{after:>12.0f}{change:>+8.1%}{flag}")
+        before, after = old["peak_memory_kb"], current["peak_memory_kb"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{name:<16}{'peak_memory_kb':<20}{before:>12.0f}{after:>12.0f}{change:>+8.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="飞机大战游戏循环性能基准测试")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="要运行的场景，可重复指定，默认运行全部")
+    parser.add_argument("-n", "--frames", type=int, default=600, help="每个场景测量的帧数")
+    parser.add_argument("--warmup", type=int, default=120, help="测量前预热的帧数")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="随机种子")
+    parser.add_argument("--dirty-rects", action="store_true", help="使用脏矩形渲染")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="结果输出文件")
+    parser.add_argument("--compare", metavar="BASELINE", help="与之前的结果文件对比")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="判定为性能回退的相对变化阈值，默认为0.10")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    names = args.scenario or list(SCENARIOS)
+    results = {
+        "version": RESULT_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "dirty_rects": args.dirty_rects,
+        },
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<16}{'ticks/s':>10}{'render fps':>12}{'peak KB':>10}  entities")
+    for name in names:
+        r = run_scenario(name, args.frames, args.warmup, args.seed, args.dirty_rects)
+        results["scenarios"][name] = r
+        print(f"{name:<16}{r['sim_ticks_per_sec']:>10.0f}{r['render_fps']:>12.0f}"
+              f"{r['peak_memory_kb']:>10.0f}  {r['max_entities']}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n结果已写入 {args.output}")
+
+    regressed = False
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressed = compare(results, json.load(f), args.threshold)
+
+    pygame.quit()
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
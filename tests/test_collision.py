@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+碰撞检测测试
+把 collision.py 的向量化命中解析与原来逐颗子弹遍历敌机列表的
+colliderect/break 循环对比，保证命中和计分规则不变
+（每颗子弹最多命中一个敌机，被摧毁的敌机不再被命中）
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+import pygame
+from collision import overlap_matrix, first_hits
+
+BULLET_W, BULLET_H = 4, 10
+
+
+def reference_hits(bullets, enemies, hp):
+    """原来的嵌套循环：每颗子弹命中列表中第一个相交的存活敌机"""
+    hp = list(hp)
+    alive = list(range(len(enemies)))
+    hits = []
+    for bullet in bullets:
+        hit = -1
+        for index in alive[:]:
+            if bullet.colliderect(enemies[index]):
+                hit = index
+                hp[index] -= 1
+                if hp[index] <= 0:
+                    alive.remove(index)
+                break  # 子弹已被移除，跳出内层循环
+        hits.append(hit)
+    return hits
+
+
+def random_scene(rng, n_bullets, n_enemies, area):
+    """在 area x area 的区域内随机放置子弹和敌机，区域越小重叠越多"""
+    bullets = [pygame.Rect(rng.randrange(area), rng.randrange(area), BULLET_W, BULLET_H)
+               for _ in range(n_bullets)]
+    enemies = [pygame.Rect(rng.randrange(area), rng.randrange(area),
+                           rng.randrange(10, 60), rng.randrange(10, 60))
+               for _ in range(n_enemies)]
+    hp = [rng.randrange(1, 4) for _ in range(n_enemies)]
+    return bullets, enemies, hp
+
+
+def vector_hits(bullets, enemies, hp):
+    boxes = np.array([(r.x, r.y, r.w, r.h) for r in enemies], dtype=np.int64).reshape(-1, 4)
+    overlap = overlap_matrix(
+        np.array([r.x for r in bullets]), np.array([r.y for r in bullets]), BULLET_W, BULLET_H,
+        boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    )
+    return first_hits(overlap, np.array(hp, dtype=np.int64)).tolist()
+
+
+def test_overlap_matrix_matches_colliderect():
+    """相交矩阵与 pygame.Rect.colliderect 的结果一致（包括只接触边缘的情况）"""
+    rng = random.Random(1)
+    bullets, enemies, _ = random_scene(rng, 200, 30, 120)
+    boxes = np.array([(r.x, r.y, r.w, r.h) for r in enemies])
+    overlap = overlap_matrix(
+        np.array([r.x for r in bullets]), np.array([r.y for r in bullets]), BULLET_W, BULLET_H,
+        boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    )
+    expected = [[b.colliderect(e) for e in enemies] for b in bullets]
+    assert overlap.tolist() == expected
+
+
+def test_first_hits_matches_nested_loop():
+    """随机场景（含稀疏和密集重叠）下命中结果与原来的循环一致"""
+    rng = random.Random(2)
+    for trial in range(300):
+        area = rng.choice((60, 150, 400))
+        bullets, enemies, hp = random_scene(rng, rng.randrange(1, 80), rng.randrange(1, 15), area)
+        assert vector_hits(bullets, enemies, hp) == reference_hits(bullets, enemies, hp), trial
+
+
+def test_first_hits_overkill():
+    """同一帧命中敌机的子弹多于其生命值时，多出的子弹顺延到下一个敌机或穿过"""
+    enemies = [pygame.Rect(0, 0, 40, 40), pygame.Rect(10, 0, 40, 40)]
+    bullets = [pygame.Rect(20, 10, BULLET_W, BULLET_H) for _ in range(5)]
+    hp = [2, 1]
+
+    hits = vector_hits(bullets, enemies, hp)
+    assert hits == reference_hits(bullets, enemies, hp)
+    assert hits == [0, 0, 1, -1, -1]
+
+
+def test_first_hits_no_overlap():
+    """没有任何相交时所有子弹都未命中"""
+    overlap = np.zeros((3, 2), dtype=bool)
+    assert first_hits(overlap, np.array([1, 1])).tolist() == [-1, -1, -1]